@@ -0,0 +1,62 @@
+"""Measures memory held by a parsed program and time of interpreting it.
+
+Usage: python -m benchmarks.ast_memory [--scale N]
+
+Example programs are repeated N times to get a large program."""
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import LexerSkippingComments
+from src.parser import Parser
+from src.source import StringSource
+
+EXAMPLES_DIR = Path(__file__).parents[1] / "examples"
+
+LOOP = """
+let i: int = 0;
+let total: int = 0;
+while (i < 20000) {
+    total = total + i * 2 - (i % 7);
+    i = i + 1;
+}
+print(total);
+"""
+
+
+def parse(text: str, flatten: bool):
+    return Parser(LexerSkippingComments(StringSource(text)), flatten=flatten).parse_program()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--scale", type=int, default=300, help="how many times examples are repeated")
+    args = arg_parser.parse_args()
+
+    text = "\n".join([(EXAMPLES_DIR / name).read_text() for name in ("main.ty", "lambdas.ty")] * args.scale)
+
+    for flatten in (False, True):
+        tracemalloc.start()
+        program = parse(text, flatten)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"flatten={flatten!s:<5} program memory: {size / 2 ** 20:8.2f} MiB")
+        del program
+
+    best = float("inf")
+    for _ in range(3):
+        interpreter = Interpreter(parser=Parser(LexerSkippingComments(StringSource(LOOP)), flatten=True))
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            interpreter.interpret()
+        best = min(best, time.perf_counter() - start)
+
+    print(f"interpreting loop: {best:8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Compares time of running the same programs with every execution engine, relative to the tree walking Interpreter.
+
+Usage: python -m benchmarks.engines [--program NAME] [--engine NAME] [--repeat N]
+
+Programs cover typed code verified by TypeChecker (loops over local variables, recursive calls, arithmetic)
+and dynamic code which is not verified (nullable variables and generic parameters).
+Time of recursive programs depends on how Python frames of an engine fit in memory of the interpreter stack,
+so differences of a few tens of percent between engines running them are not meaningful."""
+import argparse
+import contextlib
+import io
+import time
+
+from src.interpreter.closures import ClosureInterpreter
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.quickening import QuickeningInterpreter
+from src.interpreter.tiered import TieredInterpreter
+from src.interpreter.transpiler import TranspilingInterpreter
+from src.interpreter.vm import VirtualMachine
+from src.lexer.lexer import LexerSkippingComments
+from src.parser import Parser
+from src.source import StringSource
+
+PROGRAMS = {
+    "locals": """
+        def add(x: int, y: int): int => {
+            let sum: int = x + y;
+            return sum + 0;
+        }
+
+        let i: int = 0;
+        let total: int = 0;
+        while (i < 20000) {
+            let doubled: int = i * 2;
+            if (doubled > 10) {
+                let shifted: int = doubled - 10;
+                total = add(total, shifted);
+            }
+            i = i + 1;
+        }
+        print(total);
+    """,
+    "calls": """
+        def fib(n: int): int => {
+            if (n < 2) {
+                return n;
+            }
+            return fib(n - 1) + fib(n - 2);
+        }
+        print(fib(18));
+    """,
+    "arithmetic": """
+        def run(): float => {
+            let count: int = 0;
+            let total: float = 0.0;
+            while (count < 30000) {
+                if (count % 3 == 0) { total = total + count / 2; }
+                elif (count % 5 == 0) { total = total - 1.5; }
+                else { total = total * 1.0 + 0.5; }
+                count = count + 1;
+            }
+            return total;
+        }
+        print(run());
+    """,
+    "dynamic": """
+        // parameters of a function declared without any are generic, named a, b, ...
+        def step(): void => {
+            total = total + a * b - a;
+        }
+
+        let i?: int = 0;
+        let total?: int = 0;
+        while (i < 20000) {
+            step(i, 3);
+            i = i + 1;
+        }
+        print(total);
+    """,
+    "nullable": """
+        let i?: int = 0;
+        let total?: float = 0.0;
+        let text?: str = "";
+        while (i < 20000) {
+            total = total + i * 0.5 - i / 4;
+            if (i % 1000 == 0) {
+                text = text + "a";
+            }
+            i = i + 1;
+        }
+        print(total, text);
+    """,
+}
+
+ENGINES = {
+    "tree": Interpreter,
+    "closure": ClosureInterpreter,
+    "vm": VirtualMachine,
+    "python": TranspilingInterpreter,
+    "quickening": QuickeningInterpreter,
+    "tiered": TieredInterpreter,
+}
+
+
+def measure(engines: list[str], text: str, repeat: int) -> dict[str, float]:
+    """Returns the best time of running a program with every engine, parsing is not measured.
+    Engines take turns in every round, so that changing load of the machine affects all of them alike."""
+
+    program = Parser(LexerSkippingComments(StringSource(text)), flatten=True).parse_program()
+    interpreters = {engine: ENGINES[engine](parser=None) for engine in engines}
+    best = dict.fromkeys(engines, float("inf"))
+
+    for _ in range(repeat):
+        for engine, interpreter in interpreters.items():
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                interpreter.run(program)
+                best[engine] = min(best[engine], time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--program", choices=PROGRAMS.keys(), action="append", help="which programs are run")
+    arg_parser.add_argument("--engine", choices=ENGINES.keys(), action="append", help="which engines are measured")
+    arg_parser.add_argument("--repeat", type=int, default=7, help="how many times every program is run")
+    args = arg_parser.parse_args()
+
+    # tree walking interpreter is always measured as the baseline
+    engines = ["tree", *(engine for engine in args.engine or ENGINES if engine != "tree")]
+
+    for name in args.program or PROGRAMS:
+        times = measure(engines, PROGRAMS[name], args.repeat)
+
+        for engine in engines:
+            print(f"{name:<12} {engine:<12} {times[engine] * 1000:>9.1f} ms {times['tree'] / times[engine]:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
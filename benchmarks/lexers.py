@@ -0,0 +1,67 @@
+"""Measures how many tokens per second every lexer engine stores into a token stream,
+which is what the parser reads tokens from.
+
+Usage: python -m benchmarks.lexers [--scale N]
+
+Every example program is repeated N times to get a large input."""
+import argparse
+import time
+from pathlib import Path
+
+from src.errors.lexer import LexerError
+from src.lexer.dispatch_lexer import DispatchLexer
+from src.lexer.lexer import Lexer
+from src.lexer.regex_lexer import RegexLexer
+from src.lexer.token_stream import TokenStream, tokenize
+from src.lexer.token_type import TokenType
+from src.source import StringSource
+
+EXAMPLES_DIR = Path(__file__).parents[1] / "examples"
+
+LEXERS = {
+    "default": Lexer,
+    "dispatch": DispatchLexer,
+    "regex": RegexLexer,
+}
+
+
+def count_tokens(lexer: Lexer) -> int:
+    count = 0
+    while lexer.build_next_token().type != TokenType.ETX:
+        count += 1
+
+    return count
+
+
+def build_stream(lexer: Lexer) -> TokenStream:
+    # regex lexer tokenizes the whole source into a stream up front
+    return lexer.stream if isinstance(lexer, RegexLexer) else tokenize(lexer)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--scale", type=int, default=1000, help="how many times every example is repeated")
+    args = arg_parser.parse_args()
+
+    for path in sorted(EXAMPLES_DIR.glob("*.ty")):
+        text = path.read_text()
+
+        # skip programs which are empty or cannot be tokenized
+        try:
+            if count_tokens(Lexer(StringSource(text))) == 0:
+                continue
+        except LexerError:
+            continue
+
+        text = "\n".join([text] * args.scale)
+
+        for name, lexer_class in LEXERS.items():
+            start = time.perf_counter()
+            # ETX is not counted
+            tokens = len(build_stream(lexer_class(StringSource(text)))) - 1
+            elapsed = time.perf_counter() - start
+            print(f"{path.name:<16} {name:<10} {tokens:>10} tokens {tokens / elapsed:>12,.0f} tokens/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Compares memory used by a list of Token objects with a compact token stream
+and measures parsing from a lexer and from a pre-lexed token stream.
+
+Usage: python -m benchmarks.token_stream [--scale N]"""
+import argparse
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.lexer.lexer import LexerSkippingComments
+from src.lexer.token_stream import tokenize
+from src.lexer.token_type import TokenType
+from src.parser import Parser
+from src.source import StringSource
+
+EXAMPLES_DIR = Path(__file__).parents[1] / "examples"
+
+
+def build_token_list(text: str) -> list:
+    lexer = LexerSkippingComments(StringSource(text))
+    tokens = [lexer.build_next_token()]
+    while tokens[-1].type != TokenType.ETX:
+        tokens.append(lexer.build_next_token())
+
+    return tokens
+
+
+def measure_peak_memory(function, *args) -> tuple[object, int]:
+    tracemalloc.start()
+    result = function(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--scale", type=int, default=500, help="how many times example program is repeated")
+    args = arg_parser.parse_args()
+
+    text = "\n".join([(EXAMPLES_DIR / "main.ty").read_text()] * args.scale)
+
+    tokens, tokens_peak = measure_peak_memory(build_token_list, text)
+    stream, stream_peak = measure_peak_memory(lambda: tokenize(LexerSkippingComments(StringSource(text))))
+    print(f"{len(tokens)} tokens")
+    print(f"list of tokens peak memory: {tokens_peak / 2 ** 20:8.2f} MiB")
+    print(f"token stream peak memory:   {stream_peak / 2 ** 20:8.2f} MiB")
+
+    start = time.perf_counter()
+    Parser(lexer=LexerSkippingComments(StringSource(text))).parse_program()
+    print(f"lex and parse:              {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    Parser(lexer=stream.cursor()).parse_program()
+    print(f"parse from token stream:    {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
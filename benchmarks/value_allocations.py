@@ -0,0 +1,80 @@
+"""Counts runtime values allocated while interpreting a loop.
+
+Usage: python -m benchmarks.value_allocations [--iterations N]"""
+import argparse
+import contextlib
+import io
+import time
+from functools import wraps
+
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.values import RuntimeValue
+from src.lexer.lexer import LexerSkippingComments
+from src.parser import Parser
+from src.parser.objects.objects import Literal
+from src.source import StringSource
+
+LOOP = """
+let i: int = 0;
+let even: int = 0;
+while (i < {iterations}) {{
+    if (i % 2 == 0 and not (i < 0)) {{
+        even = even + 1;
+    }}
+    i = i + 1;
+}}
+print(even);
+"""
+
+
+class AllocationCounter:
+    """Counts instances of value classes created while it is active."""
+
+    def __init__(self):
+        self.count = 0
+
+    @contextlib.contextmanager
+    def counting(self):
+        original_init = Literal.__init__
+        original_new = RuntimeValue.__new__
+
+        @wraps(original_init)
+        def init(literal, *args, **kwargs):
+            self.count += 1
+            original_init(literal, *args, **kwargs)
+
+        @wraps(original_new)
+        def new(cls, *args, **kwargs):
+            self.count += 1
+            return original_new(cls, *args, **kwargs)
+
+        Literal.__init__ = init
+        RuntimeValue.__new__ = new
+        try:
+            yield self
+        finally:
+            Literal.__init__ = original_init
+            RuntimeValue.__new__ = original_new
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--iterations", type=int, default=100_000, help="how many times loop is run")
+    args = arg_parser.parse_args()
+
+    text = LOOP.format(iterations=args.iterations)
+    program = Parser(LexerSkippingComments(StringSource(text)), flatten=True).parse_program()
+    parser = type("ParsedProgram", (), {"parse_program": lambda self: program})()
+
+    counter = AllocationCounter()
+    with counter.counting(), contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        Interpreter(parser=parser).interpret()
+        elapsed = time.perf_counter() - start
+
+    print(f"values allocated: {counter.count} ({counter.count / args.iterations:.2f} per iteration)")
+    print(f"time: {elapsed:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
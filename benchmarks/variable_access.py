@@ -0,0 +1,71 @@
+"""Measures time of interpreting code which mostly reads and writes local variables.
+
+Usage: python -m benchmarks.variable_access [--iterations N] [--repeat N]
+       [--engine tree|closure|vm|python|quickening|tiered]"""
+import argparse
+import contextlib
+import io
+import time
+
+from src.interpreter.closures import ClosureInterpreter
+from src.interpreter.quickening import QuickeningInterpreter
+from src.interpreter.tiered import TieredInterpreter
+from src.interpreter.transpiler import TranspilingInterpreter
+from src.interpreter.vm import VirtualMachine
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import LexerSkippingComments
+from src.parser import Parser
+from src.source import StringSource
+
+LOOP = """
+def add(x: int, y: int): int => {{
+    let sum: int = x + y;
+    return sum + 0;
+}}
+
+let i: int = 0;
+let total: int = 0;
+while (i < {iterations}) {{
+    let doubled: int = i * 2;
+    if (doubled > 10) {{
+        let shifted: int = doubled - 10;
+        total = add(total, shifted);
+    }}
+    i = i + 1;
+}}
+print(total);
+"""
+
+ENGINES = {
+    "tree": Interpreter,
+    "closure": ClosureInterpreter,
+    "vm": VirtualMachine,
+    "python": TranspilingInterpreter,
+    "quickening": QuickeningInterpreter,
+    "tiered": TieredInterpreter,
+}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--iterations", type=int, default=20_000, help="how many times loop is run")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="how many times program is run")
+    arg_parser.add_argument("--engine", choices=ENGINES.keys(), default="tree", help="which interpreter is measured")
+    args = arg_parser.parse_args()
+
+    text = LOOP.format(iterations=args.iterations)
+    program = Parser(LexerSkippingComments(StringSource(text)), flatten=True).parse_program()
+    interpreter = ENGINES[args.engine](parser=None)
+
+    timings = []
+    for _ in range(args.repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            interpreter.run(program)
+            timings.append(time.perf_counter() - start)
+
+    print(f"best of {args.repeat}: {min(timings):.3f} s ({min(timings) / args.iterations * 1e6:.1f} us per iteration)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Compares per visit overhead of looking up visitor method by name on every visit
+with dispatch cached per node class.
+
+Usage: python -m benchmarks.visitor_dispatch [--scale N]"""
+import argparse
+import time
+from pathlib import Path
+from typing import Callable
+
+from src.interpreter.visitor import Visitor
+from src.lexer.lexer import LexerSkippingComments
+from src.parser import Parser
+from src.parser.objects.objects import Node, walk
+from src.source import StringSource
+
+EXAMPLES_DIR = Path(__file__).parents[1] / "examples"
+
+
+class CountingVisitor(Visitor):
+    """Visitor doing no work, so that only dispatch is measured."""
+
+    def __init__(self):
+        self.count = 0
+
+    def visit_node(self, node):
+        self.count += 1
+
+
+def node_classes(cls: type = Node) -> list[type]:
+    return [cls, *(sub for subclass in cls.__subclasses__() for sub in node_classes(subclass))]
+
+
+# every node class is handled, as in Interpreter
+for _node_class in node_classes():
+    setattr(CountingVisitor, f"visit_{_node_class.__name__}", CountingVisitor.visit_node)
+
+
+class NameLookupVisitor(CountingVisitor):
+    """Looks up method by building its name on every visit."""
+
+    def visit(self, node):
+        method = 'visit_' + node.__class__.__name__
+        visitor: Callable = getattr(self, method, self._generic_visit)
+        return visitor(node)
+
+
+def measure(visitor: CountingVisitor, nodes: list, repeat: int = 5) -> float:
+    """Returns the best time of visiting all nodes."""
+
+    best = float("inf")
+    visit = visitor.visit
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for node in nodes:
+            visit(node)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("--scale", type=int, default=100, help="how many times examples are repeated")
+    args = arg_parser.parse_args()
+
+    text = "\n".join([(EXAMPLES_DIR / name).read_text() for name in ("main.ty", "lambdas.ty")] * args.scale)
+    program = Parser(LexerSkippingComments(StringSource(text)), flatten=True).parse_program()
+    nodes = list(walk(program))
+
+    for name, visitor in [("name lookup", NameLookupVisitor()), ("cached", CountingVisitor())]:
+        elapsed = measure(visitor, nodes)
+        print(f"{name:<12} {elapsed * 1e9 / len(nodes):8.1f} ns per visit ({len(nodes)} nodes)")
+
+
+if __name__ == '__main__':
+    main()
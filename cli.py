@@ -1,26 +1,119 @@
 import argparse
 import os
+import sys
 from pathlib import Path
 
+from src.interpreter.checker import TypeChecker
+from src.interpreter.closures import ClosureInterpreter
 from src.interpreter.interpreter import Interpreter
+from src.interpreter.optimizer import OPTIMIZATION_LEVELS, NO_OPTIMIZATION
+from src.interpreter.quickening import QuickeningInterpreter
+from src.interpreter.tiered import TieredInterpreter
+from src.interpreter.transpiler import TranspilingInterpreter
+from src.interpreter.vm import VirtualMachine
+from src.lexer.dispatch_lexer import DispatchLexerSkippingComments
 from src.lexer.lexer import LexerSkippingComments
+from src.lexer.regex_lexer import RegexLexerSkippingComments
+from src.parser.cache import CACHE_DIR_NAME, CachingParser, ProgramCache
 from src.parser.parser import Parser
-from src.source import FileSource
+from src.source import FileSource, BufferedFileSource, MmapSource
+
+SOURCES = {
+    "file": FileSource,
+    "buffered": BufferedFileSource,
+    "mmap": MmapSource,
+}
+
+LEXERS = {
+    "default": LexerSkippingComments,
+    "dispatch": DispatchLexerSkippingComments,
+    "regex": RegexLexerSkippingComments,
+}
+
+ENGINES = {
+    "tree": Interpreter,
+    "closure": ClosureInterpreter,
+    "vm": VirtualMachine,
+    "python": TranspilingInterpreter,
+    "quickening": QuickeningInterpreter,
+    "tiered": TieredInterpreter,
+}
 
 
 def main() -> None:
     arg_parser = argparse.ArgumentParser()
     arg_parser.add_argument("-f", "--file", required=True, help="path to file to interpret")
+    arg_parser.add_argument(
+        "-s", "--source", choices=SOURCES.keys(), default="buffered", help="how the file should be read"
+    )
+    arg_parser.add_argument(
+        "-l", "--lexer", choices=LEXERS.keys(), default="default", help="which lexer engine should be used"
+    )
+    arg_parser.add_argument(
+        "--cache-dir", type=Path, default=None,
+        help=f"where parsed programs should be cached, defaults to {CACHE_DIR_NAME} next to the file, "
+             "giving it turns on --cache"
+    )
+    arg_parser.add_argument(
+        "--cache", action=argparse.BooleanOptionalAction, default=None,
+        help="reuse parsed programs cached in --cache-dir instead of lexing and parsing the file again, "
+             "cached programs are unpickled, so cache directory must not be writable by others"
+    )
+    arg_parser.add_argument(
+        "-e", "--engine", choices=ENGINES.keys(), default="tree", help="how the program should be executed"
+    )
+    arg_parser.add_argument(
+        "-O", "--optimize", type=int, choices=OPTIMIZATION_LEVELS, default=NO_OPTIMIZATION,
+        help="optimisation level: 1 folds constant expressions, 2 also propagates constants and removes dead code"
+    )
+    arg_parser.add_argument(
+        "--check", action="store_true", help="report type errors before running and do not run if there are any"
+    )
+    arg_parser.add_argument(
+        "--disassemble", action="store_true", help="print bytecode of the program and its functions instead of running"
+    )
+    arg_parser.add_argument(
+        "--transpile", action="store_true", help="print Python source generated for the program instead of running"
+    )
     args = arg_parser.parse_args()
 
     if os.path.exists(args.file):
-        source = FileSource(file_name=Path(args.file))
-        lexer = LexerSkippingComments(source=source)
-        parser = Parser(lexer=lexer)
-        # program = parser.parse_program()
-        # print(program.objects)
-        interpreter = Interpreter(parser=parser)
-        interpreter.interpret()
+        file_name = Path(args.file)
+
+        def make_parser() -> Parser:
+            source = SOURCES[args.source](file_name=file_name)
+            lexer = LEXERS[args.lexer](source=source)
+            return Parser(lexer=lexer, flatten=True)
+
+        # giving cache directory turns cache on, unless it is turned off with --no-cache
+        use_cache = args.cache_dir is not None if args.cache is None else args.cache
+        if use_cache:
+            cache = ProgramCache(args.cache_dir or file_name.parent / CACHE_DIR_NAME)
+            parser = CachingParser(file_name, cache, make_parser, flatten=True)
+        else:
+            parser = make_parser()
+
+        program = parser.parse_program()
+
+        if args.check and (errors := TypeChecker().check(program).errors):
+            for error in errors:
+                print(f"{error.__class__.__name__}: {error}", file=sys.stderr)
+            sys.exit(1)
+
+        if args.disassemble:
+            vm = VirtualMachine(parser=parser, optimization_level=args.optimize)
+            print(vm.disassemble(vm.optimize(program)))
+            return
+
+        if args.transpile:
+            transpiler = TranspilingInterpreter(parser=parser, optimization_level=args.optimize)
+            program = transpiler.optimize(program)
+            transpiler.prepare(program)
+            print(transpiler.python_program(program).source)
+            return
+
+        interpreter = ENGINES[args.engine](parser=parser, optimization_level=args.optimize)
+        interpreter.run(interpreter.optimize(program))
 
 
 if __name__ == '__main__':
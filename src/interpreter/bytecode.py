@@ -0,0 +1,423 @@
+from enum import IntEnum
+from typing import Any, Optional
+
+from src.interpreter import values
+from src.interpreter.closures import VALUE_NODES, has_calls
+from src.interpreter.operations import BinaryOperation
+from src.interpreter.visitor import Visitor
+from src.parser.objects.objects import (
+    Node, Expression, AssignmentStatement, BinaryExpression, CompFactor, CompoundStatement, DeclarationStatement,
+    EmptyStatement, Factor, FunctionCall, FunctionDefinition, Identifier, IfStatement, InlineReturnStatement,
+    LambdaExpression, Literal, NegFactor, ReturnStatement, UnaryMinus, UnaryNot, WhileLoopStatement
+)
+from src.parser.objects.program import Program
+
+
+class Opcode(IntEnum):
+    """Instructions of VirtualMachine. Next to every instruction there is a meaning of its operand and values
+    it pops from and pushes onto the stack (`popped -> pushed`). Values of variables are unpacked,
+    the same as in Interpreter."""
+
+    LOAD_CONST = 0  # index of constant; -> constant
+    LOAD_NAME = 1  # unused, name of variable; -> variable from function's names or globals
+    LOAD_SLOT = 2  # slot, name of variable; -> variable from slot, or by name if slot is empty
+    LOAD_NAME_VALUE = 3  # the same as LOAD_NAME; -> unpacked variable
+    LOAD_SLOT_VALUE = 4  # the same as LOAD_SLOT; -> unpacked variable
+    UNPACK = 5  # position from top of stack; variable -> value
+    BINARY_OPERATION = 6  # index of operation selected by TypeChecker; left value, right value -> result
+    BINARY_DISPATCH = 7  # index of operator; left value, right value -> result of operation for their types
+    NOT = 8  # unused; value -> negated value
+    NEGATE = 9  # unused; value -> negated value
+    JUMP = 10  # index of instruction; nothing
+    JUMP_IF_NOT_TRUE = 11  # index of instruction; condition -> nothing, jumps if condition is not true
+    LOAD_FUNCTION = 12  # index of CallSite; -> called function
+    CALL = 13  # index of CallSite; function, arguments -> returned value
+    RETURN = 14  # unused; value -> nothing, returns from function with return statement
+    END = 15  # unused; value -> nothing, ends function without return statement or ends compiled node
+    POP = 16  # unused; value -> nothing
+    DECLARE = 17  # index of Declaration; value -> nothing
+    DECLARE_CHECKED = 18  # index of DeclarationStatement; value or None -> nothing, checks types first
+    ASSIGN = 19  # unused; variable, value -> nothing
+    LOAD_ASSIGNABLE = 20  # index of AssignmentStatement; -> variable, if a value can be assigned to it
+    ASSIGN_CHECKED = 21  # index of AssignmentStatement; variable, value -> nothing, checks types first
+    CLEAR_SLOTS = 22  # index of first slot and Nones overwriting slots of a block; nothing
+    DEFINE_FUNCTION = 23  # index of FunctionDefinition; nothing
+
+
+class CallSite:
+    """Function call compiled into LOAD_FUNCTION and CALL instructions."""
+
+    __slots__ = ('node', 'name', 'slot', 'arguments_count', 'verified', 'chained')
+
+    def __init__(self, node: FunctionCall, slot: Optional[int], verified: bool):
+        self.node = node
+        self.name = node.name
+        self.slot = slot
+        self.arguments_count = len(node.arguments[0])
+        self.verified = verified
+        # returned function is called with arguments of the original call, see Interpreter
+        self.chained = len(node.arguments) > 1
+
+    def __repr__(self):
+        return f"{self.name}/{self.arguments_count}"
+
+
+class Declaration:
+    """Verified declaration compiled into DECLARE instruction."""
+
+    __slots__ = ('name', 'type', 'nullable', 'mutable', 'slot')
+
+    def __init__(self, declaration_statement: DeclarationStatement, slot: Optional[int]):
+        variable = declaration_statement.left_value
+        self.name = variable.name
+        self.type = variable.type
+        self.nullable = variable.nullable
+        self.mutable = variable.mutable
+        self.slot = slot
+
+    def __repr__(self):
+        return self.name
+
+
+class CodeObject:
+    """Node compiled into linear bytecode. Instruction `i` consists of an opcode `opcodes[i]` and an operand
+    `operands[i]`, which is an index of a constant, a slot or an index of instruction to jump to.
+    Instructions which refer to variables by name have it in `names[i]`. Running the code leaves a result
+    of compiled node (None for statements) on top of the stack, which is popped by final END instruction."""
+
+    __slots__ = ('name', 'opcodes', 'operands', 'names', 'constants')
+
+    def __init__(self, name: str, opcodes: bytes, operands: list[int], names: list[Optional[str]],
+                 constants: list[Any]):
+        self.name = name
+        self.opcodes = opcodes
+        self.operands = operands
+        self.names = names
+        self.constants = constants
+
+    def __len__(self):
+        return len(self.opcodes)
+
+
+class BytecodeCompiler(Visitor):
+    """Compiles nodes of a program into CodeObjects. Every node is compiled once per run, function bodies are
+    compiled when a function is called for the first time. Loops and conditionals are compiled into jumps,
+    so running a function does not recurse into nested statements.
+
+    Compiler uses resolution and verification of a program prepared by interpreter: slots of variables,
+    blocks, verified nodes and operations selected by TypeChecker."""
+
+    def __init__(self, slots: dict[Node, int], blocks: dict[CompoundStatement, tuple[int, tuple]],
+                 verified: set[Node], operations: dict[BinaryExpression, BinaryOperation]):
+        self.slots = slots
+        self.blocks = blocks
+        self.verified = verified
+        self.operations = operations
+        self.code_objects: dict[Any, CodeObject] = {}
+
+        # code which is being compiled
+        self.opcodes: list[int] = []
+        self.operands: list[int] = []
+        self.names: list[Optional[str]] = []
+        self.constants: list[Any] = []
+        self.constant_indexes: dict[int, int] = {}
+
+    def compile(self, node: Any, name: Optional[str] = None) -> CodeObject:
+        try:
+            return self.code_objects[node]
+        except KeyError:
+            pass
+
+        self.opcodes, self.operands, self.names, self.constants, self.constant_indexes = [], [], [], [], {}
+
+        self.visit(node)
+
+        # statements have no result
+        if not isinstance(node, Expression):
+            self.emit(Opcode.LOAD_CONST, self.constant(None))
+
+        self.emit(Opcode.END)
+
+        code = self.code_objects[node] = CodeObject(
+            name or getattr(node, 'name', node.__class__.__name__),
+            bytes(self.opcodes), self.operands, self.names, self.constants
+        )
+        return code
+
+    def emit(self, opcode: Opcode, operand: int = 0, name: Optional[str] = None) -> int:
+        """Appends an instruction and returns its index."""
+
+        self.opcodes.append(opcode)
+        self.operands.append(operand)
+        self.names.append(name)
+        return len(self.opcodes) - 1
+
+    def constant(self, value: Any) -> int:
+        """Returns index of a constant, constants are identified by identity."""
+
+        try:
+            return self.constant_indexes[id(value)]
+        except KeyError:
+            index = self.constant_indexes[id(value)] = len(self.constants)
+            self.constants.append(value)
+            return index
+
+    def jump_here(self, instruction: int) -> None:
+        """Makes a jump instruction jump to the next emitted instruction."""
+        self.operands[instruction] = len(self.opcodes)
+
+    def visit_statement(self, statement: Node) -> None:
+        self.visit(statement)
+
+        # expressions used as statements (function calls) leave a value, which is not used
+        if isinstance(statement, Expression):
+            self.emit(Opcode.POP)
+
+    def visit_value(self, node: Node) -> None:
+        """Compiles a node, unpacking a variable it results in."""
+
+        if isinstance(node, Identifier):
+            self.load(node.name, self.slots.get(node), unpack=True)
+            return
+
+        self.visit(node)
+        if not isinstance(node, VALUE_NODES):
+            self.emit(Opcode.UNPACK)
+
+    def load(self, name: str, slot: Optional[int], unpack: bool = False) -> None:
+        if slot is None:
+            self.emit(Opcode.LOAD_NAME_VALUE if unpack else Opcode.LOAD_NAME, name=name)
+        else:
+            self.emit(Opcode.LOAD_SLOT_VALUE if unpack else Opcode.LOAD_SLOT, slot, name)
+
+    def visit_Program(self, program: Program):
+        for node in program.objects:
+            self.visit_statement(node)
+
+    def visit_FunctionDefinition(self, func_def: FunctionDefinition):
+        self.emit(Opcode.DEFINE_FUNCTION, self.constant(func_def), func_def.name)
+
+    def visit_LambdaExpression(self, lambda_expr: LambdaExpression):
+        self.emit(Opcode.LOAD_CONST, self.constant(lambda_expr))
+
+    def visit_WhileLoopStatement(self, while_loop_statement: WhileLoopStatement):
+        start = len(self.opcodes)
+        self.visit_value(while_loop_statement.condition)
+        exit_jump = self.emit(Opcode.JUMP_IF_NOT_TRUE)
+
+        self.visit(while_loop_statement.body)
+        self.emit(Opcode.JUMP, start)
+        self.jump_here(exit_jump)
+
+    def visit_IfStatement(self, if_statement: IfStatement):
+        end_jumps = []
+        has_more_branches = bool(if_statement.elif_statements) or if_statement.else_statement is not None
+
+        self.visit_value(if_statement.condition)
+        next_jump = self.emit(Opcode.JUMP_IF_NOT_TRUE)
+        self.visit(if_statement.statement)
+        if has_more_branches:
+            end_jumps.append(self.emit(Opcode.JUMP))
+        self.jump_here(next_jump)
+
+        for elif_stmt in if_statement.elif_statements:
+            self.visit_value(elif_stmt.condition)
+            next_jump = self.emit(Opcode.JUMP_IF_NOT_TRUE)
+            self.visit(elif_stmt.statement)
+            end_jumps.append(self.emit(Opcode.JUMP))
+            self.jump_here(next_jump)
+
+        if if_statement.else_statement is not None:
+            self.visit(if_statement.else_statement.statement)
+
+        for jump in end_jumps:
+            self.jump_here(jump)
+
+    def visit_ReturnStatement(self, return_statement: ReturnStatement):
+        if return_statement.expression is None:
+            self.emit(Opcode.LOAD_CONST, self.constant(values.NULL))
+        else:
+            self.visit(return_statement.expression)
+
+        self.emit(Opcode.RETURN)
+
+    def visit_InlineReturnStatement(self, inline_return_statement: InlineReturnStatement):
+        self.visit_ReturnStatement(inline_return_statement)
+
+    def visit_FunctionCall(self, func_call: FunctionCall):
+        call_site = CallSite(func_call, self.slots.get(func_call), func_call in self.verified)
+        index = self.constant(call_site)
+
+        self.emit(Opcode.LOAD_FUNCTION, index, func_call.name)
+        for argument in func_call.arguments[0]:
+            self.visit(argument)
+        self.emit(Opcode.CALL, index, func_call.name)
+
+    def visit_AssignmentStatement(self, assignment_statement: AssignmentStatement):
+        name = assignment_statement.name
+
+        if assignment_statement in self.verified:
+            self.load(name, self.slots.get(assignment_statement))
+            self.visit_value(assignment_statement.right_value)
+            self.emit(Opcode.ASSIGN, name=name)
+            return
+
+        index = self.constant(assignment_statement)
+        self.emit(Opcode.LOAD_ASSIGNABLE, index, name)
+        self.visit_value(assignment_statement.right_value)
+        self.emit(Opcode.ASSIGN_CHECKED, index, name)
+
+    def visit_DeclarationStatement(self, declaration_statement: DeclarationStatement):
+        name = declaration_statement.left_value.name
+
+        if declaration_statement in self.verified:
+            self.visit_value(declaration_statement.right_value)
+            declaration = Declaration(declaration_statement, self.slots.get(declaration_statement))
+            self.emit(Opcode.DECLARE, self.constant(declaration), name)
+            return
+
+        if declaration_statement.right_value is not None:
+            self.visit(declaration_statement.right_value)
+        else:
+            self.emit(Opcode.LOAD_CONST, self.constant(None))
+
+        self.emit(Opcode.DECLARE_CHECKED, self.constant(declaration_statement), name)
+
+    def visit_EmptyStatement(self, empty_statement: EmptyStatement):
+        pass
+
+    def visit_CompoundStatement(self, compound_statement: CompoundStatement):
+        for statement in compound_statement.statements:
+            self.visit_statement(statement)
+
+        if (block := self.blocks.get(compound_statement)) is not None:
+            self.emit(Opcode.CLEAR_SLOTS, self.constant(block))
+
+    def visit_BinaryExpression(self, expression: BinaryExpression):
+        left, right = expression.left_value, expression.right_value
+
+        # left side is unpacked after the right one is evaluated, a call could change value of its variable
+        if isinstance(left, VALUE_NODES) or not has_calls(right):
+            self.visit_value(left)
+            self.visit_value(right)
+        else:
+            self.visit(left)
+            self.visit_value(right)
+            self.emit(Opcode.UNPACK, 1)
+
+        operator = expression.operator
+        if (operation := self.operations.get(expression)) is not None:
+            self.emit(Opcode.BINARY_OPERATION, self.constant(operation), operator.name)
+        else:
+            self.emit(Opcode.BINARY_DISPATCH, self.constant(operator), operator.name)
+
+    def visit_NullCoalesceExpression(self, expression):
+        self.visit_BinaryExpression(expression)
+
+    def visit_OrExpression(self, expression):
+        self.visit_BinaryExpression(expression)
+
+    def visit_AndExpression(self, expression):
+        self.visit_BinaryExpression(expression)
+
+    def visit_EqualityExpression(self, expression):
+        self.visit_BinaryExpression(expression)
+
+    def visit_AdditiveExpression(self, expression):
+        self.visit_BinaryExpression(expression)
+
+    def visit_MultiplicativeExpression(self, expression):
+        self.visit_BinaryExpression(expression)
+
+    def visit_CompFactor(self, comp_factor: CompFactor):
+        self.visit(comp_factor.factor)
+
+        if comp_factor.negation:
+            self.emit(Opcode.NOT)
+
+    def visit_NegFactor(self, neg_factor: NegFactor):
+        self.visit(neg_factor.factor)
+
+        if neg_factor.minus:
+            self.emit(Opcode.NEGATE)
+
+    def visit_UnaryNot(self, unary_not: UnaryNot):
+        self.visit(unary_not.operand)
+        self.emit(Opcode.NOT)
+
+    def visit_UnaryMinus(self, unary_minus: UnaryMinus):
+        self.visit(unary_minus.operand)
+        self.emit(Opcode.NEGATE)
+
+    def visit_Factor(self, factor: Factor):
+        self.visit(factor.value)
+
+    def visit_Literal(self, literal: Literal):
+        self.emit(Opcode.LOAD_CONST, self.constant(values.from_literal(literal)))
+
+    def visit_Identifier(self, identifier: Identifier):
+        self.load(identifier.name, self.slots.get(identifier))
+
+
+# opcodes whose operands are indexes of constants
+CONSTANT_OPERANDS = {
+    Opcode.LOAD_CONST, Opcode.BINARY_OPERATION, Opcode.BINARY_DISPATCH, Opcode.LOAD_FUNCTION, Opcode.CALL,
+    Opcode.DECLARE, Opcode.DECLARE_CHECKED, Opcode.LOAD_ASSIGNABLE, Opcode.ASSIGN_CHECKED, Opcode.CLEAR_SLOTS,
+    Opcode.DEFINE_FUNCTION,
+}
+
+# opcodes whose operands are slots or indexes of instructions
+PLAIN_OPERANDS = {
+    Opcode.LOAD_SLOT, Opcode.LOAD_SLOT_VALUE, Opcode.UNPACK, Opcode.JUMP, Opcode.JUMP_IF_NOT_TRUE,
+}
+
+
+def describe_constant(value: Any) -> Optional[str]:
+    match value:
+        case None:
+            return "None"
+
+        case values.RuntimeValue():
+            return f"{value.type} {value.value!r}"
+
+        case FunctionDefinition() | LambdaExpression():
+            return f"{value.__class__.__name__} {value.name}"
+
+        case CallSite():
+            return repr(value)
+
+        case Node():
+            return value.__class__.__name__
+
+        case tuple():
+            start, nones = value
+            return f"slots {start}-{start + len(nones) - 1}"
+
+        # operations and operators are described by names of instructions
+        case _:
+            return None
+
+
+def disassemble(code: CodeObject) -> str:
+    """Returns readable listing of instructions of compiled code, one instruction per line:
+    index, opcode, operand and its meaning (constant, name of variable)."""
+
+    lines = [f"code {code.name}:"]
+    for index, (opcode, operand, name) in enumerate(zip(code.opcodes, code.operands, code.names)):
+        opcode = Opcode(opcode)
+        line = f"{index:>6} {opcode.name:<18}"
+
+        if opcode in CONSTANT_OPERANDS or opcode in PLAIN_OPERANDS:
+            line += f" {operand:>4}"
+
+        details = []
+        if opcode in CONSTANT_OPERANDS and (description := describe_constant(code.constants[operand])):
+            details.append(description)
+        if name is not None and name not in details:
+            details.append(name)
+        if details:
+            line += f" ({', '.join(details)})"
+
+        lines.append(line.rstrip())
+
+    return "\n".join(lines)
@@ -0,0 +1,453 @@
+from collections import defaultdict
+from typing import Optional
+
+from src.errors.interpreter import (
+    ArgumentsError, ArgumentTypeError, AssignmentTypeMismatchError, ConstAssignmentError, InterpreterError,
+    NotNullableError, ReturnTypeMismatchError, TypeMismatchError, UnexpectedTypeError, UninitializedConstError
+)
+from src.interpreter.operations import BINARY_OPERATIONS, ARITHMETIC, DIVISION, BinaryOperation
+from src.interpreter.visitor import Visitor
+from src.parser.objects.objects import (
+    Node, walk, AssignmentStatement, BinaryExpression, CompFactor, CompoundStatement, DeclarationStatement,
+    Factor, FunctionCall, FunctionDefinition, Identifier, IfStatement, InlineReturnStatement, LambdaExpression,
+    Literal, NegFactor, ReturnStatement, UnaryMinus, UnaryNot, WhileLoopStatement
+)
+from src.parser.objects.program import Program
+from src.parser.types import Type, OtherOperator, INTEGER, FLOAT, BOOL, STRING, NULL
+
+# builtin functions mapped to types of values they return
+BUILTIN_RESULT_TYPES = {
+    'print': NULL,
+    'String': STRING,
+    'Integer': INTEGER,
+    'Boolean': BOOL,
+    'Float': FLOAT,
+}
+
+
+class Verification:
+    """Result of checking a program:
+
+    - `errors` - errors which interpreter raises if it reaches nodes they were found in,
+    - `verified` - declarations, assignments and function calls whose type checks are known to pass,
+    - `operations` - binary expressions mapped to operation specialised for types of their operands."""
+
+    def __init__(self):
+        self.errors: list[InterpreterError] = []
+        self.verified: set[Node] = set()
+        self.operations: dict[BinaryExpression, BinaryOperation] = {}
+
+
+class Binding:
+    """Everything declared under one name in a program - variables and parameters."""
+
+    def __init__(self):
+        self.types: set[Type] = set()
+        self.nullable: set[bool] = set()
+        self.mutable: set[bool] = set()
+        self.parameter = False
+
+    @property
+    def type(self) -> Optional[Type]:
+        """Type of every value stored under the name, if it is always the same."""
+
+        if len(self.types) == 1 and self.nullable == {False}:
+            return next(iter(self.types))
+
+        return None
+
+
+class FunctionContext:
+    """Function (or lambda) whose body is being checked."""
+
+    def __init__(self, function: Optional[FunctionDefinition | LambdaExpression] = None):
+        self.function = function
+        # function without parameters gets generic ones (a, b, c, ...) when called with arguments
+        self.generic = function is not None and not function.parameters
+        self.returns_exact = True
+
+
+def is_generic_name(name: str) -> bool:
+    return len(name) == 1 and 'a' <= name <= 'z'
+
+
+def always_returns(statement: Node) -> bool:
+    """Checks if executing a statement always ends with a return."""
+
+    match statement:
+        case ReturnStatement():
+            return True
+
+        case CompoundStatement():
+            return any(always_returns(child) for child in statement.statements)
+
+        case IfStatement() if statement.else_statement is not None:
+            return (
+                always_returns(statement.statement)
+                and all(always_returns(elif_stmt.statement) for elif_stmt in statement.elif_statements)
+                and always_returns(statement.else_statement.statement)
+            )
+
+        case _:
+            return False
+
+
+class TypeChecker(Visitor):
+    """Checks types of a program before it is run. Every variable, parameter and function's return value
+    has a declared type, so most errors which interpreter would raise can be found ahead of execution.
+    Errors are the same as raised by interpreter. They are collected instead of being raised,
+    because interpreter only raises them if code they were found in is actually run.
+
+    Checker is conservative - types of values stored under names which are declared with different types,
+    generic parameters or calls through variables are unknown and left to be checked at runtime.
+    Nodes whose checks are known to pass are collected in Verification, so interpreter can skip them.
+
+    Functions declared to return int can also return floats. Checker assumes they return ints, and repeats
+    checking until it finds every function which can really return something else."""
+
+    def __init__(self):
+        self.bindings: dict[str, Binding] = defaultdict(Binding)
+        self.functions: dict[str, list[FunctionDefinition]] = defaultdict(list)
+        self.has_chained_calls = False
+
+        # functions declared to return int, which can return a float
+        self.inexact_functions: set[FunctionDefinition] = set()
+        # functions which always return a value of exactly their return type
+        self.verified_functions: set[FunctionDefinition] = set()
+
+        self.verification = Verification()
+        self.context = FunctionContext()
+        self.reporting = False
+
+    def check(self, program: Program) -> Verification:
+        self._collect(program)
+
+        while True:
+            inexact, verified = self._check_pass(program)
+            if inexact == self.inexact_functions and verified == self.verified_functions:
+                break
+
+            self.inexact_functions, self.verified_functions = inexact, verified
+
+        self.reporting = True
+        self._check_pass(program)
+        return self.verification
+
+    def _check_pass(self, program: Program) -> tuple[set, set]:
+        self.verification = Verification()
+        self._inexact, self._verified = set(), set()
+        self.visit(program)
+        return self._inexact, self._verified
+
+    def _collect(self, program: Program) -> None:
+        for node in walk(program):
+            match node:
+                case DeclarationStatement():
+                    variable = node.left_value
+                    binding = self.bindings[variable.name]
+                    binding.types.add(variable.type)
+                    binding.nullable.add(variable.nullable)
+                    binding.mutable.add(variable.mutable)
+
+                case FunctionDefinition() | LambdaExpression():
+                    if isinstance(node, FunctionDefinition):
+                        self.functions[node.name].append(node)
+
+                    for parameter in node.parameters:
+                        binding = self.bindings[parameter.name]
+                        binding.types.add(parameter.type)
+                        # arguments have exactly the type of a parameter, null is not accepted
+                        binding.nullable.add(False)
+                        binding.parameter = True
+
+                case FunctionCall() if len(node.arguments) > 1:
+                    self.has_chained_calls = True
+
+        # lambdas returned from functions can be called with any arguments in a chain
+        if self.has_chained_calls:
+            for node in walk(program):
+                if isinstance(node, LambdaExpression):
+                    for parameter in node.parameters:
+                        self.bindings[parameter.name].nullable.add(True)
+
+    def _error(self, error: InterpreterError) -> None:
+        if self.reporting:
+            self.verification.errors.append(error)
+
+    def _name_type(self, name: str) -> Optional[Type]:
+        if self.context.generic and is_generic_name(name):
+            return None
+
+        if (binding := self.bindings.get(name)) is None:
+            return None
+
+        return binding.type
+
+    def _generic_visit(self, node):
+        # subtrees missing from an incomplete expression are not verified, running them fails at runtime
+        if node is None:
+            return None
+
+        for child in node.iter_child_nodes():
+            self.visit(child)
+
+    def visit_FunctionDefinition(self, func_def: FunctionDefinition):
+        self._check_function(func_def)
+
+    def visit_LambdaExpression(self, lambda_expr: LambdaExpression) -> Type:
+        self._check_function(lambda_expr)
+        return lambda_expr.type
+
+    def _check_function(self, function: FunctionDefinition | LambdaExpression) -> None:
+        context, self.context = self.context, FunctionContext(function)
+
+        if function.body is not None:
+            self.visit(function.body)
+
+        if (
+                self.context.returns_exact
+                and (function.return_type == NULL or always_returns(function.body))
+        ):
+            self._verified.add(function)
+
+        elif function.return_type == INTEGER:
+            self._inexact.add(function)
+
+        self.context = context
+
+    def visit_ReturnStatement(self, return_statement: ReturnStatement):
+        typ = NULL if return_statement.expression is None else self.visit(return_statement.expression)
+
+        if (function := self.context.function) is None:
+            return
+
+        return_type = function.return_type
+        if typ is None or typ != return_type:
+            self.context.returns_exact = False
+
+        # integer function can return float, lambdas are checked against a name of a variable they are called by
+        if (
+                typ is not None and typ != return_type
+                and not (typ == FLOAT and return_type == INTEGER)
+                and isinstance(function, FunctionDefinition)
+        ):
+            self._error(ReturnTypeMismatchError(function.name, return_type, typ))
+
+    def visit_InlineReturnStatement(self, return_statement: InlineReturnStatement):
+        self.visit_ReturnStatement(return_statement)
+
+    def visit_WhileLoopStatement(self, while_loop_statement: WhileLoopStatement):
+        self._check_condition(while_loop_statement.condition)
+        self.visit(while_loop_statement.body)
+
+    def visit_IfStatement(self, if_statement: IfStatement):
+        self._check_condition(if_statement.condition)
+        self.visit(if_statement.statement)
+
+        for elif_stmt in if_statement.elif_statements:
+            self._check_condition(elif_stmt.condition)
+            self.visit(elif_stmt.statement)
+
+        if if_statement.else_statement is not None:
+            self.visit(if_statement.else_statement.statement)
+
+    def _check_condition(self, condition: Node) -> None:
+        typ = self.visit(condition)
+
+        if typ is not None and typ != BOOL and typ != NULL:
+            self._error(UnexpectedTypeError(f'Expected condition to be type Bool or Null. Got {typ} instead.'))
+
+    def visit_DeclarationStatement(self, declaration_statement: DeclarationStatement):
+        variable = declaration_statement.left_value
+
+        if declaration_statement.right_value is None:
+            # const a?: int / const a: int;    <- const variable has to be initialized
+            if not variable.mutable:
+                self._error(UninitializedConstError(variable.name))
+
+            # let a: int;       <- mutable variable has to be marked as nullable
+            elif not variable.nullable:
+                self._error(NotNullableError(variable.name))
+
+            return
+
+        if (typ := self.visit(declaration_statement.right_value)) is None:
+            return
+
+        if typ == NULL and not variable.nullable:
+            self._error(NotNullableError(variable.name))
+
+        elif typ == variable.type or (typ == NULL and variable.nullable):
+            # there is no constant, which could be redeclared
+            if False not in self.bindings[variable.name].mutable:
+                self.verification.verified.add(declaration_statement)
+
+        elif not (variable.type == FLOAT and typ == INTEGER):
+            self._error(TypeMismatchError(variable.name, variable.type, typ))
+
+    def visit_AssignmentStatement(self, assignment_statement: AssignmentStatement):
+        name = assignment_statement.name
+        typ = self.visit(assignment_statement.right_value)
+        binding = self.bindings.get(name)
+
+        # parameters are not stored in variables, generic ones can have any type
+        if binding is None or binding.parameter or (self.context.generic and is_generic_name(name)):
+            return
+
+        if binding.mutable == {False}:
+            self._error(ConstAssignmentError(name))
+            return
+
+        if typ is None or len(binding.types) != 1 or len(binding.nullable) != 1 or binding.mutable != {True}:
+            return
+
+        expected = next(iter(binding.types))
+
+        if typ == NULL and binding.nullable == {False}:
+            self._error(NotNullableError(name))
+
+        elif typ == expected:
+            self.verification.verified.add(assignment_statement)
+
+        elif not (expected == FLOAT and typ == INTEGER):
+            self._error(AssignmentTypeMismatchError(name, expected, typ))
+
+    def visit_FunctionCall(self, func_call: FunctionCall) -> Optional[Type]:
+        arguments = [self.visit(argument) for argument in func_call.arguments[0]]
+
+        for chained_arguments in func_call.arguments[1:]:
+            for argument in chained_arguments:
+                self.visit(argument)
+
+        name = func_call.name
+        if (
+                len(func_call.arguments) > 1
+                or name in self.bindings
+                or (self.context.generic and is_generic_name(name))
+        ):
+            return None
+
+        if not (func_defs := self.functions.get(name)):
+            return BUILTIN_RESULT_TYPES.get(name)
+
+        # functions can be redefined, builtins can be shadowed
+        if len(func_defs) > 1 or name in BUILTIN_RESULT_TYPES:
+            return None
+
+        func_def = func_defs[0]
+        if self._check_arguments(func_def, arguments) and func_def in self.verified_functions:
+            self.verification.verified.add(func_call)
+
+        if func_def.return_type == INTEGER and func_def in self.inexact_functions:
+            return None
+
+        return NULL if func_def.return_type == NULL else func_def.return_type
+
+    def _check_arguments(self, func_def: FunctionDefinition, arguments: list[Optional[Type]]) -> bool:
+        """Checks arguments against parameters of a function. Returns True if they are known to be valid."""
+
+        # generic parameters accept any number of arguments of any type
+        if not (parameters := func_def.parameters):
+            return True
+
+        if len(arguments) != len(parameters):
+            self._error(ArgumentsError(func_def.name, len(parameters), len(arguments)))
+            return False
+
+        valid = True
+        for typ, parameter in zip(arguments, parameters):
+            if typ is None:
+                valid = False
+
+            elif typ != parameter.type:
+                self._error(ArgumentTypeError(func_def.name, parameter.name, parameter.type, typ))
+                valid = False
+
+        return valid
+
+    def visit_BinaryExpression(self, expression: BinaryExpression) -> Optional[Type]:
+        left = self.visit(expression.left_value)
+        right = self.visit(expression.right_value)
+
+        if left is None or right is None:
+            # null coalescing of a value, which is never null
+            if expression.operator == OtherOperator.NULL_COALESCE and left is not None and left != NULL:
+                return left
+
+            return None
+
+        operator = expression.operator
+        if (operation := BINARY_OPERATIONS.get((operator, left.__class__, right.__class__))) is None:
+            # division by zero is reported before invalid types, so it is left to runtime
+            if not (operator in DIVISION and right in (INTEGER, FLOAT)):
+                self._error(UnexpectedTypeError(f"Operator {operator.name} cannot be used with types {left} {right}"))
+
+            return None
+
+        self.verification.operations[expression] = operation
+
+        if operator in ARITHMETIC or operator in DIVISION:
+            if left == STRING:
+                return STRING
+
+            return INTEGER if left == INTEGER and right == INTEGER else FLOAT
+
+        if operator == OtherOperator.NULL_COALESCE:
+            return right if left == NULL else left
+
+        return BOOL
+
+    def visit_NullCoalesceExpression(self, expression):
+        return self.visit_BinaryExpression(expression)
+
+    def visit_OrExpression(self, expression):
+        return self.visit_BinaryExpression(expression)
+
+    def visit_AndExpression(self, expression):
+        return self.visit_BinaryExpression(expression)
+
+    def visit_EqualityExpression(self, expression):
+        return self.visit_BinaryExpression(expression)
+
+    def visit_AdditiveExpression(self, expression):
+        return self.visit_BinaryExpression(expression)
+
+    def visit_MultiplicativeExpression(self, expression):
+        return self.visit_BinaryExpression(expression)
+
+    def visit_CompFactor(self, comp_factor: CompFactor) -> Optional[Type]:
+        typ = self.visit(comp_factor.factor)
+        return self._logic_not(typ) if comp_factor.negation else typ
+
+    def visit_NegFactor(self, neg_factor: NegFactor) -> Optional[Type]:
+        typ = self.visit(neg_factor.factor)
+        return self._unary_minus(typ) if neg_factor.minus else typ
+
+    def visit_UnaryNot(self, unary_not: UnaryNot) -> Optional[Type]:
+        return self._logic_not(self.visit(unary_not.operand))
+
+    def visit_UnaryMinus(self, unary_minus: UnaryMinus) -> Optional[Type]:
+        return self._unary_minus(self.visit(unary_minus.operand))
+
+    def _logic_not(self, typ: Optional[Type]) -> Optional[Type]:
+        if typ is not None and typ != BOOL:
+            self._error(UnexpectedTypeError(f"Operator `not` expected type Bool. Got {typ} instead."))
+            return None
+
+        return typ
+
+    def _unary_minus(self, typ: Optional[Type]) -> Optional[Type]:
+        if typ is not None and typ != INTEGER and typ != FLOAT:
+            self._error(UnexpectedTypeError(f"Operator `-` expected type Integer/Float. Got {typ} instead."))
+            return None
+
+        return typ
+
+    def visit_Factor(self, factor: Factor) -> Optional[Type]:
+        return self.visit(factor.value)
+
+    def visit_Literal(self, literal: Literal) -> Type:
+        return literal.type
+
+    def visit_Identifier(self, identifier: Identifier) -> Optional[Type]:
+        return self._name_type(identifier.name)
@@ -0,0 +1,723 @@
+from functools import partial
+from typing import Any, Callable, Optional
+
+from src.errors.interpreter import (
+    UndefinedNameError, NotCallableError, RecursionLimitError, ReturnException, UnexpectedTypeError
+)
+from src.interpreter import values
+from src.interpreter.interpreter import Interpreter, MAX_RECURSION_DEPTH
+from src.interpreter.operations import APPLIED_FUNCTIONS, BINARY_OPERATIONS, VALUE_CONSTRUCTORS, BinaryOperation
+from src.interpreter.optimizer import NO_OPTIMIZATION
+from src.interpreter.scopes import Frame
+from src.interpreter.values import RuntimeVariable
+from src.interpreter.visitor import Visitor
+from src.parser import Parser
+from src.parser.objects import builtins
+from src.parser.objects.objects import (
+    Node, walk, AssignmentStatement, BinaryExpression, CompFactor, CompoundStatement, DeclarationStatement,
+    EmptyStatement, Factor, FunctionCall, FunctionDefinition, Identifier, IfStatement, InlineReturnStatement,
+    LambdaExpression, Literal, NegFactor, Parameter, ReturnStatement, UnaryMinus, UnaryNot, Variable,
+    WhileLoopStatement
+)
+from src.parser.objects.program import Program
+from src.parser.types import Bool, BOOL, Func, NULL
+
+# compiled node, calling it has the same effect and result as visiting the node with Interpreter
+Code = Callable[[], Any]
+
+# nodes which always result in a value, never in a variable
+VALUE_NODES = (Literal, BinaryExpression, UnaryNot, UnaryMinus)
+
+
+def has_calls(node: Node) -> bool:
+    """Checks if evaluating a node can run a function, which could change values of variables."""
+    return any(isinstance(child, FunctionCall) for child in walk(node))
+
+
+class ClosureCompiler(Visitor):
+    """Compiles nodes of a program into nested closures. Every closure captures code of its children, resolved slots
+    and operations selected by TypeChecker, so running a program does not dispatch on nodes or look up anything
+    about them. Code of a node is created once per run and reused by every execution of that node.
+
+    Verified operations are applied directly to raw values of their operands, so nested operations and conditions
+    do not create runtime values for intermediate results.
+
+    Closures do exactly what Interpreter does when visiting the same node. Runtime checks of declarations
+    and assignments which are not verified, chained calls and builtins are run by the interpreter itself,
+    children of these nodes are still compiled."""
+
+    def __init__(self, interpreter: Interpreter):
+        self.interpreter = interpreter
+        self.env = interpreter.env
+        self.code: dict[Any, Code] = {}
+        self.bodies: dict[Any, Code] = {}
+
+    def compile(self, node: Any) -> Code:
+        try:
+            return self.code[node]
+        except KeyError:
+            code = self.code[node] = self.visit(node)
+            return code
+
+    def compile_value(self, node: Node) -> Code:
+        """Compiles a node into code which unpacks a variable it results in."""
+
+        if isinstance(node, VALUE_NODES):
+            return self.compile(node)
+
+        if isinstance(node, Identifier):
+            return self._load_value(node)
+
+        if isinstance(node, FunctionCall):
+            return self._call(node, unpack=True)
+
+        code = self.compile(node)
+
+        def value():
+            result = code()
+            return result.value if result.__class__ is RuntimeVariable else result
+
+        return value
+
+    def _delegate(self, method: Callable, node: Any) -> Code:
+        return partial(method, node)
+
+    def _generic_visit(self, node: Any) -> Code:
+        # nodes without compiled form, e.g. subtrees missing from incomplete expressions,
+        # are visited by the interpreter as a tree when they run, which raises the same error
+        return partial(Visitor.visit, self.interpreter, node)
+
+    def compile_body(self, body: Any) -> Code:
+        """Compiles body of a function into code which results in function's return value. Return statement
+        which ends the body results in its value instead of raising ReturnException. Other return statements
+        still raise it."""
+
+        try:
+            return self.bodies[body]
+        except KeyError:
+            pass
+
+        match body:
+            case ReturnStatement(expression=None):
+                code = self.visit_Literal(Literal(NULL, None))
+
+            case ReturnStatement():
+                code = self.compile(body.expression)
+
+            case CompoundStatement(statements=[*statements, ReturnStatement() as return_statement]):
+                code = self._returning_statements(statements, return_statement)
+
+            case _:
+                code = self.compile(body)
+
+        self.bodies[body] = code
+        return code
+
+    def _returning_statements(self, statements: list, return_statement: ReturnStatement) -> Code:
+        statements = [self.compile(statement) for statement in statements]
+        return_value = self.compile_body(return_statement)
+
+        def run_returning_statements():
+            for statement in statements:
+                statement()
+
+            # slots of the block are not cleared, frame of the function is removed right after
+            return return_value()
+
+        return run_returning_statements
+
+    def visit_Program(self, program: Program) -> Code:
+        statements = [self.compile(node) for node in program.objects]
+
+        def run_program():
+            for statement in statements:
+                statement()
+
+        return run_program
+
+    def visit_FunctionDefinition(self, func_def: FunctionDefinition) -> Code:
+        fun_table = self.env.global_scope.fun_table
+        name = func_def.name
+        if func_def.body is not None:
+            self.compile(func_def.body)
+
+        def define():
+            fun_table[name] = func_def
+
+        return define
+
+    def visit_LambdaExpression(self, lambda_expr: LambdaExpression) -> Code:
+        if lambda_expr.body is not None:
+            self.compile(lambda_expr.body)
+
+        def create_lambda():
+            return lambda_expr
+
+        return create_lambda
+
+    def visit_WhileLoopStatement(self, while_loop_statement: WhileLoopStatement) -> Code:
+        condition = self.compile_condition(while_loop_statement.condition)
+        body = self.compile(while_loop_statement.body)
+
+        def loop():
+            while condition():
+                body()
+
+        return loop
+
+    def visit_IfStatement(self, if_statement: IfStatement) -> Code:
+        condition = self.compile_condition(if_statement.condition)
+        statement = self.compile(if_statement.statement)
+        elifs = [
+            (self.compile_condition(elif_stmt.condition), self.compile(elif_stmt.statement))
+            for elif_stmt in if_statement.elif_statements
+        ]
+        else_statement = None
+        if if_statement.else_statement is not None:
+            else_statement = self.compile(if_statement.else_statement.statement)
+
+        def branch():
+            if condition():
+                statement()
+                return
+
+            for elif_condition, elif_statement in elifs:
+                if elif_condition():
+                    elif_statement()
+                    return
+
+            if else_statement is not None:
+                else_statement()
+
+        return branch
+
+    def compile_condition(self, node: Node) -> Code:
+        """Compiles condition of a loop or a conditional statement into code which results in True if the condition
+        is met. Verified comparisons result in a raw bool, other conditions are checked to be bool or null."""
+
+        if (applied := self._applied(node)) is not None and applied[1] is Bool:
+            return self._apply_raw(applied[0], node.left_value, node.right_value)
+
+        condition = self.compile_value(node)
+        true = values.TRUE
+
+        def check_condition():
+            if (cond := condition()) is true:
+                return True
+
+            if not cond:
+                return False
+
+            if cond.type != BOOL and cond.type != NULL:
+                raise UnexpectedTypeError(f'Expected condition to be type Bool or Null. Got {cond.type} instead.')
+
+            return cond.value is True
+
+        return check_condition
+
+    def visit_ReturnStatement(self, return_statement: ReturnStatement) -> Code:
+        if return_statement.expression is None:
+            def return_null():
+                raise ReturnException(values.NULL)
+
+            return return_null
+
+        expression = self.compile(return_statement.expression)
+
+        def return_value():
+            raise ReturnException(expression())
+
+        return return_value
+
+    def visit_InlineReturnStatement(self, inline_return_statement: InlineReturnStatement) -> Code:
+        return self.visit_ReturnStatement(inline_return_statement)
+
+    def visit_FunctionCall(self, func_call: FunctionCall) -> Code:
+        return self._call(func_call)
+
+    def _call(self, func_call: FunctionCall, unpack: bool = False) -> Code:
+        """Returns code which calls a function the same way as Interpreter. Returned variable can be unpacked
+        by the same code."""
+
+        interpreter, env = self.interpreter, self.env
+        global_scope, call_stack = env.global_scope, env.call_stack
+        fun_table, symbol_table = global_scope.fun_table, global_scope.symbol_table
+        frame_sizes = interpreter.frame_sizes
+        # returned function is called with arguments of the original call only when returning raises an exception
+        if len(func_call.arguments) > 1:
+            compiled_bodies, compile_body = self.code, self.compile
+        else:
+            compiled_bodies, compile_body = self.bodies, self.compile_body
+        type_check_arguments = interpreter.type_check_arguments
+        type_check_return_type = interpreter.type_check_return_type
+        chained_func_call_helper = interpreter.chained_func_call_helper
+
+        name = func_call.name
+        slot = interpreter.slots.get(func_call)
+        arguments_code = [self.compile(argument) for argument in func_call.arguments[0]]
+        verified = func_call in interpreter.verified
+        chained = len(func_call.arguments) > 1
+
+        def call():
+            # called function is looked up the same way as by Environment.get_variable
+            caller_frame = env.frame
+            func_def = fun_table.get(name)
+            lambda_var = None if slot is None else caller_frame.slots[slot]
+            if lambda_var is None:
+                names = caller_frame.names
+                if names is None or (lambda_var := names.get(name)) is None:
+                    lambda_var = symbol_table.get(name)
+
+            if lambda_var is not None:
+                if not isinstance(lambda_var.type, Func):
+                    raise NotCallableError(name, lambda_var.type)
+
+                func_def = lambda_var.value if lambda_var.__class__ is RuntimeVariable else lambda_var
+
+            elif not func_def:
+                raise UndefinedNameError(name)
+
+            return_type = None
+            arguments = [code() for code in arguments_code]
+
+            if not (params := func_def.parameters):
+                params = func_def.build_generic_parameters(arguments)
+
+            if not verified:
+                type_check_arguments(name, arguments, params)
+
+            if env.fun_call_nesting >= MAX_RECURSION_DEPTH:
+                raise RecursionLimitError()
+
+            # frame is created the same way as by Interpreter.create_fun_scope
+            if params is func_def.parameters and (frame_size := frame_sizes.get(func_def)) is not None:
+                frame = Frame(frame_size)
+                frame.slots[:len(arguments)] = arguments
+            else:
+                frame = Frame(frame_sizes.get(func_def, 0), {param.name: arg for param, arg in zip(params, arguments)})
+
+            call_stack.append(caller_frame)
+            env.frame = frame
+            env.fun_call_nesting += 1
+
+            body = func_def.body
+            try:
+                return_value = (compiled_bodies.get(body) or compile_body(body))()
+
+            except ReturnException as re:
+                return_value = re.value_to_return
+                # returned function is called with arguments of the original call, see Interpreter
+                if chained and (new_return_value := chained_func_call_helper(return_value, 0, func_call, caller_frame)):
+                    return_value = new_return_value
+                    return_type = new_return_value.type
+
+            env.fun_call_nesting -= 1
+            env.frame = call_stack.pop()
+
+            if not verified:
+                if return_type is None:
+                    return_type = getattr(func_def, 'return_type', 'type')
+
+                return_value = type_check_return_type(name, return_value, return_type)
+
+            elif return_value is None:
+                return values.NULL
+
+            if unpack and return_value.__class__ is RuntimeVariable:
+                return return_value.value
+
+            return return_value
+
+        return call
+
+    def visit_AssignmentStatement(self, assignment_statement: AssignmentStatement) -> Code:
+        interpreter = self.interpreter
+        value = self.compile_value(assignment_statement.right_value)
+
+        if assignment_statement not in interpreter.verified:
+            get_assignable_variable, assign_variable = interpreter.get_assignable_variable, interpreter.assign_variable
+
+            def assign_checked():
+                var = get_assignable_variable(assignment_statement)
+                assign_variable(assignment_statement, var, value())
+
+            return assign_checked
+
+        load = self._load(assignment_statement.name, interpreter.slots.get(assignment_statement))
+
+        def assign():
+            # variable is changed in place, so it does not have to be stored again
+            load().value = value()
+
+        return assign
+
+    def visit_DeclarationStatement(self, declaration_statement: DeclarationStatement) -> Code:
+        interpreter, env = self.interpreter, self.env
+        variable = declaration_statement.left_value
+
+        if declaration_statement not in interpreter.verified:
+            check_declaration = interpreter.check_declaration
+            if declaration_statement.right_value is None:
+                return partial(check_declaration, declaration_statement, variable, None)
+
+            right_value = self.compile(declaration_statement.right_value)
+
+            def declare_checked():
+                check_declaration(declaration_statement, variable, right_value())
+
+            return declare_checked
+
+        set_variable, symbol_table = env.set_variable, env.global_scope.symbol_table
+        name, typ, nullable, mutable = variable.name, variable.type, variable.nullable, variable.mutable
+        value = self.compile_value(declaration_statement.right_value)
+
+        if (slot := interpreter.slots.get(declaration_statement)) is None:
+            def declare():
+                set_variable(name, RuntimeVariable(name, typ, nullable, mutable, value()), None)
+
+            return declare
+
+        def declare_in_slot():
+            variable = RuntimeVariable(name, typ, nullable, mutable, value())
+            frame = env.frame
+            slots = frame.slots
+
+            # free slot is taken unless the name is already stored elsewhere, see Environment.set_variable
+            if slots[slot] is None and (name in symbol_table or (names := frame.names) is not None and name in names):
+                set_variable(name, variable, slot)
+            else:
+                slots[slot] = variable
+
+        return declare_in_slot
+
+    def visit_EmptyStatement(self, empty_statement: EmptyStatement) -> Code:
+        def nothing():
+            return None
+
+        return nothing
+
+    def visit_CompoundStatement(self, compound_statement: CompoundStatement) -> Code:
+        env = self.env
+        statements = [self.compile(statement) for statement in compound_statement.statements]
+
+        if (block := self.interpreter.blocks.get(compound_statement)) is None:
+            def run_statements():
+                for statement in statements:
+                    statement()
+
+            return run_statements
+
+        start, nones = block
+        end = start + len(nones)
+
+        def run_block():
+            for statement in statements:
+                statement()
+
+            env.frame.slots[start:end] = nones
+
+        return run_block
+
+    def visit_BinaryExpression(self, expression: BinaryExpression) -> Code:
+        left, right = expression.left_value, expression.right_value
+
+        if (applied := self._applied(expression)) is not None:
+            fn, result_type = applied
+            raw_value = self._apply_raw(fn, left, right)
+
+            if result_type is Bool:
+                true, false = values.TRUE, values.FALSE
+
+                def compare():
+                    return true if raw_value() else false
+
+                return compare
+
+            make_value = VALUE_CONSTRUCTORS[result_type]
+
+            def apply():
+                return make_value(raw_value())
+
+            return apply
+
+        operation = self.interpreter.operations.get(expression) or self._dispatch_operation(expression.operator)
+
+        # variable on the left side is unpacked after the right side is evaluated,
+        # unless the right side cannot change it
+        if isinstance(left, VALUE_NODES) or (isinstance(left, Identifier) and not has_calls(right)):
+            left_value = self.compile_value(left)
+            right_value = self.compile_value(right)
+
+            def binary_operation():
+                return operation(left_value(), right_value())
+
+            return binary_operation
+
+        left_code = self.compile(left)
+        right_value = self.compile_value(right)
+
+        def binary_operation_unpacking():
+            left_side = left_code()
+            right_side = right_value()
+
+            if left_side.__class__ is RuntimeVariable:
+                left_side = left_side.value
+
+            return operation(left_side, right_side)
+
+        return binary_operation_unpacking
+
+    def _applied(self, node: Node) -> Optional[tuple[Callable, type]]:
+        """Returns function of raw values and type of a result of an operation selected by TypeChecker, if node
+        is a binary expression whose sides can be evaluated in order and passed to the function as raw values."""
+
+        if not isinstance(node, BinaryExpression):
+            return None
+
+        left, right = node.left_value, node.right_value
+        if not isinstance(left, VALUE_NODES) and (not isinstance(left, Identifier) or has_calls(right)):
+            return None
+
+        return APPLIED_FUNCTIONS.get(self.interpreter.operations.get(node))
+
+    def compile_raw(self, node: Node) -> Code:
+        """Compiles a node into code which results in a raw value, which is taken from a runtime value by index.
+        Nested operations selected by TypeChecker pass raw values to each other, without creating runtime values
+        for intermediate results."""
+
+        if (applied := self._applied(node)) is not None:
+            return self._apply_raw(applied[0], node.left_value, node.right_value)
+
+        if isinstance(node, Identifier):
+            return self._load(node.name, self.interpreter.slots.get(node), raw=True)
+
+        value = self.compile_value(node)
+
+        def raw_value():
+            return value()[1]
+
+        return raw_value
+
+    def _apply_raw(self, fn: Callable, left: Node, right: Node) -> Code:
+        """Applies function of an operation directly to raw values of both sides. Constant on the right side
+        is captured and variable on the left side of a constant is loaded by the same code, which saves calls."""
+
+        if not isinstance(right, Literal):
+            left_value, right_value = self.compile_raw(left), self.compile_raw(right)
+
+            def apply():
+                return fn(left_value(), right_value())
+
+            return apply
+
+        constant = values.from_literal(right).value
+
+        if not isinstance(left, Identifier):
+            left_value = self.compile_raw(left)
+
+            def apply_to_constant():
+                return fn(left_value(), constant)
+
+            return apply_to_constant
+
+        env, symbol_table = self.env, self.env.global_scope.symbol_table
+        name, slot = left.name, self.interpreter.slots.get(left)
+        load_name = self._load(name, None)
+
+        if slot is None:
+            def apply_name_to_constant():
+                names = env.frame.names
+                if names is None or (var := names.get(name)) is None:
+                    if (var := symbol_table.get(name)) is None:
+                        raise UndefinedNameError(name)
+
+                return fn((var.value if var.__class__ is RuntimeVariable else var)[1], constant)
+
+            return apply_name_to_constant
+
+        def apply_slot_to_constant():
+            if (var := env.frame.slots[slot]) is None:
+                var = load_name()
+
+            return fn((var.value if var.__class__ is RuntimeVariable else var)[1], constant)
+
+        return apply_slot_to_constant
+
+    def _dispatch_operation(self, operator: Any) -> Callable:
+        """Returns operation, which looks up operation for types of both sides on every execution. Operations found
+        for types seen by the expression are cached, keyed by classes of types, which are hashed faster than operator.
+        Combinations which are not allowed are handled by generic methods of interpreter, which raise errors."""
+
+        generic_operation = self.interpreter.binary_operations[operator]
+        operations: dict[tuple[type, type], BinaryOperation] = {}
+
+        def dispatch(left_side, right_side):
+            try:
+                operation = operations[left_side.type.__class__, right_side.type.__class__]
+            except KeyError:
+                key = left_side.type.__class__, right_side.type.__class__
+                operation = operations[key] = BINARY_OPERATIONS.get((operator, *key), generic_operation)
+            except AttributeError:
+                operation = generic_operation
+
+            return operation(left_side, right_side)
+
+        return dispatch
+
+    # every kind of binary expression is compiled with the same logic as visit_BinaryExpression
+    visit_NullCoalesceExpression = visit_BinaryExpression
+    visit_OrExpression = visit_BinaryExpression
+    visit_AndExpression = visit_BinaryExpression
+    visit_EqualityExpression = visit_BinaryExpression
+    visit_AdditiveExpression = visit_BinaryExpression
+    visit_MultiplicativeExpression = visit_BinaryExpression
+
+    def visit_CompFactor(self, comp_factor: CompFactor) -> Code:
+        if not comp_factor.negation:
+            return self.compile(comp_factor.factor)
+
+        return self._unary(self.interpreter.logic_not, comp_factor.factor)
+
+    def visit_NegFactor(self, neg_factor: NegFactor) -> Code:
+        if not neg_factor.minus:
+            return self.compile(neg_factor.factor)
+
+        return self._unary(self.interpreter.unary_minus, neg_factor.factor)
+
+    def visit_UnaryNot(self, unary_not: UnaryNot) -> Code:
+        return self._unary(self.interpreter.logic_not, unary_not.operand)
+
+    def visit_UnaryMinus(self, unary_minus: UnaryMinus) -> Code:
+        return self._unary(self.interpreter.unary_minus, unary_minus.operand)
+
+    def _unary(self, operation: Callable, operand: Node) -> Code:
+        operand_value = self.compile_value(operand)
+
+        def unary_operation():
+            return operation(operand_value())
+
+        return unary_operation
+
+    def visit_Factor(self, factor: Factor) -> Code:
+        return self.compile(factor.value)
+
+    def visit_Literal(self, literal: Literal) -> Code:
+        value = values.from_literal(literal)
+
+        def constant():
+            return value
+
+        return constant
+
+    def visit_Identifier(self, identifier: Identifier) -> Code:
+        return self._load(identifier.name, self.interpreter.slots.get(identifier))
+
+    def _load_value(self, identifier: Identifier) -> Code:
+        return self._load(identifier.name, self.interpreter.slots.get(identifier), unpack=True)
+
+    def _load(self, name: str, slot: Optional[int], unpack: bool = False, raw: bool = False) -> Code:
+        """Returns code which gets a variable from its slot or by its name, the same as Environment.get_variable.
+        Variable can be unpacked, or its raw value can be taken, by the same code, which saves calls."""
+
+        env = self.env
+        symbol_table = env.global_scope.symbol_table
+
+        def load_name():
+            names = env.frame.names
+            if names is not None and (var := names.get(name)) is not None:
+                return var
+
+            if (var := symbol_table.get(name)) is None:
+                raise UndefinedNameError(name)
+
+            return var
+
+        if slot is None and raw:
+            def load_name_raw():
+                names = env.frame.names
+                if names is None or (var := names.get(name)) is None:
+                    if (var := symbol_table.get(name)) is None:
+                        raise UndefinedNameError(name)
+
+                return (var.value if var.__class__ is RuntimeVariable else var)[1]
+
+            return load_name_raw
+
+        if slot is None and unpack:
+            def load_name_value():
+                names = env.frame.names
+                if names is None or (var := names.get(name)) is None:
+                    if (var := symbol_table.get(name)) is None:
+                        raise UndefinedNameError(name)
+
+                return var.value if var.__class__ is RuntimeVariable else var
+
+            return load_name_value
+
+        if slot is None:
+            return load_name
+
+        if raw:
+            def load_slot_raw():
+                if (var := env.frame.slots[slot]) is None:
+                    var = load_name()
+
+                return (var.value if var.__class__ is RuntimeVariable else var)[1]
+
+            return load_slot_raw
+
+        if unpack:
+            def load_slot_value():
+                if (var := env.frame.slots[slot]) is None:
+                    var = load_name()
+
+                return var.value if var.__class__ is RuntimeVariable else var
+
+            return load_slot_value
+
+        def load_slot():
+            if (var := env.frame.slots[slot]) is not None:
+                return var
+
+            # variable declared outside blocks of a function or a generic parameter
+            return load_name()
+
+        return load_slot
+
+    def visit_Parameter(self, parameter: Parameter) -> Code:
+        return self._delegate(self.interpreter.visit_Parameter, parameter)
+
+    def visit_Variable(self, variable: Variable) -> Code:
+        return self._delegate(self.interpreter.visit_Variable, variable)
+
+    def visit_Print(self, builtin: builtins.Print) -> Code:
+        return self._delegate(self.interpreter.visit_Print, builtin)
+
+    def visit_String(self, builtin: builtins.String) -> Code:
+        return self._delegate(self.interpreter.visit_String, builtin)
+
+    def visit_Boolean(self, builtin: builtins.Boolean) -> Code:
+        return self._delegate(self.interpreter.visit_Boolean, builtin)
+
+    def visit_Float(self, builtin: builtins.Float) -> Code:
+        return self._delegate(self.interpreter.visit_Float, builtin)
+
+    def visit_Integer(self, builtin: builtins.Integer) -> Code:
+        return self._delegate(self.interpreter.visit_Integer, builtin)
+
+
+class ClosureInterpreter(Interpreter):
+    """Interpreter which compiles a program into closures (see ClosureCompiler) before running it.
+    Results, output and errors are the same as of Interpreter."""
+
+    def __init__(self, parser: Parser, optimization_level: int = NO_OPTIMIZATION):
+        super().__init__(parser, optimization_level)
+        self.compiler = None
+
+    def prepare(self, program: Program):
+        super().prepare(program)
+        self.compiler = ClosureCompiler(self)
+
+    def visit(self, node: Any):
+        """Runs compiled code of a node, compiling it the first time the node is visited."""
+        return self.compiler.compile(node)()
@@ -1,81 +1,87 @@
-from typing import Any
+from typing import Any, Optional
 
-from src.interpreter.scopes import Scope, GlobalScope
+from src.interpreter.scopes import Frame, GlobalScope
 from src.parser.objects.builtins import Print, String, Integer, Float, Boolean
 from src.parser.objects.objects import FunctionDefinition
 
 
 class Environment:
     """
-    Environment consists of GlobalScope and a call stack. Global scope is visible everywhere and consists
+    Environment consists of GlobalScope and a call stack of frames. Global scope is visible everywhere and consists
     of variables and function definitions. Function Definitions are treated like variables with func type but
-    are stored separated from them.
+    are stored separated from them. Every function call gets its own frame, which holds its local variables
+    in slots assigned by Resolver.
 
     Environment class is capable of:
-    - creating new function and local scopes and removing them,
-    - setting and getting variables from a current scope or above,
+    - creating new function frames and removing them,
+    - setting and getting variables from a current frame or the global scope,
     - adding and retrieving function definition from a global scope
     """
 
-    def __init__(self):
+    def __init__(self, frame_size: int = 0):
         self.global_scope = GlobalScope()
         self._add_builtin_fun_defs()
 
-        self.current_scope = self.global_scope
+        self.frame = Frame(frame_size)
         self.call_stack = []
         self.fun_call_nesting = 0
 
-    def set_variable(self, var: str, evaluated_value: Any):
-        """Sets a variable on the current scope."""
+    def set_variable(self, var: str, evaluated_value: Any, slot: Optional[int] = None):
+        """If variable exists in current frame or global scope, then reassign value.
+        Otherwise add a new variable in its slot, or to the global scope if it has no slot."""
 
-        self.current_scope.set_variable(var, evaluated_value)
+        slots = self.frame.slots
+        if slot is not None and slots[slot] is not None:
+            slots[slot] = evaluated_value
+            return
 
-    def get_variable(self, var: str):
-        """Tries to get a variable while traversing through scopes,
-        starting on current scope. Functions are also treated like variables!"""
-        return self.current_scope.get_variable(var)
+        names = self.frame.names
+        if names is not None and var in names:
+            names[var] = evaluated_value
 
-    def get_variable_or_func_def(self, var):
-        return self.current_scope.get_variable(var) or self.global_scope.get_fun_def(var)
+        elif slot is None or var in self.global_scope.symbol_table:
+            self.global_scope.symbol_table[var] = evaluated_value
 
-    def create_new_local_scope(self) -> None:
-        """Creates a new scope, whose parent is a previous scope."""
+        else:
+            slots[slot] = evaluated_value
 
-        new_scope = Scope(self.current_scope)
-        self.current_scope = new_scope
+    def get_variable(self, var: str, slot: Optional[int] = None):
+        """Tries to get a variable from its slot in current frame, then by its name from current frame
+        and the global scope. Functions are also treated like variables!"""
 
-    def destroy_local_scope(self) -> None:
-        """Destroys local scope by setting current scope to current scope's parent."""
+        if slot is not None and (value := self.frame.slots[slot]) is not None:
+            return value
 
-        self.current_scope = self.current_scope.parent_scope
+        names = self.frame.names
+        if names is not None and (value := names.get(var)) is not None:
+            return value
 
-    def create_new_fun_scope(self, parameters: list, arguments: list) -> None:
-        """Creates a function scope to store its parameters inside."""
+        return self.global_scope.symbol_table.get(var)
 
-        parameters_scope = self._put_parameters_inside_new_scope(parameters, arguments)
-        self.call_stack.append(self.current_scope)
-        self.current_scope = parameters_scope
-        self.fun_call_nesting += 1
-
-    def destroy_fun_scope(self) -> None:
-        """Removes current scope, decreases func call nesting and restores scope before function call from call stack.
-        If there is nothing on a call stack, then the previous scope was the global scope."""
+    def clear_slots(self, start: int, nones: tuple) -> None:
+        """Removes variables of a block which is left by overwriting its slots with given Nones."""
 
-        self.current_scope = None
-        self.fun_call_nesting -= 1
+        self.frame.slots[start:start + len(nones)] = nones
 
-        # restore previous scope
-        self.current_scope = self.call_stack.pop() if self.call_stack else self.global_scope
+    def create_new_fun_scope(self, parameters: list, arguments: list, frame_size: int = 0, in_slots: bool = False):
+        """Creates a function frame to store its parameters inside. Resolved parameters are stored
+        in first slots, generic ones by their names."""
 
-    def _put_parameters_inside_new_scope(self, parameters: list, arguments: list) -> Scope:
-        """Creates a new scope for function to store its parameters and arguments."""
+        if in_slots:
+            frame = Frame(frame_size)
+            frame.slots[:len(arguments)] = arguments
+        else:
+            frame = Frame(frame_size, {param.name: arg for param, arg in zip(parameters, arguments)})
 
-        fun_scope = Scope(self.global_scope)
+        self.call_stack.append(self.frame)
+        self.frame = frame
+        self.fun_call_nesting += 1
 
-        for param, arg in zip(parameters, arguments):
-            fun_scope.symbol_table[param.name] = arg
+    def destroy_fun_scope(self) -> None:
+        """Removes current frame, decreases func call nesting and restores frame before function call."""
 
-        return fun_scope
+        self.fun_call_nesting -= 1
+        self.frame = self.call_stack.pop()
 
     def add_fun_def(self, fun_def: FunctionDefinition) -> None:
         """Adds function definition to the global scope."""
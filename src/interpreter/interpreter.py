@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 
 from src.errors.interpreter import (
     DivisionByZeroError, UnexpectedTypeError, UndefinedNameError, NotCallableError,
@@ -8,21 +8,29 @@ from src.errors.interpreter import (
     ConstAssignmentError,
     AssignmentTypeMismatchError, ReturnOutsideOfFunctionError, ArgumentTypeError
 )
+from src.interpreter.checker import TypeChecker
 from src.interpreter.environment import Environment
+from src.interpreter import values
+from src.interpreter.operations import BINARY_OPERATIONS, BinaryOperation
+from src.interpreter.optimizer import Optimizer, NO_OPTIMIZATION
+from src.interpreter.resolver import Resolver
+from src.interpreter.scopes import Frame
+from src.interpreter.values import RuntimeVariable
 from src.interpreter.visitor import Visitor
 from src.parser import Parser
 from src.parser.objects import builtins
 from src.parser.objects.objects import (
-    FunctionDefinition, ReturnStatement, FunctionCall, CompFactor, NegFactor,
+    Node, FunctionDefinition, ReturnStatement, FunctionCall, CompFactor, NegFactor,
     Factor, Literal, Identifier, Parameter, WhileLoopStatement, BinaryExpression, IfStatement, InlineReturnStatement,
     LambdaExpression, CompoundStatement, EmptyStatement, AssignmentStatement,
-    DeclarationStatement, Variable, OrExpression, AndExpression
+    DeclarationStatement, Variable, UnaryNot, UnaryMinus
 )
 from src.parser.objects.program import Program
 from src.parser.types import (
     Integer, Float, Null, LogicOperator, ArithmeticOperator, ComparisonOperator,
     OtherOperator,
-    Bool, String, Void, Type, value_to_string
+    Bool, String, Void, Func, Type, value_to_string,
+    INTEGER, FLOAT, BOOL, STRING, NULL,
 )
 
 MAX_RECURSION_DEPTH = 60
@@ -31,27 +39,25 @@ MAX_RECURSION_DEPTH = 60
 # noinspection PyMethodMayBeStatic
 class Interpreter(Visitor):
 
-    def __init__(self, parser: Parser):
+    def __init__(self, parser: Parser, optimization_level: int = NO_OPTIMIZATION):
         self.parser = parser
+        self.optimization_level = optimization_level
         self.env = None
 
-    def interpret(self):
-        """Interpreter's entrypoint. Prepares environment,
-        asks parser to parse the program and then starts visiting it."""
+        # resolution of a running program, see Resolver
+        self.slots: dict[Node, int] = {}
+        self.frame_sizes: dict[Node, int] = {}
+        self.blocks: dict[CompoundStatement, tuple[int, tuple]] = {}
 
-        self.env = Environment()
-        program = self.parser.parse_program()
-        try:
-            self.visit(program)
-
-        except ReturnException:
-            raise ReturnOutsideOfFunctionError()
+        # nodes whose type checks are known to pass and operations specialised ahead of execution, see TypeChecker
+        self.verified: set[Node] = set()
+        self.operations: dict[BinaryExpression, BinaryOperation] = {}
 
-    @property
-    def binary_operations(self):
-        """Operators mapped to method handling their behaviour."""
+        # literals of a running program mapped to their values
+        self.constants: dict[Literal, Any] = {}
 
-        return {
+        # operators mapped to method handling their behaviour for any types
+        self.binary_operations = {
             LogicOperator.AND: self.logic_and,
             LogicOperator.OR: self.logic_or,
             ArithmeticOperator.DIV: self.div,
@@ -68,6 +74,42 @@ class Interpreter(Visitor):
             OtherOperator.NULL_COALESCE: self.null_coalesce
         }
 
+    def interpret(self):
+        """Interpreter's entrypoint. Asks parser to parse the program, optimises it and then runs it."""
+
+        self.run(self.optimize(self.parser.parse_program()))
+
+    def optimize(self, program: Program) -> Program:
+        """Returns optimised copy of a program, see Optimizer. Original program is not modified."""
+
+        return Optimizer(self.optimization_level).optimize(program)
+
+    def run(self, program: Program):
+        """Checks types of a program and starts visiting it in a fresh environment. Program is never modified,
+        so the same program can be run many times, also by several interpreters at once."""
+
+        self.prepare(program)
+        try:
+            self.visit(program)
+
+        except ReturnException:
+            raise ReturnOutsideOfFunctionError()
+
+    def prepare(self, program: Program):
+        """Checks types and resolves variables of a program, then creates a fresh environment to run it in."""
+
+        verification = TypeChecker().check(program)
+        self.verified = verification.verified
+        self.operations = verification.operations
+
+        resolution = Resolver().resolve(program)
+        self.slots = resolution.slots
+        self.frame_sizes = resolution.frame_sizes
+        self.blocks = resolution.blocks
+
+        self.env = Environment(self.frame_sizes[program])
+        self.constants = {}
+
     def visit_Program(self, program: Program):
         """Visits all nodes in program."""
 
@@ -83,7 +125,7 @@ class Interpreter(Visitor):
         """While condition is true, keeps visiting while loop's statement."""
 
         while cond := self.unpack_variable(self.visit(while_loop_statement.condition)):
-            if cond.type != Bool() and cond.type != Null():
+            if cond.type != BOOL and cond.type != NULL:
                 raise UnexpectedTypeError(f'Expected condition to be type Bool or Null. Got {cond.type} instead.')
 
             if not cond.value:
@@ -98,7 +140,7 @@ class Interpreter(Visitor):
 
         if cond := self.unpack_variable(self.visit(if_statement.condition)):
             # condition has to be bool, otherwise it is a semantic error
-            if cond.type != Bool() and cond.type != Null():
+            if cond.type != BOOL and cond.type != NULL:
                 raise UnexpectedTypeError(f'Expected condition to be type Bool or Null. Got {cond.type} instead.')
 
             if cond.value is True:
@@ -109,8 +151,8 @@ class Interpreter(Visitor):
         # if condition happens to be true, then do not execute further
         # condition has to be bool, otherwise it is a semantic error
         for elif_stmt in if_statement.elif_statements:
-            if cond := self.visit(elif_stmt.condition):
-                if cond.type != Bool() and cond.type != Null():
+            if cond := self.unpack_variable(self.visit(elif_stmt.condition)):
+                if cond.type != BOOL and cond.type != NULL:
                     raise UnexpectedTypeError(f'Expected condition to be type Bool or Null. Got {cond.type} instead.')
 
                 if cond.value is True:
@@ -126,7 +168,7 @@ class Interpreter(Visitor):
 
         if return_statement.expression is None:
             # empty return statement means that function returned void
-            return_value = Literal(typ=Null(), value=None)
+            return_value = values.NULL
             raise ReturnException(return_value)
 
         return_value = self.visit(return_statement.expression)
@@ -146,17 +188,8 @@ class Interpreter(Visitor):
         """Visits FunctionCall and executes a function or callable variable. Supports chained function calls."""
 
         fn_name = func_call.name
-        func_def = self.env.get_fun_def(fn_name)
-        lambda_var = self.env.get_variable(fn_name)
-
-        if not func_def and not lambda_var:
-            raise UndefinedNameError(fn_name)
-
-        if lambda_var is not None and str(lambda_var.type) != "Func":
-            raise NotCallableError(fn_name, lambda_var.type)
-
-        if lambda_var:
-            func_def = self.unpack_variable(lambda_var)
+        func_def = self.get_called_function(fn_name, self.slots.get(func_call))
+        caller_frame = self.env.frame
 
         return_type = getattr(func_def, 'return_type', 'type')
 
@@ -169,26 +202,58 @@ class Interpreter(Visitor):
         if not (params := func_def.parameters):
             params = func_def.build_generic_parameters(arguments)
 
-        self.type_check_arguments(fn_name, arguments, params)
+        verified = func_call in self.verified
+        if not verified:
+            self.type_check_arguments(fn_name, arguments, params)
 
         if self.env.fun_call_nesting >= MAX_RECURSION_DEPTH:
             raise RecursionLimitError()
 
-        self.env.create_new_fun_scope(params, arguments)
+        self.create_fun_scope(func_def, params, arguments)
 
         try:
-            return_value = self.visit(func_def.body)
+            return_value = self.run_function_body(func_def, func_call)
 
         except ReturnException as re:
             return_value = re.value_to_return
             # check if return_value is callable
             # and call it if there are more arguments on stack
-            if new_return_value := self.chained_func_call_helper(return_value, index, func_call):
+            if new_return_value := self.chained_func_call_helper(return_value, index, func_call, caller_frame):
                 return_value = new_return_value
                 return_type = new_return_value.type
 
         self.env.destroy_fun_scope()
 
+        return self.check_return_value(fn_name, return_value, return_type, verified)
+
+    def run_function_body(self, func_def: FunctionDefinition | LambdaExpression, func_call: FunctionCall):
+        """Runs body of a called function in its already created frame.
+        Returns value of the body or raises ReturnException with returned value."""
+        return self.visit(func_def.body)
+
+    def get_called_function(self, fn_name: str, slot: Optional[int]) -> FunctionDefinition | LambdaExpression:
+        """Returns called function, which is either a defined function or a lambda stored in a variable."""
+
+        func_def = self.env.get_fun_def(fn_name)
+        lambda_var = self.env.get_variable(fn_name, slot)
+
+        if not func_def and not lambda_var:
+            raise UndefinedNameError(fn_name)
+
+        if lambda_var is not None and not isinstance(lambda_var.type, Func):
+            raise NotCallableError(fn_name, lambda_var.type)
+
+        if lambda_var:
+            func_def = self.unpack_variable(lambda_var)
+
+        return func_def
+
+    def check_return_value(self, fn_name: str, return_value: Any, return_type: Type, verified: bool):
+        """Returns value returned by a function, checking its type unless the call was verified."""
+
+        if verified:
+            return values.NULL if return_value is None else return_value
+
         return self.type_check_return_type(fn_name, return_value, return_type)
 
     def type_check_arguments(self, fn_name: str, arguments: list, params: list):
@@ -210,13 +275,13 @@ class Interpreter(Visitor):
         """Raises error if return_value is None but return type was not Void/Null,
         if types generally do not match. If error was not raised then type is valid."""
 
-        if return_value is None and return_type != Null():
-            raise ReturnTypeMismatchError(fn_name, return_type, Null())
+        if return_value is None and return_type != NULL:
+            raise ReturnTypeMismatchError(fn_name, return_type, NULL)
 
-        if return_value is None and return_type == Null():
-            return Literal(typ=Null(), value=None)
+        if return_value is None and return_type == NULL:
+            return values.NULL
 
-        if return_value.type == Float() and return_type == Integer():
+        if return_value.type == FLOAT and return_type == INTEGER:
             # print(f"Warning casting float to integer in {fn_name}")
             return return_value
 
@@ -225,16 +290,35 @@ class Interpreter(Visitor):
 
         return return_value
 
-    def chained_func_call_helper(self, return_value: Literal | LambdaExpression, index: int, func_call: FunctionCall):
+    def create_fun_scope(self, func_def: FunctionDefinition | LambdaExpression, params: list, arguments: list):
+        """Creates a frame for a function call. Declared parameters of a resolved function are stored in slots,
+        other ones (generic parameters, builtins' parameters) by their names."""
+
+        frame_size = self.frame_sizes.get(func_def, 0)
+        in_slots = params is func_def.parameters and func_def in self.frame_sizes
+        self.env.create_new_fun_scope(params, arguments, frame_size, in_slots)
+
+    def visit_arguments(self, arguments: list, frame: Frame) -> list:
+        """Visits arguments in a given frame, which is a frame of a function call they belong to."""
+
+        current_frame, self.env.frame = self.env.frame, frame
+        try:
+            return [self.visit(arg) for arg in arguments]
+        finally:
+            self.env.frame = current_frame
+
+    def chained_func_call_helper(
+            self, return_value: Literal | LambdaExpression, index: int, func_call: FunctionCall, caller_frame: Frame
+    ):
         """Helper functions to keep on checking if returned value is callable
         and calling it if there are more arguments from original func_call arguments stack."""
 
         while index < len(func_call.arguments) - 1:
             match return_value:
                 case LambdaExpression() | FunctionDefinition():
-                    arguments = [self.visit(arg) for arg in func_call.arguments[index]]
+                    arguments = self.visit_arguments(func_call.arguments[index], caller_frame)
                     generic_parameters = return_value.build_generic_parameters(return_value.parameters)
-                    self.env.create_new_fun_scope(generic_parameters, arguments)
+                    self.create_fun_scope(return_value, generic_parameters, arguments)
                     prev = return_value
 
                     try:
@@ -243,7 +327,7 @@ class Interpreter(Visitor):
                     except ReturnException as re:
                         return_value = re.value_to_return
 
-                    if new_ret := self.chained_func_call_helper(return_value, index + 1, func_call):
+                    if new_ret := self.chained_func_call_helper(return_value, index + 1, func_call, caller_frame):
                         self.env.destroy_fun_scope()
                         return self.type_check_return_type(
                             func_call.name + f"_inner_{index}",
@@ -264,49 +348,78 @@ class Interpreter(Visitor):
     def visit_AssignmentStatement(self, assignment_statement: AssignmentStatement):
         """Visits AssignmentStatement"""
 
+        if assignment_statement in self.verified:
+            var = self.get_assigned_variable(assignment_statement)
+            var.value = self.unpack_variable(self.visit(assignment_statement.right_value))
+            self.env.set_variable(assignment_statement.name, var, self.slots.get(assignment_statement))
+            return
+
+        var = self.get_assignable_variable(assignment_statement)
+
+        # variable stores a value, not another variable
+        rvalue = self.unpack_variable(self.visit(assignment_statement.right_value))
+        self.assign_variable(assignment_statement, var, rvalue)
+
+    def get_assigned_variable(self, assignment_statement: AssignmentStatement) -> Any:
+        """Returns variable changed by an assignment."""
+
         var_name = assignment_statement.name
-        if not (var := self.env.get_variable(var_name)):
+        if not (var := self.env.get_variable(var_name, self.slots.get(assignment_statement))):
             raise UndefinedNameError(var_name)
 
-        # if a value came from function call, then it could be Literal or Lambda instead of expected Variable
+        return var
+
+    def get_assignable_variable(self, assignment_statement: AssignmentStatement) -> RuntimeVariable:
+        """Returns variable changed by an assignment, if a value can be assigned to it."""
+
+        var_name = assignment_statement.name
+        var = self.get_assigned_variable(assignment_statement)
+
+        # if a value came from function call, then it could be a value or Lambda instead of expected variable
         # in this case, variable is both mutable and nullable
-        if not isinstance(var, Variable):
-            var = Variable(var_name, typ=var.type, nullable=True, mutable=True)
+        if not isinstance(var, RuntimeVariable):
+            var = RuntimeVariable(var_name, typ=var.type, nullable=True, mutable=True)
 
         # if variable is const, then there is no way to reassign value to it
         if not var.mutable:
             raise ConstAssignmentError(var_name)
 
-        rvalue = self.visit(assignment_statement.right_value)
+        return var
+
+    def assign_variable(self, assignment_statement: AssignmentStatement, var: RuntimeVariable, rvalue: Any):
+        """Checks type of an assigned value and stores it in a variable."""
+
+        var_name = assignment_statement.name
+        slot = self.slots.get(assignment_statement)
 
         # if variable not is nullable and rvalue is null
-        if not var.nullable and rvalue.type == Null():
+        if not var.nullable and rvalue.type == NULL:
             raise NotNullableError(var_name)
 
         # cast integer to float, keeping variable's value type float
-        if var.type == Float() and rvalue.type == Integer():
-            var.value = Literal(typ=Float(), value=rvalue.value)
-            self.env.set_variable(assignment_statement.name, var)
+        if var.type == FLOAT and rvalue.type == INTEGER:
+            var.value = values.from_float(rvalue.value)
+            self.env.set_variable(assignment_statement.name, var, slot)
             return
 
         if var.type != rvalue.type:
             raise AssignmentTypeMismatchError(var.name, var.type, rvalue.type)
 
         var.value = rvalue
-        self.env.set_variable(assignment_statement.name, var)
+        self.env.set_variable(assignment_statement.name, var, slot)
 
     def visit_EmptyStatement(self, empty_statement: EmptyStatement):
         """Visits EmptyStatement and immediately returns None since there are no instructions to be run."""
         return
 
     def visit_CompoundStatement(self, compound_statement: CompoundStatement):
-        """Visits CompoundStatement, which a list of statements, creating new local scope."""
-        self.env.create_new_local_scope()
+        """Visits CompoundStatement, which a list of statements. Variables declared inside are removed afterwards."""
 
         for statement in compound_statement.statements:
             self.visit(statement)
 
-        self.env.destroy_local_scope()
+        if (block := self.blocks.get(compound_statement)) is not None:
+            self.env.clear_slots(*block)
 
     def visit_DeclarationStatement(self, declaration_statement: DeclarationStatement):
         """Visits DeclarationStatement by visiting its left side with is always a Variable,
@@ -314,9 +427,18 @@ class Interpreter(Visitor):
 
         variable = self.visit(declaration_statement.left_value)
 
-        if rvalue := declaration_statement.right_value:
+        if declaration_statement in self.verified:
+            self.declare_variable(declaration_statement, variable, self.visit(declaration_statement.right_value))
+            return
+
+        value = self.visit(rvalue) if (rvalue := declaration_statement.right_value) else None
+        self.check_declaration(declaration_statement, variable, value)
 
-            value = self.visit(rvalue)
+    def check_declaration(self, declaration_statement: DeclarationStatement, variable: Variable, value: Any):
+        """Checks if a variable can be declared with a value of its right side (or None if there is none)
+        and declares it."""
+
+        if value is not None:
             match value.type:
                 # Invalid cases:
                 # const/let a: int = f();   // where f returns void
@@ -326,20 +448,19 @@ class Interpreter(Visitor):
                     raise NotNullableError(variable.name)
 
                 # if there already is an immutable variable with the same name, cannot reassign value
-                case _ if (var := self.env.get_variable(variable.name)) and not var.mutable:
+                case _ if (var := self.env.get_variable(variable.name, self.slots.get(declaration_statement))) \
+                          and not var.mutable:
                     raise ConstRedeclarationError(variable.name)
 
                 case _:
                     # convert integer to float and keep float type
-                    if variable.type == Float() and value.type == Integer():
-                        variable.value = Literal(typ=Float(), value=value.value)
-                        self.env.set_variable(variable.name, variable)
+                    if variable.type == FLOAT and value.type == INTEGER:
+                        self.declare_variable(declaration_statement, variable, values.from_float(value.value))
                         return
 
                     # types match or variable nullable and right side is null
-                    if variable.type == value.type or (variable.nullable and value.type == Null()):
-                        variable.value = value
-                        self.env.set_variable(variable.name, variable)
+                    if variable.type == value.type or (variable.nullable and value.type == NULL):
+                        self.declare_variable(declaration_statement, variable, value)
                         return
 
                     if variable.type != value.type:
@@ -351,44 +472,57 @@ class Interpreter(Visitor):
 
         # let a?: int;      <- mutable and nullable variable can be uninitialized
         if variable.nullable:
-            variable.value = Literal(typ=Null(), value=None)
-            self.env.set_variable(variable.name, variable)
+            self.declare_variable(declaration_statement, variable, values.NULL)
             return
 
         # let a: int;       <- mutable variable has to be marked as nullable, otherwise lack of rvalue is an error
         raise NotNullableError(variable.name)
 
+    def declare_variable(self, declaration_statement: DeclarationStatement, variable: Variable, value: Any) -> None:
+        """Creates a new runtime variable described by declaration's Variable node and sets it in its slot."""
+
+        self.env.set_variable(
+            variable.name,
+            RuntimeVariable(
+                variable.name, variable.type, variable.nullable, variable.mutable, self.unpack_variable(value)
+            ),
+            self.slots.get(declaration_statement)
+        )
+
     def visit_BinaryExpression(self, expression: BinaryExpression):
         """Visits left and right sides, performs operation based on operator."""
 
         lvalue = self.visit(expression.left_value)
         operator = expression.operator
         rvalue = self.visit(expression.right_value)
-        return self.binary_operations[operator](lvalue, rvalue)
 
-    def visit_NullCoalesceExpression(self, expression):
-        """"""
-        return self.visit_BinaryExpression(expression)
+        # types of both sides are known, operation does not have to be looked up
+        if (operation := self.operations.get(expression)) is not None:
+            return operation(self.unpack_variable(lvalue), self.unpack_variable(rvalue))
+
+        return self.binary_operation(operator, lvalue, rvalue)
 
-    def visit_OrExpression(self, expression: OrExpression):
-        """Visits OrExpression with the same logic as visit_BinaryExpression"""
-        return self.visit_BinaryExpression(expression)
+    def binary_operation(self, operator: Any, left_side: Any, right_side: Any):
+        """Jumps straight to operation specialised for operator and types of both sides.
+        Combinations which are not allowed are handled by generic methods, which raise appropriate errors."""
 
-    def visit_AndExpression(self, expression: AndExpression):
-        """Visits AndExpression with the same logic as visit_BinaryExpression"""
-        return self.visit_BinaryExpression(expression)
+        left_value, right_value = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
-    def visit_EqualityExpression(self, expression):
-        """Visits EqualityExpression with the same logic as visit_BinaryExpression"""
-        return self.visit_BinaryExpression(expression)
+        try:
+            operation = BINARY_OPERATIONS[operator, left_value.type.__class__, right_value.type.__class__]
+        except (KeyError, AttributeError):
+            return self.binary_operations[operator](left_side, right_side)
 
-    def visit_AdditiveExpression(self, expression):
-        """Visits AdditiveExpression with the same logic as visit_BinaryExpression"""
-        return self.visit_BinaryExpression(expression)
+        return operation(left_value, right_value)
 
-    def visit_MultiplicativeExpression(self, expression):
-        """Visits MultiplicativeExpression with the same logic as visit_BinaryExpression"""
-        return self.visit_BinaryExpression(expression)
+    # every kind of binary expression is visited with the same logic as visit_BinaryExpression,
+    # methods are aliased so that visiting them does not take an extra Python frame
+    visit_NullCoalesceExpression = visit_BinaryExpression
+    visit_OrExpression = visit_BinaryExpression
+    visit_AndExpression = visit_BinaryExpression
+    visit_EqualityExpression = visit_BinaryExpression
+    visit_AdditiveExpression = visit_BinaryExpression
+    visit_MultiplicativeExpression = visit_BinaryExpression
 
     def visit_CompFactor(self, comp_factor: CompFactor):
         """Visits CompFactor and potentially negates a result of factor visitation with logical `not`."""
@@ -410,18 +544,33 @@ class Interpreter(Visitor):
 
         return self.unary_minus(literal)
 
+    def visit_UnaryNot(self, unary_not: UnaryNot):
+        """Visits operand of UnaryNot and negates the result with logical `not`."""
+        return self.logic_not(self.visit(unary_not.operand))
+
+    def visit_UnaryMinus(self, unary_minus: UnaryMinus):
+        """Visits operand of UnaryMinus and negates the result with arithmetic `-`."""
+        return self.unary_minus(self.visit(unary_minus.operand))
+
     def visit_Factor(self, factor: Factor):
         """Visits Factor which cases visitation of its value."""
         return self.visit(factor.value)
 
     def visit_Literal(self, literal: Literal):
-        """Visits Literal and returns it."""
-        return literal
+        """Visits Literal and returns its runtime value. Literal itself is never returned,
+        so values cannot be used to change the program tree. Values are immutable,
+        so every literal is converted only once per run."""
+
+        try:
+            return self.constants[literal]
+        except KeyError:
+            value = self.constants[literal] = values.from_literal(literal)
+            return value
 
     def visit_Identifier(self, identifier: Identifier):
-        """Visits Identifier and tries to return a variable by its name in current scope or above."""
+        """Visits Identifier and tries to return a variable from its slot in current frame or by its name."""
 
-        if not (var := self.env.get_variable(identifier.name)):
+        if not (var := self.env.get_variable(identifier.name, self.slots.get(identifier))):
             raise UndefinedNameError(identifier.name)
 
         return var
@@ -437,19 +586,17 @@ class Interpreter(Visitor):
     def visit_Print(self, builtin: builtins.Print):
         """Visits builtin `print` function which prints any number of arguments."""
 
-        values = []
-        for param in builtin.parameters_list:
-            var = self.env.get_variable(param.name)
+        # print accepts any number of arguments, all of them are stored by name in function's frame
+        strings = []
+        for var in self.env.frame.names.values():
             printable = self.unpack_variable(var)
 
-            if str(printable.type) == "Func":
+            if isinstance(printable.type, Func):
                 raise UnexpectedTypeError(f"Function print does not accept argument type {printable.type}")
 
-            values.append(value_to_string(printable.value))
+            strings.append(value_to_string(printable.value))
 
-        print(*values)
-
-        builtin.parameter_list = None
+        print(*strings)
 
     def visit_String(self, builtin: builtins.String) -> Literal:
         """Visits builtin `String` function which casts an argument to string type."""
@@ -457,10 +604,10 @@ class Interpreter(Visitor):
         param = builtin.parameters_list[0]
         var = self.unpack_variable(self.env.get_variable(param.name))
 
-        if str(var.type) == "Func":
+        if isinstance(var.type, Func):
             raise UnexpectedTypeError(f"Function print does not accept argument type {var.type}")
 
-        return Literal(typ=String(), value=value_to_string(var.value))
+        return values.from_str(value_to_string(var.value))
 
     def visit_Boolean(self, builtin: builtins.Boolean) -> Literal:
         """Visits builtin `Boolean` function which casts an argument to bool type."""
@@ -470,7 +617,7 @@ class Interpreter(Visitor):
 
         match var.type:
             case Bool() | Null():
-                return Literal(typ=Bool(), value=bool(var.value))
+                return values.from_bool(bool(var.value))
 
             case _:
                 raise UnexpectedTypeError(
@@ -484,7 +631,7 @@ class Interpreter(Visitor):
 
         match var.type:
             case Integer() | Float():
-                return Literal(typ=Float(), value=float(var.value))
+                return values.from_float(float(var.value))
 
             case _:
                 raise UnexpectedTypeError(
@@ -498,17 +645,17 @@ class Interpreter(Visitor):
 
         match var.type:
             case Integer() | Float():
-                return Literal(typ=Integer(), value=int(var.value))
+                return values.from_int(int(var.value))
 
             case _:
                 raise UnexpectedTypeError(
                     f'Function Integer expected its argument to be type Integer/Float. Got type {var.type}')
 
     def unpack_variable(self, potential_variable: Any):
-        """If provided value is an instance of Variable, then return its value.
+        """If provided value is a variable, then return its value.
         Otherwise just return the provided value."""
 
-        if isinstance(potential_variable, Variable):
+        if isinstance(potential_variable, RuntimeVariable):
             return potential_variable.value
 
         return potential_variable
@@ -518,10 +665,12 @@ class Interpreter(Visitor):
 
         factor = self.unpack_variable(factor)
 
-        match factor:
-            case Literal(type=Integer()) | Literal(type=Float()):
-                factor.value *= -1
-                return factor
+        match factor.type:
+            case Integer():
+                return values.from_int(-factor.value)
+
+            case Float():
+                return values.from_float(-factor.value)
 
             case _:
                 raise UnexpectedTypeError(f"Operator `-` expected type Integer/Float. Got {factor.type} instead.")
@@ -531,30 +680,30 @@ class Interpreter(Visitor):
 
         factor = self.unpack_variable(factor)
 
-        if factor.type != Bool():
+        if factor.type != BOOL:
             raise UnexpectedTypeError(f"Operator `not` expected type Bool. Got {factor.type} instead.")
 
-        return Literal(typ=Bool(), value=not factor.value)
+        return values.from_bool(not factor.value)
 
     def logic_or(self, left_side: Any, right_side: Any):
         """Does logic alternative. Allowed only for booleans."""
 
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
-        if left_side.type != Bool() or right_side.type != Bool():
+        if left_side.type != BOOL or right_side.type != BOOL:
             raise UnexpectedTypeError(f"Expected types Bool Bool. Got {left_side.type} {right_side.type} instead.")
 
-        return Literal(typ=Bool(), value=left_side.value or right_side.value)
+        return values.from_bool(left_side.value or right_side.value)
 
     def logic_and(self, left_side: Any, right_side: Any):
         """Does logic conjunction. Allowed only for booleans."""
 
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
-        if left_side.type != Bool() or right_side.type != Bool():
+        if left_side.type != BOOL or right_side.type != BOOL:
             raise UnexpectedTypeError(f"Expected types Bool Bool. Got {left_side.type} {right_side.type} instead.")
 
-        return Literal(typ=Bool(), value=left_side.value and right_side.value)
+        return values.from_bool(left_side.value and right_side.value)
 
     def add(self, left_side: Any, right_side: Any) -> Literal:
         """Adds two sides (sums numbers or concatenates strings).
@@ -563,17 +712,17 @@ class Interpreter(Visitor):
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
         match left_side.type:
-            case Integer() if right_side.type == Integer():
-                return Literal(typ=Integer(), value=left_side.value + right_side.value)
+            case Integer() if right_side.type == INTEGER:
+                return values.from_int(left_side.value + right_side.value)
 
-            case Integer() if right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value + right_side.value)
+            case Integer() if right_side.type == FLOAT:
+                return values.from_float(left_side.value + right_side.value)
 
-            case Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value + right_side.value)
+            case Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_float(left_side.value + right_side.value)
 
-            case String() if right_side.type == String():
-                return Literal(typ=String(), value=left_side.value + right_side.value)
+            case String() if right_side.type == STRING:
+                return values.from_str(left_side.value + right_side.value)
 
             case _:
                 raise UnexpectedTypeError(f"Cannot add type {left_side.type} to type {right_side.type}")
@@ -584,14 +733,14 @@ class Interpreter(Visitor):
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
         match left_side.type:
-            case Integer() if right_side.type == Integer():
-                return Literal(typ=Integer(), value=left_side.value - right_side.value)
+            case Integer() if right_side.type == INTEGER:
+                return values.from_int(left_side.value - right_side.value)
 
-            case Integer() if right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value - right_side.value)
+            case Integer() if right_side.type == FLOAT:
+                return values.from_float(left_side.value - right_side.value)
 
-            case Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value - right_side.value)
+            case Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_float(left_side.value - right_side.value)
 
             case _:
                 raise UnexpectedTypeError(f"Cannot subtract type {right_side.type} from type {left_side.type}")
@@ -602,14 +751,14 @@ class Interpreter(Visitor):
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
         match left_side.type:
-            case Integer() if right_side.type == Integer():
-                return Literal(typ=Integer(), value=left_side.value * right_side.value)
+            case Integer() if right_side.type == INTEGER:
+                return values.from_int(left_side.value * right_side.value)
 
-            case Integer() if right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value * right_side.value)
+            case Integer() if right_side.type == FLOAT:
+                return values.from_float(left_side.value * right_side.value)
 
-            case Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value * right_side.value)
+            case Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_float(left_side.value * right_side.value)
 
             case _:
                 raise UnexpectedTypeError(f"Cannot multiply type {left_side.type} with type {right_side.type}")
@@ -623,14 +772,14 @@ class Interpreter(Visitor):
             raise DivisionByZeroError()
 
         match left_side.type:
-            case Integer() if right_side.type == Integer():
-                return Literal(typ=Integer(), value=left_side.value / right_side.value)
+            case Integer() if right_side.type == INTEGER:
+                return values.from_int(left_side.value / right_side.value)
 
-            case Integer() if right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value / right_side.value)
+            case Integer() if right_side.type == FLOAT:
+                return values.from_float(left_side.value / right_side.value)
 
-            case Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value / right_side.value)
+            case Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_float(left_side.value / right_side.value)
 
             case _:
                 raise UnexpectedTypeError(f"Cannot divide type {left_side.type} by type {right_side.type}")
@@ -644,14 +793,14 @@ class Interpreter(Visitor):
             raise DivisionByZeroError()
 
         match left_side.type:
-            case Integer() if right_side.type == Integer():
-                return Literal(typ=Integer(), value=left_side.value % right_side.value)
+            case Integer() if right_side.type == INTEGER:
+                return values.from_int(left_side.value % right_side.value)
 
-            case Integer() if right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value % right_side.value)
+            case Integer() if right_side.type == FLOAT:
+                return values.from_float(left_side.value % right_side.value)
 
-            case Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Float(), value=left_side.value % right_side.value)
+            case Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_float(left_side.value % right_side.value)
 
             case _:
                 raise UnexpectedTypeError(f"Cannot divide type {left_side.type} by type {right_side.type}")
@@ -662,8 +811,8 @@ class Interpreter(Visitor):
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
         match left_side.type:
-            case Integer() | Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Bool(), value=left_side.value < right_side.value)
+            case Integer() | Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_bool(left_side.value < right_side.value)
 
             case _:
                 raise UnexpectedTypeError(f'Cannot check if type {left_side.type} is less than type {right_side.type}')
@@ -674,8 +823,8 @@ class Interpreter(Visitor):
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
         match left_side.type:
-            case Integer() | Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Bool(), value=left_side.value > right_side.value)
+            case Integer() | Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_bool(left_side.value > right_side.value)
 
             case _:
                 raise UnexpectedTypeError(
@@ -687,8 +836,8 @@ class Interpreter(Visitor):
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
         match left_side.type:
-            case Integer() | Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Bool(), value=left_side.value <= right_side.value)
+            case Integer() | Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_bool(left_side.value <= right_side.value)
 
             case _:
                 raise UnexpectedTypeError(
@@ -700,8 +849,8 @@ class Interpreter(Visitor):
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
         match left_side.type:
-            case Integer() | Float() if right_side.type == Integer() or right_side.type == Float():
-                return Literal(typ=Bool(), value=left_side.value >= right_side.value)
+            case Integer() | Float() if right_side.type == INTEGER or right_side.type == FLOAT:
+                return values.from_bool(left_side.value >= right_side.value)
 
             case _:
                 raise UnexpectedTypeError(
@@ -712,46 +861,46 @@ class Interpreter(Visitor):
 
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
-        if str(left_side.type) == "Func" or str(right_side.type) == "Func":
+        if isinstance(left_side.type, Func) or isinstance(right_side.type, Func):
             raise UnexpectedTypeError(f"Cannot check if type {left_side.type} equals type {right_side.type}")
 
-        elif left_side.type == Null() and right_side.type == Null():
-            return Literal(typ=Bool(), value=True)
+        elif left_side.type == NULL and right_side.type == NULL:
+            return values.TRUE
 
-        elif left_side.type != Null() and right_side.type == Null():
-            return Literal(typ=Bool(), value=False)
+        elif left_side.type != NULL and right_side.type == NULL:
+            return values.FALSE
 
-        elif left_side.type == Null() and right_side.type != Null():
-            return Literal(typ=Bool(), value=False)
+        elif left_side.type == NULL and right_side.type != NULL:
+            return values.FALSE
 
         elif left_side.type != right_side.type:
             raise UnexpectedTypeError(
                 f"Cannot check if type {left_side.type} equals type {right_side.type}")
 
-        return Literal(typ=Bool(), value=left_side.value == right_side.value)
+        return values.from_bool(left_side.value == right_side.value)
 
     def not_equal(self, left_side: Any, right_side: Any) -> Literal:
         """Checks if left_side is not equal to right_side. Allowed for string, integer, float, bool, null."""
 
         left_side, right_side = self.unpack_variable(left_side), self.unpack_variable(right_side)
 
-        if str(left_side.type) == "Func" or str(right_side.type) == "Func":
+        if isinstance(left_side.type, Func) or isinstance(right_side.type, Func):
             raise UnexpectedTypeError(f"Cannot check if type {left_side.type} doesn't equal type {right_side.type}")
 
-        elif left_side.type == Null() and right_side.type == Null():
-            return Literal(typ=Bool(), value=False)
+        elif left_side.type == NULL and right_side.type == NULL:
+            return values.FALSE
 
-        elif left_side.type != Null() and right_side.type == Null():
-            return Literal(typ=Bool(), value=True)
+        elif left_side.type != NULL and right_side.type == NULL:
+            return values.TRUE
 
-        elif left_side.type == Null() and right_side.type != Null():
-            return Literal(typ=Bool(), value=True)
+        elif left_side.type == NULL and right_side.type != NULL:
+            return values.TRUE
 
         elif left_side.type != right_side.type:
             raise UnexpectedTypeError(
                 f"Cannot check if type {left_side.type} does not equal type {right_side.type}")
 
-        return Literal(typ=Bool(), value=left_side.value != right_side.value)
+        return values.from_bool(left_side.value != right_side.value)
 
     def null_coalesce(self, left_side: Any, right_side: Any) -> Literal:
         """Returns left_side if it is not null, otherwise right_side."""
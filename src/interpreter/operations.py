@@ -0,0 +1,154 @@
+import operator
+from typing import Any, Callable
+
+from src.errors.interpreter import DivisionByZeroError
+from src.interpreter import values
+from src.interpreter.values import RuntimeValue
+from src.parser.types import (
+    Integer, Float, Bool, String, Null, Void, Func,
+    LogicOperator, ComparisonOperator, ArithmeticOperator, OtherOperator,
+)
+
+# (operator, left type class, right type class) -> operation on unpacked values
+BinaryOperation = Callable[[RuntimeValue, RuntimeValue], RuntimeValue]
+
+NUMBER_TYPES = (Integer, Float)
+NULL_TYPES = (Null, Void)
+EQUATABLE_TYPES = (Integer, Float, Bool, String)
+ALL_TYPES = (Integer, Float, Bool, String, Null, Void, Func)
+
+ARITHMETIC = {
+    ArithmeticOperator.PLUS: operator.add,
+    ArithmeticOperator.MINUS: operator.sub,
+    ArithmeticOperator.MUL: operator.mul,
+}
+
+# division by integer results in float value, but type stays Integer
+DIVISION = {
+    ArithmeticOperator.DIV: operator.truediv,
+    ArithmeticOperator.MODULO: operator.mod,
+}
+
+COMPARISON = {
+    ComparisonOperator.LT: operator.lt,
+    ComparisonOperator.GT: operator.gt,
+    ComparisonOperator.LTE: operator.le,
+    ComparisonOperator.GTE: operator.ge,
+}
+
+LOGIC = {
+    LogicOperator.AND: lambda left, right: left and right,
+    LogicOperator.OR: lambda left, right: left or right,
+}
+
+
+# result type -> function creating a value of that type, shared values are reused where possible
+VALUE_CONSTRUCTORS = {
+    Integer: values.from_int,
+    Float: values.from_float,
+    Bool: values.from_bool,
+    String: values.from_str,
+}
+
+
+# operations made of a function of raw values, mapped to the function and type of their result,
+# so that compilers can apply the function directly instead of calling the operation,
+# functions of dividing operations raise DivisionByZeroError themselves
+APPLIED_FUNCTIONS: dict[BinaryOperation, tuple[Callable, type]] = {}
+
+
+def _result_type(left_type: type, right_type: type) -> type:
+    """Integer is kept only if both sides are integers, otherwise result is a float."""
+    return Integer if left_type is Integer and right_type is Integer else Float
+
+
+def _apply(fn: Callable, result_type: type) -> BinaryOperation:
+    make_value = VALUE_CONSTRUCTORS[result_type]
+
+    def operation(left_side: RuntimeValue, right_side: RuntimeValue) -> RuntimeValue:
+        return make_value(fn(left_side.value, right_side.value))
+
+    APPLIED_FUNCTIONS[operation] = (fn, result_type)
+    return operation
+
+
+def _apply_dividing(fn: Callable, result_type: type) -> BinaryOperation:
+    make_value = VALUE_CONSTRUCTORS[result_type]
+
+    def operation(left_side: RuntimeValue, right_side: RuntimeValue) -> RuntimeValue:
+        if right_side.value == 0:
+            raise DivisionByZeroError()
+
+        return make_value(fn(left_side.value, right_side.value))
+
+    def divide(left: Any, right: Any) -> Any:
+        if right == 0:
+            raise DivisionByZeroError()
+
+        return fn(left, right)
+
+    APPLIED_FUNCTIONS[operation] = (divide, result_type)
+    return operation
+
+
+def _constant(value: RuntimeValue) -> BinaryOperation:
+
+    def operation(left_side: RuntimeValue, right_side: RuntimeValue) -> RuntimeValue:
+        return value
+
+    return operation
+
+
+def _left(left_side: RuntimeValue, right_side: RuntimeValue) -> RuntimeValue:
+    return left_side
+
+
+def _right(left_side: RuntimeValue, right_side: RuntimeValue) -> RuntimeValue:
+    return right_side
+
+
+def build_binary_operations() -> dict[tuple, BinaryOperation]:
+    """Builds matrix of operations allowed for operator and types of both sides.
+    Combinations which are missing are not allowed."""
+
+    operations: dict[tuple, BinaryOperation] = {}
+
+    for left in NUMBER_TYPES:
+        for right in NUMBER_TYPES:
+            for op, fn in ARITHMETIC.items():
+                operations[op, left, right] = _apply(fn, _result_type(left, right))
+
+            for op, fn in DIVISION.items():
+                operations[op, left, right] = _apply_dividing(fn, _result_type(left, right))
+
+            for op, fn in COMPARISON.items():
+                operations[op, left, right] = _apply(fn, Bool)
+
+    operations[ArithmeticOperator.PLUS, String, String] = _apply(operator.add, String)
+
+    for op, fn in LOGIC.items():
+        operations[op, Bool, Bool] = _apply(fn, Bool)
+
+    # values can be compared only with values of the same type or with null
+    for typ in EQUATABLE_TYPES:
+        operations[ComparisonOperator.EQ, typ, typ] = _apply(operator.eq, Bool)
+        operations[ComparisonOperator.NEQ, typ, typ] = _apply(operator.ne, Bool)
+
+        for null in NULL_TYPES:
+            for key in [(typ, null), (null, typ)]:
+                operations[(ComparisonOperator.EQ, *key)] = _constant(values.FALSE)
+                operations[(ComparisonOperator.NEQ, *key)] = _constant(values.TRUE)
+
+    for left in NULL_TYPES:
+        for right in NULL_TYPES:
+            operations[ComparisonOperator.EQ, left, right] = _constant(values.TRUE)
+            operations[ComparisonOperator.NEQ, left, right] = _constant(values.FALSE)
+
+    for left in ALL_TYPES:
+        for right in ALL_TYPES:
+            operations[OtherOperator.NULL_COALESCE, left, right] = _right if left in NULL_TYPES else _left
+
+    return operations
+
+
+BINARY_OPERATIONS = build_binary_operations()
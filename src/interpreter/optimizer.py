@@ -0,0 +1,330 @@
+import copy
+from collections import Counter
+from typing import Any, Optional
+
+from src.errors.interpreter import InterpreterError
+from src.interpreter import values
+from src.interpreter.operations import BINARY_OPERATIONS
+from src.interpreter.visitor import Visitor
+from src.parser.objects.objects import (
+    Node, walk, BinaryExpression, CompFactor, DeclarationStatement, ElifStatement, ElseStatement, EmptyStatement,
+    Factor, FunctionCall, FunctionDefinition, Identifier, IfStatement, LambdaExpression, Literal, NegFactor,
+    Parameter, UnaryMinus, UnaryNot, WhileLoopStatement
+)
+from src.parser.objects.program import Program
+from src.parser.types import INTEGER, FLOAT, BOOL, NULL
+
+# optimisations are enabled cumulatively
+NO_OPTIMIZATION = 0
+FOLD_CONSTANTS = 1
+PROPAGATE_CONSTANTS = 2
+
+OPTIMIZATION_LEVELS = (NO_OPTIMIZATION, FOLD_CONSTANTS, PROPAGATE_CONSTANTS)
+
+
+class Optimizer(Visitor):
+    """Rewrites a program before it is run:
+
+    - level 1 folds expressions made only of literals into a single literal,
+    - level 2 also replaces global constants with their values and removes branches and loops,
+      whose conditions are always false.
+
+    Expressions, which would raise an error (e.g. division by zero) are not folded, so the error
+    is still raised when (and if) the expression is run. Program is never modified, nodes which change
+    are copied, so the original program can still be run without optimisations."""
+
+    def __init__(self, level: int = FOLD_CONSTANTS):
+        self.level = level
+        # global constants mapped to literals, which can replace them
+        self.constants: dict[str, Literal] = {}
+        # names of constants which can be propagated once they are declared
+        self.propagated_names: set[str] = set()
+        # constants are known only in top level code, functions can be called before they are declared
+        self.in_function = False
+
+    def optimize(self, program: Program) -> Program:
+        if self.level == NO_OPTIMIZATION:
+            return program
+
+        if self.level >= PROPAGATE_CONSTANTS:
+            self.propagated_names = self._find_propagated_names(program)
+
+        return self.visit(program)
+
+    @staticmethod
+    def _find_propagated_names(program: Program) -> set[str]:
+        """Finds names which are declared only once, by a const declaration in top level code.
+        Such a name always refers to the same value, once the declaration is run."""
+
+        declarations = Counter()
+        for node in walk(program):
+            match node:
+                case DeclarationStatement():
+                    declarations[node.left_value.name] += 1
+
+                case Parameter():
+                    declarations[node.name] += 1
+
+        return {
+            node.left_value.name for node in program.objects
+            if isinstance(node, DeclarationStatement)
+            and not node.left_value.mutable
+            and declarations[node.left_value.name] == 1
+        }
+
+    def _generic_visit(self, node: Node) -> Node:
+        """Visits children of a node and copies it if any of them changed."""
+
+        changes = {}
+        for field in node.fields:
+            value = getattr(node, field)
+            new_value = self._visit_value(value)
+
+            if new_value is not value:
+                changes[field] = new_value
+
+        if not changes:
+            return node
+
+        node = copy.copy(node)
+        for field, value in changes.items():
+            setattr(node, field, value)
+
+        return node
+
+    def _visit_value(self, value: Any) -> Any:
+        if isinstance(value, Node):
+            return self.visit(value)
+
+        if isinstance(value, list):
+            new_value = [self._visit_value(item) for item in value]
+
+            if any(new is not old for new, old in zip(new_value, value)):
+                return new_value
+
+        return value
+
+    def visit_FunctionDefinition(self, func_def: FunctionDefinition) -> Node:
+        return self._visit_function(func_def)
+
+    def visit_LambdaExpression(self, lambda_expr: LambdaExpression) -> Node:
+        return self._visit_function(lambda_expr)
+
+    def _visit_function(self, function: FunctionDefinition | LambdaExpression) -> Node:
+        in_function, self.in_function = self.in_function, True
+        function = self._generic_visit(function)
+        self.in_function = in_function
+        return function
+
+    def visit_FunctionCall(self, func_call: FunctionCall) -> Node:
+        # arguments which are variables are passed by reference, so they are never replaced with values
+        arguments = [
+            [argument if isinstance(argument, Identifier) else self.visit(argument) for argument in argument_list]
+            for argument_list in func_call.arguments
+        ]
+
+        if all(new is old for new_list, old_list in zip(arguments, func_call.arguments)
+               for new, old in zip(new_list, old_list)):
+            return func_call
+
+        func_call = copy.copy(func_call)
+        func_call.arguments = arguments
+        return func_call
+
+    def visit_DeclarationStatement(self, declaration_statement: DeclarationStatement) -> Node:
+        declaration_statement = self._generic_visit(declaration_statement)
+        variable = declaration_statement.left_value
+
+        if (
+                variable.name in self.propagated_names
+                and not self.in_function
+                and (literal := self._declared_value(declaration_statement)) is not None
+        ):
+            self.constants[variable.name] = literal
+
+        return declaration_statement
+
+    @staticmethod
+    def _declared_value(declaration_statement: DeclarationStatement) -> Optional[Literal]:
+        """Returns literal with a value of declared variable, if declaration can not fail."""
+
+        variable, literal = declaration_statement.left_value, declaration_statement.right_value
+        if not isinstance(literal, Literal):
+            return None
+
+        if literal.type == variable.type or (variable.nullable and literal.type == NULL):
+            return literal
+
+        # integer is converted to float, but its value stays the same
+        if variable.type == FLOAT and literal.type == INTEGER:
+            return Literal(FLOAT, literal.value)
+
+        return None
+
+    def visit_Identifier(self, identifier: Identifier) -> Node:
+        if not self.in_function and (literal := self.constants.get(identifier.name)) is not None:
+            return literal
+
+        return identifier
+
+    def visit_BinaryExpression(self, expression: BinaryExpression) -> Node:
+        expression = self._generic_visit(expression)
+        left, right = expression.left_value, expression.right_value
+
+        if not isinstance(left, Literal) or not isinstance(right, Literal):
+            return expression
+
+        operation = BINARY_OPERATIONS.get((expression.operator, left.type.__class__, right.type.__class__))
+        if operation is None:
+            return expression
+
+        try:
+            result = operation(values.from_literal(left), values.from_literal(right))
+        except InterpreterError:
+            return expression
+
+        return Literal(result.type, result.value)
+
+    def visit_NullCoalesceExpression(self, expression) -> Node:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_OrExpression(self, expression) -> Node:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_AndExpression(self, expression) -> Node:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_EqualityExpression(self, expression) -> Node:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_AdditiveExpression(self, expression) -> Node:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_MultiplicativeExpression(self, expression) -> Node:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_Factor(self, factor: Factor) -> Node:
+        factor = self._generic_visit(factor)
+        return factor.value if isinstance(factor.value, Literal) else factor
+
+    def visit_CompFactor(self, comp_factor: CompFactor) -> Node:
+        comp_factor = self._generic_visit(comp_factor)
+
+        if not isinstance(literal := comp_factor.factor, Literal):
+            return comp_factor
+
+        if not comp_factor.negation:
+            return literal
+
+        return self._fold_not(literal) or comp_factor
+
+    def visit_NegFactor(self, neg_factor: NegFactor) -> Node:
+        neg_factor = self._generic_visit(neg_factor)
+
+        if not isinstance(literal := neg_factor.factor, Literal):
+            return neg_factor
+
+        if not neg_factor.minus:
+            return literal
+
+        return self._fold_minus(literal) or neg_factor
+
+    def visit_UnaryNot(self, unary_not: UnaryNot) -> Node:
+        unary_not = self._generic_visit(unary_not)
+
+        if not isinstance(literal := unary_not.operand, Literal):
+            return unary_not
+
+        return self._fold_not(literal) or unary_not
+
+    def visit_UnaryMinus(self, unary_minus: UnaryMinus) -> Node:
+        unary_minus = self._generic_visit(unary_minus)
+
+        if not isinstance(literal := unary_minus.operand, Literal):
+            return unary_minus
+
+        return self._fold_minus(literal) or unary_minus
+
+    @staticmethod
+    def _fold_not(literal: Literal) -> Optional[Literal]:
+        if literal.type != BOOL:
+            return None
+
+        return Literal(BOOL, not literal.value)
+
+    @staticmethod
+    def _fold_minus(literal: Literal) -> Optional[Literal]:
+        if literal.type != INTEGER and literal.type != FLOAT:
+            return None
+
+        return Literal(literal.type, -literal.value)
+
+    def visit_IfStatement(self, if_statement: IfStatement) -> Node:
+        if_statement = self._generic_visit(if_statement)
+
+        if self.level < PROPAGATE_CONSTANTS:
+            return if_statement
+
+        # branches which are checked, if branch is the first one and else branch has no condition
+        branches = [(if_statement.condition, if_statement.statement)]
+        branches += [(elif_stmt.condition, elif_stmt.statement) for elif_stmt in if_statement.elif_statements]
+
+        remaining = []
+        for condition, statement in branches:
+            match self._condition_value(condition):
+                case False:
+                    continue
+
+                case True if not remaining:
+                    return statement
+
+                case True:
+                    # branch is run whenever previous ones are not, so it ends the statement
+                    return self._build_if(remaining, statement)
+
+                case _:
+                    remaining.append((condition, statement))
+
+        else_statement = if_statement.else_statement
+        else_body = else_statement.statement if else_statement is not None else None
+
+        if not remaining:
+            return else_body if else_body is not None else EmptyStatement()
+
+        if len(remaining) == len(branches):
+            return if_statement
+
+        return self._build_if(remaining, else_body)
+
+    @staticmethod
+    def _build_if(branches: list[tuple], else_body: Optional[Node]) -> IfStatement:
+        (condition, statement), *elifs = branches
+        return IfStatement(
+            condition, statement,
+            [ElifStatement(elif_condition, elif_statement) for elif_condition, elif_statement in elifs],
+            ElseStatement(else_body) if else_body is not None else None
+        )
+
+    def visit_WhileLoopStatement(self, while_loop_statement: WhileLoopStatement) -> Node:
+        while_loop_statement = self._generic_visit(while_loop_statement)
+
+        if self.level >= PROPAGATE_CONSTANTS and self._condition_value(while_loop_statement.condition) is False:
+            return EmptyStatement()
+
+        return while_loop_statement
+
+    @staticmethod
+    def _condition_value(condition: Node) -> Optional[bool]:
+        """Returns value of a condition if it is known, null conditions are false.
+        Conditions of other types raise an error, so their value is not known."""
+
+        if not isinstance(condition, Literal):
+            return None
+
+        if condition.type == BOOL:
+            return condition.value
+
+        if condition.type == NULL:
+            return False
+
+        return None
@@ -0,0 +1,171 @@
+from typing import Any, Callable
+
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.operations import APPLIED_FUNCTIONS, BINARY_OPERATIONS, VALUE_CONSTRUCTORS, BinaryOperation
+from src.interpreter.optimizer import NO_OPTIMIZATION
+from src.interpreter.values import RuntimeVariable
+from src.parser import Parser
+from src.parser.objects.objects import Node, BinaryExpression, Literal
+from src.parser.objects.program import Program
+from src.parser.types import Type
+
+# code running a quickened expression, calling it has the same effect and result as visiting the expression
+Variant = Callable[[], Any]
+
+
+class QuickeningInterpreter(Interpreter):
+    """Interpreter which specialises binary expressions for types of values they operate on (quickening).
+
+    The first time an expression runs, types of both sides are recorded and the expression is rewritten into
+    a specialised variant, e.g. addition of two integers or concatenation of two strings. The variant only checks
+    that both sides still have the recorded types and applies the operation selected for them, so operation is not
+    looked up again. When a side has a different type, the expression is de-optimised back to the generic path
+    of Interpreter for good. Expressions verified by TypeChecker are specialised before they first run,
+    starting from the operation TypeChecker selected. Their variants apply its function to raw values without any
+    checks. Variants load literals and visit other sides with their own methods, so sides are not dispatched on.
+
+    Program tree is shared and never modified, so variants are kept by the interpreter instead of the nodes.
+    Results, output and errors are the same as of Interpreter."""
+
+    def __init__(self, parser: Parser, optimization_level: int = NO_OPTIMIZATION):
+        super().__init__(parser, optimization_level)
+
+        # binary expressions mapped to code which runs them from now on
+        self.variants: dict[BinaryExpression, Variant] = {}
+
+        # types of both sides recorded by specialised expressions, de-optimised expressions are removed
+        self.specialisations: dict[BinaryExpression, tuple[Type, Type]] = {}
+
+    def prepare(self, program: Program):
+        super().prepare(program)
+        self.variants = {}
+        self.specialisations = {}
+
+    def visit_BinaryExpression(self, expression: BinaryExpression):
+        """Runs variant of an expression, quickening the expression the first time it is visited."""
+
+        if (variant := self.variants.get(expression)) is not None:
+            return variant()
+
+        # types of verified expressions are known before they run, so they are specialised right away
+        if (operation := self.operations.get(expression)) is not None:
+            variant = self.variants[expression] = self.specialise_verified(expression, operation)
+            return variant()
+
+        return self.quicken(expression)
+
+    # every kind of binary expression is quickened, without going through methods of Interpreter
+    visit_NullCoalesceExpression = visit_BinaryExpression
+    visit_OrExpression = visit_BinaryExpression
+    visit_AndExpression = visit_BinaryExpression
+    visit_EqualityExpression = visit_BinaryExpression
+    visit_AdditiveExpression = visit_BinaryExpression
+    visit_MultiplicativeExpression = visit_BinaryExpression
+
+    def quicken(self, expression: BinaryExpression):
+        """Runs expression generically and rewrites it into variant specialised for types of its sides.
+        Combinations which are not allowed raise their errors before anything is rewritten."""
+
+        left_side = self.visit(expression.left_value)
+        right_side = self.visit(expression.right_value)
+        left_value, right_value = self.unpack_variable(left_side), self.unpack_variable(right_side)
+
+        result = self.binary_operation(expression.operator, left_value, right_value)
+        types = left_value.type, right_value.type
+        operation = BINARY_OPERATIONS.get((expression.operator, types[0].__class__, types[1].__class__))
+
+        if operation is None:
+            self.variants[expression] = self.generic(expression)
+        else:
+            self.variants[expression] = self.specialise(expression, operation, types)
+            self.specialisations[expression] = types
+
+        return result
+
+    def deoptimise(self, expression: BinaryExpression, left_value: Any, right_value: Any):
+        """Rewrites expression back into its generic variant and finishes running it on already visited sides."""
+
+        self.variants[expression] = self.generic(expression)
+        del self.specialisations[expression]
+
+        return self.binary_operation(expression.operator, left_value, right_value)
+
+    def specialise(self, expression: BinaryExpression, operation: BinaryOperation, types: tuple[Type, Type]) -> Variant:
+        """Creates variant applying operation directly. Variant checks that both sides have given types
+        and de-optimises expression if they do not."""
+
+        left, right = expression.left_value, expression.right_value
+        load_left, load_right = self.operand(left), self.operand(right)
+        left_type, right_type = types
+
+        def specialised() -> Any:
+            left_value = load_left(left)
+            right_value = load_right(right)
+
+            if left_value.__class__ is RuntimeVariable:
+                left_value = left_value.value
+            if right_value.__class__ is RuntimeVariable:
+                right_value = right_value.value
+
+            # types are singletons, so they are compared by identity
+            if left_value.type is left_type and right_value.type is right_type:
+                return operation(left_value, right_value)
+
+            return self.deoptimise(expression, left_value, right_value)
+
+        return specialised
+
+    def specialise_verified(self, expression: BinaryExpression, operation: BinaryOperation) -> Variant:
+        """Creates variant of an expression verified by TypeChecker, which applies function of its operation
+        directly to raw values of both sides. Types of sides are guaranteed, so they are not checked."""
+
+        left, right = expression.left_value, expression.right_value
+        load_left, load_right = self.operand(left), self.operand(right)
+
+        if (applied := APPLIED_FUNCTIONS.get(operation)) is None:
+            def verified() -> Any:
+                left_value = load_left(left)
+                right_value = load_right(right)
+
+                if left_value.__class__ is RuntimeVariable:
+                    left_value = left_value.value
+                if right_value.__class__ is RuntimeVariable:
+                    right_value = right_value.value
+
+                return operation(left_value, right_value)
+
+            return verified
+
+        fn, result_type = applied
+        make_value = VALUE_CONSTRUCTORS[result_type]
+
+        def applied() -> Any:
+            left_value = load_left(left)
+            right_value = load_right(right)
+
+            if left_value.__class__ is RuntimeVariable:
+                left_value = left_value.value
+            if right_value.__class__ is RuntimeVariable:
+                right_value = right_value.value
+
+            return make_value(fn(left_value[1], right_value[1]))
+
+        return applied
+
+    def operand(self, node: Node) -> Callable[[Node], Any]:
+        """Returns function loading a side of an expression without dispatching on its node in every run.
+        Value of a literal is taken from constants of the run, other nodes are visited by their own method."""
+
+        if isinstance(node, Literal):
+            self.visit(node)
+            return self.constants.__getitem__
+
+        return self._resolve_visitor(node.__class__)
+
+    def generic(self, expression: BinaryExpression) -> Variant:
+        """Creates variant which runs expression exactly like Interpreter does."""
+
+        def generic() -> Any:
+            return Interpreter.visit_BinaryExpression(self, expression)
+
+        return generic
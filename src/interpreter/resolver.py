@@ -0,0 +1,137 @@
+from typing import Optional
+
+from src.interpreter.visitor import Visitor
+from src.parser.objects.objects import (
+    Node, Identifier, AssignmentStatement, DeclarationStatement, FunctionCall,
+    CompoundStatement, FunctionDefinition, LambdaExpression
+)
+from src.parser.objects.program import Program
+
+
+class Resolution:
+    """Result of resolving a program. Maps nodes to slots of a frame:
+
+    - `slots` - identifiers, assignments, declarations and function calls mapped to a slot of a variable
+      which they refer to. Names missing from this table refer to global variables,
+    - `frame_sizes` - program, function definitions and lambdas mapped to number of slots their frame needs,
+    - `blocks` - compound statements mapped to the first slot declared inside them and a tuple of Nones,
+      which overwrites their slots when a block is left."""
+
+    def __init__(self):
+        self.slots: dict[Node, int] = {}
+        self.frame_sizes: dict[Node, int] = {}
+        self.blocks: dict[CompoundStatement, tuple[int, tuple]] = {}
+
+
+class FunctionContext:
+    """Blocks of a function (or top level code) which are being resolved."""
+
+    def __init__(self, parameters: list = ()):
+        # name -> slot, for every block which is currently open, innermost last
+        self.blocks: list[dict[str, int]] = []
+        self.next_slot = 0
+        self.size = 0
+
+        if parameters:
+            self.blocks.append({})
+            for parameter in parameters:
+                self.declare(parameter.name)
+
+    def lookup(self, name: str) -> Optional[int]:
+        for block in reversed(self.blocks):
+            if (slot := block.get(name)) is not None:
+                return slot
+
+        return None
+
+    def declare(self, name: str) -> int:
+        slot = self.next_slot
+        self.blocks[-1][name] = slot
+        self.next_slot += 1
+        self.size = max(self.size, self.next_slot)
+        return slot
+
+
+class Resolver(Visitor):
+    """Assigns every local variable a slot in a frame of a function it is declared in, so that interpreter
+    can access it by index instead of walking through scopes.
+
+    Functions see only their own variables and globals, so a name either refers to a slot in the current frame
+    or to a global. Declaration of a name which is already visible reuses its slot, because interpreter
+    reassigns existing variables instead of shadowing them. Names declared outside any block at top level
+    are globals and are looked up by name."""
+
+    def __init__(self):
+        self.resolution = Resolution()
+        self.context = FunctionContext()
+
+    def resolve(self, program: Program) -> Resolution:
+        self.visit(program)
+        self.resolution.frame_sizes[program] = self.context.size
+        return self.resolution
+
+    def _generic_visit(self, node):
+        # subtrees missing from an incomplete expression are left to fail at runtime
+        if node is None:
+            return None
+
+        for child in node.iter_child_nodes():
+            self.visit(child)
+
+    def _resolve_name(self, node: Node, name: str) -> None:
+        if (slot := self.context.lookup(name)) is not None:
+            self.resolution.slots[node] = slot
+
+    def _resolve_function(self, function: FunctionDefinition | LambdaExpression) -> None:
+        context, self.context = self.context, FunctionContext(function.parameters)
+
+        if function.body is not None:
+            self.visit(function.body)
+
+        self.resolution.frame_sizes[function] = self.context.size
+        self.context = context
+
+    def visit_FunctionDefinition(self, func_def: FunctionDefinition):
+        self._resolve_function(func_def)
+
+    def visit_LambdaExpression(self, lambda_expr: LambdaExpression):
+        self._resolve_function(lambda_expr)
+
+    def visit_CompoundStatement(self, compound_statement: CompoundStatement):
+        context = self.context
+        start = context.next_slot
+        context.blocks.append({})
+
+        for statement in compound_statement.statements:
+            self.visit(statement)
+
+        context.blocks.pop()
+        if context.next_slot > start:
+            self.resolution.blocks[compound_statement] = (start, (None,) * (context.next_slot - start))
+
+        context.next_slot = start
+
+    def visit_DeclarationStatement(self, declaration_statement: DeclarationStatement):
+        # declared variable is not visible on the right side yet
+        if declaration_statement.right_value is not None:
+            self.visit(declaration_statement.right_value)
+
+        name = declaration_statement.left_value.name
+        slot = self.context.lookup(name)
+
+        if slot is None and self.context.blocks:
+            slot = self.context.declare(name)
+
+        if slot is not None:
+            self.resolution.slots[declaration_statement] = slot
+
+    def visit_AssignmentStatement(self, assignment_statement: AssignmentStatement):
+        self._resolve_name(assignment_statement, assignment_statement.name)
+        self.visit(assignment_statement.right_value)
+
+    def visit_Identifier(self, identifier: Identifier):
+        self._resolve_name(identifier, identifier.name)
+
+    def visit_FunctionCall(self, func_call: FunctionCall):
+        self._resolve_name(func_call, func_call.name)
+        self._generic_visit(func_call)
@@ -0,0 +1,115 @@
+from src.errors.interpreter import ReturnException, UnexpectedTypeError
+from src.interpreter.closures import ClosureCompiler, Code
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.optimizer import NO_OPTIMIZATION
+from src.parser import Parser
+from src.parser.objects.objects import Node, FunctionCall, FunctionDefinition, LambdaExpression, WhileLoopStatement
+from src.parser.objects.program import Program
+from src.parser.types import BOOL, NULL
+
+# number of calls of a function or iterations of a loop after which it is compiled
+HOT_THRESHOLD = 50
+
+
+class TieredInterpreter(Interpreter):
+    """Interpreter which starts running every function and loop by visiting the tree, and counts how many times
+    functions are called and loops are iterated. When a counter reaches threshold, function or loop is hot,
+    so it is compiled into closures (see ClosureCompiler) and runs compiled from then on. Functions called
+    from compiled code are compiled along with it. Cold code is never compiled, so short programs start as fast
+    as with Interpreter.
+
+    Program tree is shared and never modified, so compiled code is cached by the interpreter for every function
+    definition and loop. Redefining a function invalidates code of the definition it replaces.
+    Results, output and errors are the same as of Interpreter."""
+
+    def __init__(self, parser: Parser, optimization_level: int = NO_OPTIMIZATION, threshold: int = HOT_THRESHOLD):
+        super().__init__(parser, optimization_level)
+        self.threshold = threshold
+        self.compiler = None
+
+        # calls of functions and iterations of loops which are still run by visiting the tree
+        self.counters: dict[Node, int] = {}
+
+        # hot functions and loops mapped to their compiled code
+        self.compiled: dict[Node, Code] = {}
+
+    def prepare(self, program: Program):
+        super().prepare(program)
+        self.compiler = ClosureCompiler(self)
+        self.counters = {}
+        self.compiled = {}
+
+    def visit_FunctionDefinition(self, func_def: FunctionDefinition):
+        """Adds function definition to func table, invalidating code compiled for a definition it replaces."""
+
+        replaced = self.env.get_fun_def(func_def.name)
+        if replaced is not None and replaced is not func_def:
+            self.invalidate(replaced)
+
+        super().visit_FunctionDefinition(func_def)
+
+    def invalidate(self, func_def: FunctionDefinition):
+        """Drops compiled code of a function definition, which starts over as cold."""
+
+        self.counters.pop(func_def, None)
+        self.compiled.pop(func_def, None)
+
+    def run_function_body(self, func_def: FunctionDefinition | LambdaExpression, func_call: FunctionCall):
+        """Runs compiled body of a hot function. Body of a cold function is visited and the call is counted."""
+
+        if (code := self.compiled.get(func_def)) is None:
+            if (calls := self.counters.get(func_def, 0) + 1) < self.threshold:
+                self.counters[func_def] = calls
+                return self.visit(func_def.body)
+
+            code = self.compile_function(func_def)
+
+        # returned function is called with arguments of the original call only when returning raises an exception
+        if len(func_call.arguments) > 1:
+            code = self.compiler.compile(func_def.body)
+
+        return code()
+
+    def compile_function(self, func_def: FunctionDefinition | LambdaExpression) -> Code:
+        """Compiles body of a function, which results in its return value instead of raising ReturnException."""
+
+        self.counters.pop(func_def, None)
+        code = self.compiled[func_def] = self.compiler.compile_body(func_def.body)
+        return code
+
+    def visit_WhileLoopStatement(self, while_loop_statement: WhileLoopStatement):
+        """Runs compiled code of a hot loop. Otherwise visits the loop and counts its iterations,
+        once the loop gets hot, it is compiled and the remaining iterations run compiled."""
+
+        if (code := self.compiled.get(while_loop_statement)) is not None:
+            return code()
+
+        condition, body = while_loop_statement.condition, while_loop_statement.body
+        iterations = self.counters.get(while_loop_statement, 0)
+
+        try:
+            while cond := self.unpack_variable(self.visit(condition)):
+                if cond.type != BOOL and cond.type != NULL:
+                    raise UnexpectedTypeError(f'Expected condition to be type Bool or Null. Got {cond.type} instead.')
+
+                if not cond.value:
+                    break
+
+                self.visit(body)
+
+                if (iterations := iterations + 1) >= self.threshold:
+                    break
+
+        finally:
+            # iterations are counted also when loop is left by returning from a function
+            self.counters[while_loop_statement] = iterations
+
+        if iterations >= self.threshold:
+            return self.compile_loop(while_loop_statement)()
+
+    def compile_loop(self, while_loop_statement: WhileLoopStatement) -> Code:
+        """Compiles a loop. Running its code continues the loop with checking its condition."""
+
+        del self.counters[while_loop_statement]
+        code = self.compiled[while_loop_statement] = self.compiler.compile(while_loop_statement)
+        return code
@@ -0,0 +1,745 @@
+import operator
+from collections import defaultdict
+from typing import Any, Optional
+
+from src.errors.interpreter import RecursionLimitError, ReturnException, UndefinedNameError, UnexpectedTypeError
+from src.interpreter import values
+from src.interpreter.bytecode import CallSite
+from src.interpreter.checker import is_generic_name
+from src.interpreter.closures import VALUE_NODES, has_calls
+from src.interpreter.interpreter import Interpreter, MAX_RECURSION_DEPTH
+from src.interpreter.operations import APPLIED_FUNCTIONS, BinaryOperation
+from src.interpreter.optimizer import NO_OPTIMIZATION
+from src.interpreter.scopes import Frame
+from src.interpreter.values import RuntimeVariable
+from src.interpreter.visitor import Visitor
+from src.parser import Parser
+from src.parser.objects.objects import (
+    Node, walk, AssignmentStatement, BinaryExpression, CompFactor, CompoundStatement, DeclarationStatement,
+    EmptyStatement, Expression, Factor, FunctionCall, FunctionDefinition, Identifier, IfStatement,
+    InlineReturnStatement, LambdaExpression, Literal, NegFactor, ReturnStatement, UnaryMinus, UnaryNot,
+    WhileLoopStatement
+)
+from src.parser.objects.program import Program
+from src.parser.types import Bool, Float, Integer, String, BOOL, NULL
+
+# functions of operations which have their own Python operator
+PYTHON_OPERATORS = {
+    operator.add: '+',
+    operator.sub: '-',
+    operator.mul: '*',
+    operator.lt: '<',
+    operator.gt: '>',
+    operator.le: '<=',
+    operator.ge: '>=',
+    operator.eq: '==',
+    operator.ne: '!=',
+}
+
+# result type of an operation -> name of function creating its value, see VALUE_CONSTRUCTORS
+VALUE_CONSTRUCTOR_NAMES = {
+    Integer: 'from_int',
+    Float: 'from_float',
+    Bool: 'from_bool',
+    String: 'from_str',
+}
+
+# Python does not compile more than 20 nested loops, deeper statements are visited by interpreter
+MAX_NESTED_BLOCKS = 16
+
+# nodes which pass whatever their child results in, a variable passed through them is not unpacked
+WRAPPER_NODES = (Factor, CompFactor, NegFactor)
+
+# helpers used by generated code, they are a part of every generated module
+PRELUDE = '''
+def load_name(names, name):
+    if names is not None and (var := names.get(name)) is not None:
+        return var
+
+    if (var := symbol_table.get(name)) is None:
+        raise UndefinedNameError(name)
+
+    return var
+
+
+def holds(cond):
+    if not cond:
+        return False
+
+    if cond.type != BOOL and cond.type != NULL:
+        raise UnexpectedTypeError(f'Expected condition to be type Bool or Null. Got {cond.type} instead.')
+
+    return cond.value is True
+
+
+def apply_unpacking(operation, left_side, right_side):
+    if left_side.__class__ is RuntimeVariable:
+        left_side = left_side.value
+
+    return operation(left_side, right_side)
+'''
+
+# names available to every generated module, names which depend on a run are added by TranspilingInterpreter
+RUNTIME = {
+    'RuntimeVariable': RuntimeVariable,
+    'ReturnException': ReturnException,
+    'UndefinedNameError': UndefinedNameError,
+    'UnexpectedTypeError': UnexpectedTypeError,
+    'RecursionLimitError': RecursionLimitError,
+    'MAX_RECURSION_DEPTH': MAX_RECURSION_DEPTH,
+    'Frame': Frame,
+    'TRUE': values.TRUE,
+    'FALSE': values.FALSE,
+    'NULL_VALUE': values.NULL,
+    'BOOL': BOOL,
+    'NULL': NULL,
+    'from_int': values.from_int,
+    'from_float': values.from_float,
+    'from_bool': values.from_bool,
+    'from_str': values.from_str,
+}
+
+
+def passed_variable(argument: Node) -> Node:
+    """Returns node whose result is passed as an argument. Variables are passed to functions, not their values."""
+
+    while isinstance(argument, WRAPPER_NODES):
+        match argument:
+            case Factor():
+                argument = argument.value
+
+            case CompFactor(negation=False) | NegFactor(minus=False):
+                argument = argument.factor
+
+            case _:
+                break
+
+    return argument
+
+
+def unit_nodes(node: Node):
+    """Yields a node and its descendants, except for bodies of functions and lambdas, which run in their own frames."""
+
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+
+        if not isinstance(node, (FunctionDefinition, LambdaExpression)):
+            stack.extend(node.iter_child_nodes())
+
+
+class PythonProgram:
+    """Program transpiled into a Python module. Running the module's code defines a Python function for the program
+    and for every function body, named in `units`, and a function calling every function which has parameters.
+    Code refers to objects of the program only by names of `constants`, so it does not depend on a particular run
+    and can be cached (code objects can be marshalled)."""
+
+    __slots__ = ('source', 'code', 'constants', 'units')
+
+    def __init__(self, source: str, constants: dict[str, Any], units: list[tuple[Node, str]]):
+        self.source = source
+        self.code = compile(source, '<typethon>', 'exec')
+        self.constants = constants
+        self.units = units
+
+
+class PythonTranspiler(Visitor):
+    """Transpiles a program into Python source. Loops and conditionals become Python loops and conditionals,
+    operations verified by TypeChecker become Python operators on raw values, so only checks which types
+    do not guarantee are left in generated code. Statements which are not verified call the same interpreter
+    methods, which check types at runtime.
+
+    Local variables of int, float, bool or str type, which are only declared and assigned by verified statements
+    and never passed to a function, are kept in Python local variables as raw values (see `find_registers`).
+    Verified calls of a function defined once call its Python function directly.
+
+    Statements emit lines of code, expressions return Python expressions."""
+
+    def __init__(self, slots: dict[Node, int], frame_sizes: dict[Node, int],
+                 blocks: dict[CompoundStatement, tuple[int, tuple]], verified: set[Node],
+                 operations: dict[BinaryExpression, BinaryOperation]):
+        self.slots = slots
+        self.frame_sizes = frame_sizes
+        self.blocks = blocks
+        self.verified = verified
+        self.operations = operations
+
+        self.lines: list[str] = []
+        self.indent = 0
+        self.in_function = False
+        self.constants: dict[str, Any] = {}
+        self.constant_names: dict[int, str] = {}
+        self.units: list[tuple[Node, str]] = []
+
+        # names of global variables, which a declaration in a function reassigns, see Environment.set_variable
+        self.global_names: set[str] = set()
+        # names of functions defined once, mapped to their definitions
+        self.definitions: dict[str, FunctionDefinition] = {}
+        # functions with parameters mapped to names of Python functions calling them
+        self.callers: dict[FunctionDefinition, str] = {}
+        # function returned by a function can be called with generic parameters stored by name
+        self.has_chained_calls = False
+
+        # slots of the unit being transpiled which are kept in Python variables, mapped to types of their values
+        self.registers: dict[int, type] = {}
+        self.interpreted = False
+
+    def transpile(self, program: Program) -> PythonProgram:
+        self.lines = PRELUDE.splitlines()
+        self.global_names = {
+            node.left_value.name for node in walk(program)
+            if isinstance(node, DeclarationStatement) and node not in self.slots
+        }
+
+        functions: list[FunctionDefinition | LambdaExpression] = []
+        definitions: dict[str, list[FunctionDefinition]] = defaultdict(list)
+        self.has_chained_calls = False
+
+        for node in walk(program):
+            if isinstance(node, (FunctionDefinition, LambdaExpression)) and node.body is not None:
+                functions.append(node)
+
+            if isinstance(node, FunctionDefinition):
+                definitions[node.name].append(node)
+
+            elif isinstance(node, FunctionCall) and len(node.arguments) > 1:
+                self.has_chained_calls = True
+
+        self.definitions = {name: func_defs[0] for name, func_defs in definitions.items() if len(func_defs) == 1}
+        self.callers = {
+            function: f'call_{index}' for index, function in enumerate(functions, 1)
+            if isinstance(function, FunctionDefinition) and function.parameters and function in self.frame_sizes
+        }
+
+        self.unit(program, 'run_program', 'program')
+
+        bodies = {}
+        for function in functions:
+            description = f'def {function.name}' if isinstance(function, FunctionDefinition) else 'lambda'
+
+            if (name := bodies.get(function.body)) is None:
+                name = bodies[function.body] = f'run_body_{len(self.units)}'
+                self.unit(function.body, name, description, function)
+
+            if function in self.callers:
+                self.caller(function, name, description)
+
+        return PythonProgram('\n'.join(self.lines) + '\n', self.constants, self.units)
+
+    def unit(self, node: Node, name: str, description: str,
+             function: Optional[FunctionDefinition | LambdaExpression] = None) -> None:
+        """Emits a function running the node in the current frame of environment. Unit is emitted again
+        without registers if any of its statements is visited by interpreter, which reads variables from the frame."""
+
+        self.in_function = function is not None
+        self.units.append((node, name))
+        start = len(self.lines)
+        self.registers = self.find_registers(node, function)
+
+        while True:
+            self.interpreted = False
+            self.lines.extend(['', ''])
+            self.emit(f'def {name}():  # {description}')
+
+            self.indent += 1
+            self.emit('frame = env.frame')
+            self.emit('slots = frame.slots')
+            self.emit('names = frame.names')
+            self.statement(node)
+            self.indent -= 1
+
+            if not (self.interpreted and self.registers):
+                break
+
+            del self.lines[start:]
+            self.registers = {}
+
+        self.registers = {}
+
+    def caller(self, func_def: FunctionDefinition, body_name: str, description: str) -> None:
+        """Emits a function calling a function with parameters the same way as `call`, without checking types
+        of arguments, which is used by verified calls."""
+
+        self.lines.extend(['', ''])
+        self.emit(f'def {self.callers[func_def]}(*arguments):  # {description}')
+        self.emit('    if env.fun_call_nesting >= MAX_RECURSION_DEPTH:')
+        self.emit('        raise RecursionLimitError()')
+        self.emit(f'    frame = Frame({self.frame_sizes[func_def]})')
+        self.emit(f'    frame.slots[:{len(func_def.parameters)}] = arguments')
+        self.emit('    caller_frame, env.frame = env.frame, frame')
+        self.emit('    env.fun_call_nesting += 1')
+        self.emit(f'    return_value = {body_name}()')
+        self.emit('    env.fun_call_nesting -= 1')
+        self.emit('    env.frame = caller_frame')
+        self.emit('    return NULL_VALUE if return_value is None else return_value')
+
+    def find_registers(self, node: Node, function: Optional[FunctionDefinition | LambdaExpression]) -> dict[int, type]:
+        """Finds slots of a unit whose variables can be kept in Python variables as raw values, mapped to types
+        of their values. Every declaration of such a slot is verified and declares a variable of the same type,
+        which is not nullable. Its name is not global, or generic in a frame which can have generic parameters,
+        so it is always stored in the slot.
+        Every assignment is verified and variable is never passed to a function, which could change it,
+        so its value is known to have the declared type. Interpreter reads arguments of chained calls
+        from the frame, so units with chained calls keep all variables in slots."""
+
+        parameters = len(function.parameters) if function is not None else 0
+        generic = function is not None and (not function.parameters or self.has_chained_calls)
+        registers: dict[int, type] = {}
+        excluded: set[Optional[int]] = set()
+
+        for child in unit_nodes(node):
+            match child:
+                case DeclarationStatement() if (slot := self.slots.get(child)) is not None:
+                    variable = child.left_value
+                    typ = variable.type.__class__
+
+                    if (
+                            child not in self.verified or variable.nullable or slot < parameters
+                            or typ not in VALUE_CONSTRUCTOR_NAMES or registers.setdefault(slot, typ) is not typ
+                            or variable.name in self.global_names or generic and is_generic_name(variable.name)
+                    ):
+                        excluded.add(slot)
+
+                case AssignmentStatement() if child not in self.verified:
+                    excluded.add(self.slots.get(child))
+
+                case FunctionCall() if len(child.arguments) > 1:
+                    return {}
+
+                case FunctionCall():
+                    for argument in child.arguments[0]:
+                        if isinstance(argument := passed_variable(argument), Identifier):
+                            excluded.add(self.slots.get(argument))
+
+        return {slot: typ for slot, typ in registers.items() if slot not in excluded}
+
+    def register(self, node: Node) -> Optional[str]:
+        """Returns name of Python variable which keeps raw value of a variable a node refers to, if there is one."""
+
+        if (slot := self.slots.get(node)) is not None and slot in self.registers:
+            return f'local_{slot}'
+
+        return None
+
+    def emit(self, line: str) -> None:
+        self.lines.append('    ' * self.indent + line)
+
+    def constant(self, value: Any) -> str:
+        """Returns name under which a value is available to generated code, values are identified by identity."""
+
+        try:
+            return self.constant_names[id(value)]
+        except KeyError:
+            name = self.constant_names[id(value)] = f'_k{len(self.constants)}'
+            self.constants[name] = value
+            return name
+
+    def statement(self, node: Node) -> None:
+        if isinstance(node, Expression):
+            self.emit(self.visit(node))
+        else:
+            self.visit(node)
+
+    def block(self, node: Node) -> None:
+        """Emits statement indented in a Python block, which cannot be empty."""
+
+        self.indent += 1
+        lines = len(self.lines)
+
+        if self.indent > MAX_NESTED_BLOCKS:
+            self.interpret(node)
+        else:
+            self.statement(node)
+
+        if len(self.lines) == lines:
+            self.emit('pass')
+        self.indent -= 1
+
+    def _generic_visit(self, node: Any) -> str:
+        # nodes without Python form, e.g. subtrees missing from incomplete expressions,
+        # are visited by the interpreter when they run, which raises the same error
+        self.interpreted = True
+        return f'interpret({self.constant(node)})'
+
+    def interpret(self, node: Node) -> None:
+        """Emits code visiting a node by interpreter."""
+
+        self.interpreted = True
+        if not self.in_function:
+            self.emit(f'interpret({self.constant(node)})')
+            return
+
+        self.emit('try:')
+        self.emit(f'    interpret({self.constant(node)})')
+        self.emit('except ReturnException as _r:')
+        self.emit('    return _r.value_to_return')
+
+    def value(self, node: Node) -> str:
+        """Returns expression unpacking a variable a node results in."""
+
+        if isinstance(node, Identifier) and (register := self.register(node)) is not None:
+            return self.box(register, self.registers[self.slots[node]])
+
+        if isinstance(node, Identifier):
+            return self.unpack(self.load(node.name, self.slots.get(node)))
+
+        if isinstance(node, VALUE_NODES):
+            return self.visit(node)
+
+        return self.unpack(self.visit(node))
+
+    def raw_value(self, node: Node) -> str:
+        """Returns expression resulting in a Python value of a node's value."""
+
+        if isinstance(node, Literal) and (value := values.from_literal(node).value).__class__ in (int, float, str, bool):
+            return f'({value!r})'
+
+        # nested operation is not turned into a value at all
+        if isinstance(node, BinaryExpression) and (inlined := self.inline_operation(node)) is not None:
+            return inlined[0]
+
+        if isinstance(node, Identifier) and (register := self.register(node)) is not None:
+            return register
+
+        return f'{self.value(node)}[1]'
+
+    def box(self, raw_value: str, result_type: type) -> str:
+        """Returns expression creating a value of a type from a raw value."""
+
+        if result_type is Bool:
+            return f'(TRUE if {raw_value} else FALSE)'
+
+        return f'{VALUE_CONSTRUCTOR_NAMES[result_type]}({raw_value})'
+
+    def unpack(self, expression: str) -> str:
+        return f'(_v.value if (_v := {expression}).__class__ is RuntimeVariable else _v)'
+
+    def load(self, name: str, slot: Optional[int]) -> str:
+        """Returns expression getting a variable, the same as Environment.get_variable."""
+
+        if slot is None:
+            return f'(names is None and symbol_table.get({name!r}) or load_name(names, {name!r}))'
+
+        return f'(slots[{slot}] or load_name(names, {name!r}))'
+
+    def condition(self, node: Node) -> str:
+        """Returns Python condition which is true if a node results in true, checking type of its value."""
+
+        # verified comparison always results in a bool
+        if isinstance(node, BinaryExpression) and (inlined := self.inline_operation(node)) is not None \
+                and inlined[1] is Bool:
+            return inlined[0]
+
+        if isinstance(node, Identifier) and self.registers.get(self.slots.get(node)) is Bool:
+            return self.register(node)
+
+        return f'(_c := {self.value(node)}) is TRUE or (_c is not FALSE and holds(_c))'
+
+    def visit_Program(self, program: Program):
+        for node in program.objects:
+            self.statement(node)
+
+    def visit_FunctionDefinition(self, func_def: FunctionDefinition):
+        self.emit(f'fun_table[{func_def.name!r}] = {self.constant(func_def)}')
+
+    def visit_LambdaExpression(self, lambda_expr: LambdaExpression) -> str:
+        return self.constant(lambda_expr)
+
+    def visit_WhileLoopStatement(self, while_loop_statement: WhileLoopStatement):
+        self.emit(f'while {self.condition(while_loop_statement.condition)}:')
+        self.block(while_loop_statement.body)
+
+    def visit_IfStatement(self, if_statement: IfStatement):
+        self.emit(f'if {self.condition(if_statement.condition)}:')
+        self.block(if_statement.statement)
+
+        for elif_stmt in if_statement.elif_statements:
+            self.emit(f'elif {self.condition(elif_stmt.condition)}:')
+            self.block(elif_stmt.statement)
+
+        if if_statement.else_statement is not None:
+            self.emit('else:')
+            self.block(if_statement.else_statement.statement)
+
+    def visit_ReturnStatement(self, return_statement: ReturnStatement):
+        if return_statement.expression is None:
+            expression = 'NULL_VALUE'
+        else:
+            expression = self.visit(return_statement.expression)
+
+        # returned value is never None, so a function which returns None has not run any return statement
+        if self.in_function:
+            self.emit(f'return {expression}')
+        else:
+            self.emit(f'raise ReturnException({expression})')
+
+    def visit_InlineReturnStatement(self, inline_return_statement: InlineReturnStatement):
+        self.visit_ReturnStatement(inline_return_statement)
+
+    def visit_FunctionCall(self, func_call: FunctionCall) -> str:
+        site = CallSite(func_call, self.slots.get(func_call), func_call in self.verified)
+        arguments = ', '.join(self.visit(argument) for argument in func_call.arguments[0])
+
+        # called function is looked up before arguments are evaluated
+        function = f'get_called_function({site.name!r}, {site.slot})'
+        call = f'call({self.constant(site)}, {function}{arguments and ", "}{arguments})'
+
+        # function defined once is called directly once its definition is run, unless a generic parameter shadows it
+        if site.verified and not site.chained and (func_def := self.definitions.get(site.name)) in self.callers:
+            return (
+                f'({self.callers[func_def]}({arguments}) '
+                f'if names is None and fun_table.get({site.name!r}) is {self.constant(func_def)} else {call})'
+            )
+
+        return call
+
+    def visit_AssignmentStatement(self, assignment_statement: AssignmentStatement):
+        if (register := self.register(assignment_statement)) is not None:
+            self.emit(f'{register} = {self.raw_value(assignment_statement.right_value)}')
+            return
+
+        if assignment_statement in self.verified:
+            # variable is changed in place, so it does not have to be stored again
+            self.emit(f'_a = {self.load(assignment_statement.name, self.slots.get(assignment_statement))}')
+            self.emit(f'_a.value = {self.value(assignment_statement.right_value)}')
+            return
+
+        statement = self.constant(assignment_statement)
+        self.emit(f'_a = get_assignable_variable({statement})')
+        self.emit(f'assign_variable({statement}, _a, {self.value(assignment_statement.right_value)})')
+
+    def visit_DeclarationStatement(self, declaration_statement: DeclarationStatement):
+        variable = declaration_statement.left_value
+        name = repr(variable.name)
+
+        if declaration_statement not in self.verified:
+            if (right_value := declaration_statement.right_value) is not None:
+                value = self.visit(right_value)
+            else:
+                value = 'None'
+
+            statement = self.constant(declaration_statement)
+            self.emit(f'check_declaration({statement}, {self.constant(variable)}, {value})')
+            return
+
+        if (register := self.register(declaration_statement)) is not None:
+            self.emit(f'{register} = {self.raw_value(declaration_statement.right_value)}')
+            return
+
+        self.emit(
+            f'_d = RuntimeVariable({name}, {self.constant(variable.type)}, {variable.nullable}, {variable.mutable}, '
+            f'{self.value(declaration_statement.right_value)})'
+        )
+
+        if (slot := self.slots.get(declaration_statement)) is None:
+            self.emit(f'set_variable({name}, _d, None)')
+            return
+
+        # the same as Environment.set_variable, a visible variable with the same name is reassigned
+        self.emit(
+            f'if slots[{slot}] is None and (names is not None and {name} in names or {name} in symbol_table):'
+        )
+        self.emit(f'    set_variable({name}, _d, {slot})')
+        self.emit('else:')
+        self.emit(f'    slots[{slot}] = _d')
+
+    def visit_EmptyStatement(self, empty_statement: EmptyStatement):
+        pass
+
+    def visit_CompoundStatement(self, compound_statement: CompoundStatement):
+        for statement in compound_statement.statements:
+            self.statement(statement)
+
+        # registers do not have to be cleared, they are always assigned before they are read
+        if (block := self.blocks.get(compound_statement)) is not None:
+            start, nones = block
+            if any(slot not in self.registers for slot in range(start, start + len(nones))):
+                self.emit(f'slots[{start}:{start + len(nones)}] = {nones!r}')
+
+    def visit_BinaryExpression(self, expression: BinaryExpression) -> str:
+        left, right = expression.left_value, expression.right_value
+        operation = self.operations.get(expression)
+
+        # left side is unpacked after the right one is evaluated, a call could change value of its variable
+        if not self.in_order(left, right):
+            if operation is None:
+                return f'binary_operation({self.constant(expression.operator)}, {self.visit(left)}, {self.value(right)})'
+
+            return f'apply_unpacking({self.constant(operation)}, {self.visit(left)}, {self.value(right)})'
+
+        if operation is None:
+            return f'binary_operation({self.constant(expression.operator)}, {self.value(left)}, {self.value(right)})'
+
+        if (inlined := self.inline_operation(expression)) is None:
+            return f'{self.constant(operation)}({self.value(left)}, {self.value(right)})'
+
+        return self.box(*inlined)
+
+    def inline_operation(self, expression: BinaryExpression) -> Optional[tuple[str, type]]:
+        """Returns Python expression resulting in a raw value of a verified operation and type of its result,
+        if both sides can be unpacked in order. Operations which are not Python operators call their function."""
+
+        left, right = expression.left_value, expression.right_value
+        fn, result_type = APPLIED_FUNCTIONS.get(self.operations.get(expression), (None, None))
+
+        if fn is None or not self.in_order(left, right):
+            return None
+
+        if (symbol := PYTHON_OPERATORS.get(fn)) is None:
+            return f'{self.constant(fn)}({self.raw_value(left)}, {self.raw_value(right)})', result_type
+
+        return f'({self.raw_value(left)} {symbol} {self.raw_value(right)})', result_type
+
+    def in_order(self, left: Node, right: Node) -> bool:
+        """Checks if the left side can be unpacked before the right side is evaluated. Call on the right side could
+        change a variable on the left side, unless it is kept in a register, which functions cannot change."""
+
+        return isinstance(left, VALUE_NODES) or not has_calls(right) or self.register(left) is not None
+
+    def visit_NullCoalesceExpression(self, expression) -> str:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_OrExpression(self, expression) -> str:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_AndExpression(self, expression) -> str:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_EqualityExpression(self, expression) -> str:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_AdditiveExpression(self, expression) -> str:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_MultiplicativeExpression(self, expression) -> str:
+        return self.visit_BinaryExpression(expression)
+
+    def visit_CompFactor(self, comp_factor: CompFactor) -> str:
+        if not comp_factor.negation:
+            return self.visit(comp_factor.factor)
+
+        return f'logic_not({self.visit(comp_factor.factor)})'
+
+    def visit_NegFactor(self, neg_factor: NegFactor) -> str:
+        if not neg_factor.minus:
+            return self.visit(neg_factor.factor)
+
+        return f'unary_minus({self.visit(neg_factor.factor)})'
+
+    def visit_UnaryNot(self, unary_not: UnaryNot) -> str:
+        return f'logic_not({self.visit(unary_not.operand)})'
+
+    def visit_UnaryMinus(self, unary_minus: UnaryMinus) -> str:
+        return f'unary_minus({self.visit(unary_minus.operand)})'
+
+    def visit_Factor(self, factor: Factor) -> str:
+        return self.visit(factor.value)
+
+    def visit_Literal(self, literal: Literal) -> str:
+        return self.constant(values.from_literal(literal))
+
+    def visit_Identifier(self, identifier: Identifier) -> str:
+        if (register := self.register(identifier)) is not None:
+            return self.box(register, self.registers[self.slots[identifier]])
+
+        return self.load(identifier.name, self.slots.get(identifier))
+
+
+class TranspilingInterpreter(Interpreter):
+    """Interpreter which transpiles a program into Python (see PythonTranspiler) and runs it with `exec`.
+    Results, output and errors are the same as of Interpreter. Programs are transpiled once and their
+    compiled code is reused by next runs."""
+
+    def __init__(self, parser: Parser, optimization_level: int = NO_OPTIMIZATION):
+        super().__init__(parser, optimization_level)
+        self.programs: dict[Program, PythonProgram] = {}
+        # nodes mapped to Python functions running them
+        self.bodies: dict[Node, Any] = {}
+
+    def prepare(self, program: Program):
+        super().prepare(program)
+        python_program = self.python_program(program)
+
+        namespace = {
+            **RUNTIME,
+            **python_program.constants,
+            'env': self.env,
+            'fun_table': self.env.global_scope.fun_table,
+            'symbol_table': self.env.global_scope.symbol_table,
+            'set_variable': self.env.set_variable,
+            'call': self.call,
+            'get_called_function': self.get_called_function,
+            'check_declaration': self.check_declaration,
+            'get_assignable_variable': self.get_assignable_variable,
+            'assign_variable': self.assign_variable,
+            'binary_operation': self.binary_operation,
+            'logic_not': self.logic_not,
+            'unary_minus': self.unary_minus,
+            'interpret': super().visit,
+        }
+        exec(python_program.code, namespace)
+        self.bodies = {node: namespace[name] for node, name in python_program.units}
+
+    def python_program(self, program: Program) -> PythonProgram:
+        """Returns a program transpiled into Python, transpiling it the first time. Program has to be checked
+        and resolved by `prepare` first."""
+
+        try:
+            return self.programs[program]
+        except KeyError:
+            transpiler = PythonTranspiler(self.slots, self.frame_sizes, self.blocks, self.verified, self.operations)
+            python_program = self.programs[program] = transpiler.transpile(program)
+            return python_program
+
+    def visit(self, node: Any):
+        """Runs a transpiled program or function body. Return statement raises ReturnException,
+        the same as when a body is visited. Other nodes are visited by Interpreter."""
+
+        if (body := self.bodies.get(node)) is None:
+            return super().visit(node)
+
+        if (return_value := body()) is not None:
+            raise ReturnException(return_value)
+
+    def call(self, site: CallSite, func_def: FunctionDefinition | LambdaExpression, *arguments):
+        """Calls a function with evaluated arguments, the same as Interpreter.visit_FunctionCall."""
+
+        if not (params := func_def.parameters):
+            params = func_def.build_generic_parameters(arguments)
+
+        if not site.verified:
+            self.type_check_arguments(site.name, arguments, params)
+
+        if self.env.fun_call_nesting >= MAX_RECURSION_DEPTH:
+            raise RecursionLimitError()
+
+        # frame of the call, the same as created by Interpreter.create_fun_scope
+        if params is func_def.parameters and (frame_size := self.frame_sizes.get(func_def)) is not None:
+            frame = Frame(frame_size)
+            frame.slots[:len(arguments)] = arguments
+        else:
+            frame = Frame(self.frame_sizes.get(func_def, 0), {p.name: a for p, a in zip(params, arguments)})
+
+        env = self.env
+        return_type = getattr(func_def, 'return_type', 'type')
+        caller_frame, env.frame = env.frame, frame
+        env.fun_call_nesting += 1
+
+        if (body := self.bodies.get(func_def.body)) is None:
+            # builtin function
+            return_value = Visitor.visit(self, func_def.body)
+
+        # returned function is called with arguments of the original call, see Interpreter
+        elif (return_value := body()) is not None and site.chained and (
+                new_return_value := self.chained_func_call_helper(return_value, 0, site.node, caller_frame)
+        ):
+            return_value, return_type = new_return_value, new_return_value.type
+
+        env.fun_call_nesting -= 1
+        env.frame = caller_frame
+
+        if site.verified:
+            return values.NULL if return_value is None else return_value
+
+        return self.type_check_return_type(site.name, return_value, return_type)
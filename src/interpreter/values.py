@@ -0,0 +1,86 @@
+from operator import itemgetter
+
+from src.parser.types import Type, Value, Integer, Bool, Null, INTEGER, FLOAT, BOOL, STRING, NULL as NULL_TYPE
+
+# range of preallocated integers, the same as in CPython
+SMALL_INT_MIN = -5
+SMALL_INT_MAX = 256
+
+
+class RuntimeValue(tuple):
+    """Immutable value produced by interpreter. Provides the same `type` and `value` attributes as Literal,
+    but cannot be changed once created, so the same instance can be shared by any number of variables."""
+
+    __slots__ = ()
+
+    def __new__(cls, typ: Type, value: Value):
+        return tuple.__new__(cls, (typ, value))
+
+    type = property(itemgetter(0))
+    value = property(itemgetter(1))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.type}, {self.value!r})"
+
+
+class RuntimeVariable:
+    """Variable created by executing a declaration. Declaration's Variable node only describes it,
+    so every execution of a declaration (e.g. in a loop or a recursive call) gets its own variable."""
+
+    __slots__ = ('name', 'type', 'nullable', 'mutable', 'value')
+
+    def __init__(self, name: str, typ: Type, nullable: bool = False, mutable: bool = True, value=None):
+        self.name = name
+        self.type = typ
+        self.nullable = nullable
+        self.mutable = mutable
+        self.value = value
+
+
+TRUE = RuntimeValue(BOOL, True)
+FALSE = RuntimeValue(BOOL, False)
+NULL = RuntimeValue(NULL_TYPE, None)
+
+SMALL_INTS = [RuntimeValue(INTEGER, number) for number in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)]
+
+# creates a value from a tuple of a type and a value, without calling RuntimeValue.__new__
+_new_value = tuple.__new__
+
+
+def from_bool(value: bool) -> RuntimeValue:
+    return TRUE if value else FALSE
+
+
+def from_int(number: int) -> RuntimeValue:
+    """Returns preallocated value for small integers. Integer values can also hold floats
+    (results of division), which are never taken from the cache, so that they are still printed as floats."""
+
+    if number.__class__ is int and SMALL_INT_MIN <= number <= SMALL_INT_MAX:
+        return SMALL_INTS[number - SMALL_INT_MIN]
+
+    return _new_value(RuntimeValue, (INTEGER, number))
+
+
+def from_float(number: float) -> RuntimeValue:
+    return _new_value(RuntimeValue, (FLOAT, number))
+
+
+def from_str(text: str) -> RuntimeValue:
+    return _new_value(RuntimeValue, (STRING, text))
+
+
+def from_literal(literal) -> RuntimeValue:
+    """Turns literal from a program tree into a value, reusing shared values where possible."""
+
+    match literal.type:
+        case Integer():
+            return from_int(literal.value)
+
+        case Bool():
+            return from_bool(literal.value)
+
+        case Null():
+            return NULL
+
+        case _:
+            return RuntimeValue(literal.type, literal.value)
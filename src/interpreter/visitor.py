@@ -2,11 +2,32 @@ from typing import Callable
 
 
 class Visitor:
+    """Calls `visit_<node class name>` method for every visited node.
+
+    Methods are looked up once per node class and cached as bound methods on the visitor instance,
+    so overridden methods and methods assigned to the instance are respected. A method is looked up
+    the first time a node of its class is visited, so it has to be assigned before that."""
+
+    _visitors: dict[type, Callable]
 
     def visit(self, node):
-        method = 'visit_' + node.__class__.__name__
-        visitor: Callable = getattr(self, method, self._generic_visit)
+        try:
+            visitor = self._visitors[node.__class__]
+        except (AttributeError, KeyError):
+            visitor = self._resolve_visitor(node.__class__)
+
         return visitor(node)
 
+    def _resolve_visitor(self, node_class: type) -> Callable:
+        visitor: Callable = getattr(self, 'visit_' + node_class.__name__, self._generic_visit)
+
+        try:
+            visitors = self._visitors
+        except AttributeError:
+            visitors = self._visitors = {}
+
+        visitors[node_class] = visitor
+        return visitor
+
     def _generic_visit(self, node):
         raise Exception('No visit_{} method'.format(type(node).__name__))
@@ -0,0 +1,278 @@
+from typing import Any, Optional
+
+from src.errors.interpreter import (
+    UndefinedNameError, RecursionLimitError, ReturnException, UnexpectedTypeError
+)
+from src.interpreter import values
+from src.interpreter.bytecode import BytecodeCompiler, CallSite, CodeObject, Opcode, disassemble
+from src.interpreter.interpreter import Interpreter, MAX_RECURSION_DEPTH
+from src.interpreter.scopes import Frame
+from src.interpreter.values import RuntimeVariable
+from src.interpreter.visitor import Visitor
+from src.parser.objects.builtins import BuiltinFunction
+from src.parser.objects.objects import FunctionDefinition
+from src.parser.objects.program import Program
+from src.parser.types import BOOL, NULL
+
+LOAD_CONST = int(Opcode.LOAD_CONST)
+LOAD_NAME = int(Opcode.LOAD_NAME)
+LOAD_SLOT = int(Opcode.LOAD_SLOT)
+LOAD_NAME_VALUE = int(Opcode.LOAD_NAME_VALUE)
+LOAD_SLOT_VALUE = int(Opcode.LOAD_SLOT_VALUE)
+UNPACK = int(Opcode.UNPACK)
+BINARY_OPERATION = int(Opcode.BINARY_OPERATION)
+BINARY_DISPATCH = int(Opcode.BINARY_DISPATCH)
+NOT = int(Opcode.NOT)
+NEGATE = int(Opcode.NEGATE)
+JUMP = int(Opcode.JUMP)
+JUMP_IF_NOT_TRUE = int(Opcode.JUMP_IF_NOT_TRUE)
+LOAD_FUNCTION = int(Opcode.LOAD_FUNCTION)
+CALL = int(Opcode.CALL)
+RETURN = int(Opcode.RETURN)
+END = int(Opcode.END)
+POP = int(Opcode.POP)
+DECLARE = int(Opcode.DECLARE)
+DECLARE_CHECKED = int(Opcode.DECLARE_CHECKED)
+ASSIGN = int(Opcode.ASSIGN)
+LOAD_ASSIGNABLE = int(Opcode.LOAD_ASSIGNABLE)
+ASSIGN_CHECKED = int(Opcode.ASSIGN_CHECKED)
+CLEAR_SLOTS = int(Opcode.CLEAR_SLOTS)
+DEFINE_FUNCTION = int(Opcode.DEFINE_FUNCTION)
+
+
+class CallFrame:
+    """Function call which is being executed by VirtualMachine. Keeps everything needed
+    to continue running the caller once the function returns."""
+
+    __slots__ = ('code', 'pc', 'caller_frame', 'site', 'return_type')
+
+    def __init__(self, code: CodeObject, pc: int, caller_frame: Frame, site: CallSite, return_type: Any):
+        self.code = code
+        self.pc = pc
+        self.caller_frame = caller_frame
+        self.site = site
+        self.return_type = return_type
+
+
+class VirtualMachine(Interpreter):
+    """Interpreter which compiles a program into bytecode (see BytecodeCompiler) and executes it in a single
+    dispatch loop. Loops and conditionals are jumps and calls of user functions push a CallFrame instead
+    of recursing, so running a program does not grow Python's stack with the depth of its code.
+
+    Instructions do exactly what Interpreter does when visiting the same nodes. Builtins and chained calls
+    are still run by the interpreter's methods."""
+
+    compiler: Optional[BytecodeCompiler] = None
+
+    def prepare(self, program: Program):
+        super().prepare(program)
+        self.compiler = BytecodeCompiler(self.slots, self.blocks, self.verified, self.operations)
+
+    def visit(self, node):
+        return self.execute(self.compiler.compile(node))
+
+    def execute(self, code: CodeObject) -> Any:
+        """Runs compiled code and returns its result. Return statement outside of functions called
+        by the code raises ReturnException, the same as when it is visited by Interpreter."""
+
+        env = self.env
+        symbol_table = env.global_scope.symbol_table
+        fun_table = env.global_scope.fun_table
+        frame_sizes = self.frame_sizes
+        compile_code = self.compiler.compile
+        true, false = values.TRUE, values.FALSE
+
+        opcodes, operands, names, constants = code.opcodes, code.operands, code.names, code.constants
+        slots, frame_names = env.frame.slots, env.frame.names
+        stack = []
+        push, pop = stack.append, stack.pop
+        call_frames: list[CallFrame] = []
+        pc = 0
+
+        # instructions are ordered by how often they are run
+        while True:
+            opcode = opcodes[pc]
+            operand = operands[pc]
+            pc += 1
+
+            if opcode == BINARY_OPERATION:
+                right = pop()
+                stack[-1] = constants[operand](stack[-1], right)
+
+            elif opcode == LOAD_CONST:
+                push(constants[operand])
+
+            elif opcode == LOAD_SLOT_VALUE or opcode == LOAD_NAME_VALUE:
+                # variable is looked up the same way as by Environment.get_variable
+                if opcode == LOAD_NAME_VALUE or (var := slots[operand]) is None:
+                    name = names[pc - 1]
+                    if (frame_names is None or (var := frame_names.get(name)) is None) and \
+                            not (var := symbol_table.get(name)):
+                        raise UndefinedNameError(name)
+
+                push(var.value if var.__class__ is RuntimeVariable else var)
+
+            elif opcode == JUMP_IF_NOT_TRUE:
+                cond = pop()
+                if cond is true:
+                    continue
+
+                if cond is not false and cond:
+                    if cond.type != BOOL and cond.type != NULL:
+                        raise UnexpectedTypeError(
+                            f'Expected condition to be type Bool or Null. Got {cond.type} instead.'
+                        )
+
+                    if cond.value is True:
+                        continue
+
+                pc = operand
+
+            elif opcode == DECLARE:
+                declaration = constants[operand]
+                variable = RuntimeVariable(
+                    declaration.name, declaration.type, declaration.nullable, declaration.mutable, pop()
+                )
+
+                if (slot := declaration.slot) is not None and slots[slot] is not None:
+                    slots[slot] = variable
+                else:
+                    env.set_variable(declaration.name, variable, slot)
+
+            elif opcode == ASSIGN:
+                value = pop()
+                pop().value = value
+
+            elif opcode == LOAD_SLOT or opcode == LOAD_NAME:
+                if opcode == LOAD_NAME or (var := slots[operand]) is None:
+                    name = names[pc - 1]
+                    if (frame_names is None or (var := frame_names.get(name)) is None) and \
+                            not (var := symbol_table.get(name)):
+                        raise UndefinedNameError(name)
+
+                push(var)
+
+            elif opcode == CLEAR_SLOTS:
+                start, nones = constants[operand]
+                slots[start:start + len(nones)] = nones
+
+            elif opcode == JUMP:
+                pc = operand
+
+            elif opcode == LOAD_FUNCTION:
+                site = constants[operand]
+                push(self.get_called_function(site.name, site.slot))
+
+            elif opcode == CALL:
+                site = constants[operand]
+                if count := site.arguments_count:
+                    arguments = stack[-count:]
+                    del stack[-count:]
+                else:
+                    arguments = []
+                func_def = pop()
+
+                if not (params := func_def.parameters):
+                    params = func_def.build_generic_parameters(arguments)
+
+                if not site.verified:
+                    self.type_check_arguments(site.name, arguments, params)
+
+                if env.fun_call_nesting >= MAX_RECURSION_DEPTH:
+                    raise RecursionLimitError()
+
+                # frame of the call, the same as created by Interpreter.create_fun_scope
+                if params is func_def.parameters and (frame_size := frame_sizes.get(func_def)) is not None:
+                    frame = Frame(frame_size)
+                    frame.slots[:count] = arguments
+                else:
+                    frame = Frame(frame_sizes.get(func_def, 0), {p.name: a for p, a in zip(params, arguments)})
+
+                caller_frame = env.frame
+                env.frame = frame
+                env.fun_call_nesting += 1
+                return_type = getattr(func_def, 'return_type', 'type')
+
+                if isinstance(body := func_def.body, BuiltinFunction):
+                    result = Visitor.visit(self, body)
+                    env.fun_call_nesting -= 1
+                    env.frame = caller_frame
+                    push(self.check_return_value(site.name, result, return_type, site.verified))
+                    continue
+
+                call_frames.append(CallFrame(code, pc, caller_frame, site, return_type))
+                code = compile_code(body)
+                opcodes, operands, names, constants = code.opcodes, code.operands, code.names, code.constants
+                slots, frame_names = frame.slots, frame.names
+                pc = 0
+
+            elif opcode == RETURN or opcode == END:
+                value = pop()
+
+                if not call_frames:
+                    if opcode == RETURN:
+                        raise ReturnException(value)
+                    return value
+
+                call_frame = call_frames.pop()
+                site, return_type = call_frame.site, call_frame.return_type
+
+                # returned function is called with the next arguments while the frame of the call still exists
+                if opcode == RETURN and site.chained and (new_value := self.chained_func_call_helper(
+                        value, 0, site.node, call_frame.caller_frame
+                )):
+                    value, return_type = new_value, new_value.type
+
+                env.fun_call_nesting -= 1
+                env.frame = frame = call_frame.caller_frame
+
+                code, pc = call_frame.code, call_frame.pc
+                opcodes, operands, names, constants = code.opcodes, code.operands, code.names, code.constants
+                slots, frame_names = frame.slots, frame.names
+                push(self.check_return_value(site.name, value, return_type, site.verified))
+
+            elif opcode == UNPACK:
+                if (value := stack[-1 - operand]).__class__ is RuntimeVariable:
+                    stack[-1 - operand] = value.value
+
+            elif opcode == POP:
+                pop()
+
+            elif opcode == BINARY_DISPATCH:
+                right = pop()
+                stack[-1] = self.binary_operation(constants[operand], stack[-1], right)
+
+            elif opcode == DECLARE_CHECKED:
+                declaration_statement = constants[operand]
+                self.check_declaration(declaration_statement, declaration_statement.left_value, pop())
+
+            elif opcode == LOAD_ASSIGNABLE:
+                push(self.get_assignable_variable(constants[operand]))
+
+            elif opcode == ASSIGN_CHECKED:
+                value = pop()
+                self.assign_variable(constants[operand], pop(), value)
+
+            elif opcode == NOT:
+                push(self.logic_not(pop()))
+
+            elif opcode == NEGATE:
+                push(self.unary_minus(pop()))
+
+            elif opcode == DEFINE_FUNCTION:
+                fun_table[names[pc - 1]] = constants[operand]
+
+            else:
+                raise Exception(f'Unknown opcode {opcode}')
+
+    def disassemble(self, program: Program) -> str:
+        """Compiles a program without running it and returns listing of its bytecode
+        followed by bytecode of every function defined in it."""
+
+        self.prepare(program)
+        codes = [self.compiler.compile(program)]
+        codes.extend(
+            self.compiler.compile(node.body, node.name) for node in program.objects
+            if isinstance(node, FunctionDefinition) and node.body is not None
+        )
+        return "\n\n".join(disassemble(code) for code in codes)
@@ -0,0 +1,120 @@
+from typing import Callable, Optional
+
+from src.errors.lexer import LexerError
+from src.lexer.lexer import Lexer, LexerSkippingComments
+from src.lexer.position import Position
+from src.lexer.token import Token
+from src.lexer.token_type import TokenType, KEYWORDS, ETX_VALUE, ONE_CHAR_OPS, TWO_CHAR_OPS
+from src.source import Source
+
+ASCII_SIZE = 128
+
+
+def build_dispatch_table() -> list[Optional[str]]:
+    """Builds table which maps code of every ASCII character to the name of a method
+    which can build a token starting with that character. Characters which cannot start
+    any token are mapped to None."""
+
+    table: list[Optional[str]] = [None] * ASCII_SIZE
+
+    for code in range(ASCII_SIZE):
+        char = chr(code)
+        if char.isalpha() or char == "_":
+            table[code] = "_try_build_identifier"
+        elif char.isdigit():
+            table[code] = "_try_build_number"
+
+    # keywords are built in the same way as variable names
+    for keyword in KEYWORDS:
+        table[ord(keyword[0])] = "_try_build_identifier"
+
+    for operator in [*ONE_CHAR_OPS, *TWO_CHAR_OPS]:
+        table[ord(operator[0])] = "_build_operator"
+
+    # `/` starts either a comment or division operator
+    table[ord("/")] = "_try_build_comment"
+    table[ord("\"")] = table[ord("'")] = "_try_build_string"
+    table[ord(ETX_VALUE)] = "_try_build_etx"
+
+    return table
+
+
+DISPATCH_TABLE = build_dispatch_table()
+
+
+class DispatchLexer(Lexer):
+    """Lexer which looks up the first character of every token in a precomputed table
+    and jumps straight to the builder which can handle it, instead of trying all builders in turn.
+    Non ASCII characters fall back to trying every builder like Lexer does."""
+
+    def __init__(self, source: Source):
+        super().__init__(source)
+
+        # bind methods once, so that overridden builders are respected
+        self._dispatch: list[Optional[Callable[[], Optional[Token]]]] = [
+            getattr(self, name) if name is not None else None for name in DISPATCH_TABLE
+        ]
+
+    def build_next_token(self) -> Token:
+        """Builds token or raises LexerError otherwise."""
+
+        self._skip_whitespace()
+
+        position = Position(self.source)
+        code = ord(self.source.current_char)
+
+        if code < ASCII_SIZE:
+            try_build_token = self._dispatch[code]
+            token = try_build_token() if try_build_token is not None else None
+        else:
+            token = self._try_build_any_token()
+
+        if token is None:
+            raise LexerError('Failed to build token!', position=position)
+
+        token.position = position
+        self.token = token
+        return token
+
+    def _try_build_any_token(self) -> Optional[Token]:
+        """Tries all builders in the same order as Lexer does."""
+
+        for try_build_token in [
+            self._try_build_comment,
+            self._try_build_identifier,
+            self._try_build_one_or_two_char_token,
+            self._try_build_number,
+            self._try_build_string,
+            self._try_build_etx,
+        ]:
+            if token := try_build_token():
+                return token
+
+    def _build_operator(self) -> Token:
+        """Builds token which consists of 1 or 2 characters. Current character is known to start an operator."""
+
+        current = self.source.current_char
+
+        # check if we can build operator with two characters
+        self.source.get_next_character()
+
+        if two_char_op := TWO_CHAR_OPS.get(current + self.source.current_char):
+            self.source.get_next_character()
+            return Token(typ=two_char_op)
+
+        # neither does the first character start two char operator nor is a one char operator itself
+        if not (one_char_op := ONE_CHAR_OPS.get(current)):
+            raise LexerError(f"Failed to build an operator: `{current}`", Position(self.source))
+
+        return Token(typ=one_char_op)
+
+
+class DispatchLexerSkippingComments(DispatchLexer, LexerSkippingComments):
+    """Dispatch lexer which does not return token with type Comment, but instead it continues building."""
+
+    def build_next_token(self) -> Token:
+        while token := super().build_next_token():
+            if token.type != TokenType.COMMENT:
+                break
+
+        return token
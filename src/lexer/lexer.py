@@ -4,7 +4,7 @@ from src.errors.lexer import LexerError
 from src.lexer.position import Position
 from src.lexer.token import Token
 from src.lexer.token_type import TokenType, KEYWORDS, ETX_VALUE, ONE_CHAR_OPS, TWO_CHAR_OPS
-from src.source import Source
+from src.source import Source, LineIndex
 
 
 class Lexer:
@@ -15,6 +15,16 @@ class Lexer:
         self.token: Optional[Token] = None
         self.source = source
 
+    @property
+    def line_index(self) -> LineIndex:
+        """Index of newlines in text read so far, allows computing line and column of positions."""
+        return self.source.line_index
+
+    @property
+    def offset(self) -> int:
+        """Offset in text at which lexer stopped after building the last token."""
+        return self.source.current_position
+
     def build_next_token(self) -> Token:
         """Builds token or raises LexerError otherwise."""
 
@@ -315,7 +325,51 @@ class Lexer:
 
 
 class LexerSkippingComments(Lexer):
-    """Lexer which does not return token with type Comment, but instead it continues building."""
+    """Lexer which does not return token with type Comment, but instead it continues building.
+    Comments are skipped without collecting their content."""
+
+    def _try_build_comment(self) -> Optional[Token]:
+        """Tries to skip a one line or multiline comment. Returns comment token without a value."""
+
+        if self.source.current_char != "/":
+            return
+
+        self.source.get_next_character()
+
+        if self.source.current_char == "*":
+            self._skip_multiline_comment()
+
+        # if next character is not `/`, then previous character should be treated as division operator
+        elif self.source.current_char != "/":
+            return Token(typ=TokenType.DIV)
+
+        else:
+            # skip everything until found newline symbol or ETX
+            self.source.skip_to("\n")
+
+        return Token(typ=TokenType.COMMENT)
+
+    def _skip_multiline_comment(self) -> None:
+        """Skips a multiline comment."""
+
+        # move into comment itself
+        self.source.get_next_character()
+
+        # comment will either be closed or lexer will reach end of text (which will result in an error)
+        while True:
+            self.source.skip_to("*")
+
+            if self.source.current_char == ETX_VALUE:
+                raise LexerError("Multiline was not closed! Reached end of text!", Position(self.source))
+
+            self.source.get_next_character()
+
+            # check if comment is being closed
+            if self.source.current_char == "/":
+                break
+
+        # leave multiline comment
+        self.source.get_next_character()
 
     def build_next_token(self) -> Token:
         while token := super().build_next_token():
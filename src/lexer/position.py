@@ -1,13 +1,32 @@
-from src.source import Source
+from src.source import Source, LineIndex
 
 
 class Position:
-    """Class storing line, column, current_position of a given source."""
+    """Class storing current_position of a given source. Line and column are computed
+    from source's line index only when they are needed, e.g. to report an error."""
+
+    __slots__ = ('_line_index', 'current_position')
 
     def __init__(self, source: Source):
-        self.line = source.line
-        self.column = source.column
+        self._line_index = source.line_index
         self.current_position = source.current_position
 
+    @classmethod
+    def at(cls, line_index: LineIndex, offset: int) -> "Position":
+        """Creates position of given offset in text indexed by line_index, without a source."""
+
+        position = cls.__new__(cls)
+        position._line_index = line_index
+        position.current_position = offset
+        return position
+
+    @property
+    def line(self) -> int:
+        return self._line_index.line(self.current_position)
+
+    @property
+    def column(self) -> int:
+        return self._line_index.column(self.current_position)
+
     def __str__(self) -> str:
         return f"Line:{self.line} Column:{self.column} Pos:{self.current_position}"
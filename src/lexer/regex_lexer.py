@@ -0,0 +1,320 @@
+import re
+from typing import Optional
+
+from src.errors.lexer import LexerError
+from src.lexer.lexer import Lexer
+from src.lexer.position import Position
+from src.lexer.token_stream import TokenStream, TokenView
+from src.lexer.token_type import TokenType, KEYWORDS, ETX_VALUE, ONE_CHAR_OPS, TWO_CHAR_OPS
+from src.source import Source
+
+OPERATORS = {**ONE_CHAR_OPS, **TWO_CHAR_OPS}
+
+# every operator has its own group, so that the name of matched group gives token type right away
+OPERATOR_GROUPS = {f"OP_{token_type.name}": operator for operator, token_type in OPERATORS.items()}
+OPERATOR_KINDS = {f"OP_{token_type.name}": token_type.value for token_type in OPERATORS.values()}
+KEYWORD_KINDS = {keyword: token_type.value for keyword, token_type in KEYWORDS.items()}
+
+# alternatives are tried in order, so two char operators have to come before one char operators
+# and comments have to come before `/` operator. Any character which does not begin a token is matched as INVALID,
+# so that matches follow each other without gaps
+TOKEN_PATTERN = re.compile(
+    r"""\s*(?:
+        (?P<ID>[^\W\d]\w*)
+      | (?P<COMMENT>//[^\n\x03]*)
+      | (?P<MULTILINE_COMMENT>/\*[^\x03]*?\*/)
+      | (?P<UNCLOSED_MULTILINE_COMMENT>/\*)
+      | {operators}
+      | (?P<NUMBER>\d+(?:\.\d+(?:[eE]-?\d+)?)?)
+      | (?P<STRING>"(?:[^"\\\x03]|\\[\s\S])*"|'(?:[^'\\\x03]|\\[\s\S])*')
+      | (?P<UNCLOSED_STRING>["'])
+      | (?P<INVALID_OPERATOR>[!?])
+      | (?P<ETX>\Z|(?=\x03))
+      | (?P<INVALID>[\s\S])
+    )""".format(
+        operators="\n      | ".join(
+            f"(?P<{group}>{re.escape(operator)})"
+            for group, operator in sorted(OPERATOR_GROUPS.items(), key=lambda item: len(item[1]), reverse=True)
+        )
+    ),
+    re.VERBOSE
+)
+ESCAPE_PATTERN = re.compile(r"\\([\s\S])")
+
+# tokens which may still be cut by the end of a block
+UNFINISHED_KINDS = {"UNCLOSED_MULTILINE_COMMENT", "UNCLOSED_STRING"}
+# the longest text following a token which can still change it, e.g. `e-1` following `1.5`
+LOOKAHEAD = 3
+
+
+class RegexLexer(Lexer):
+    """Lexer which tokenizes the whole source up front, matching one compiled alternation regex over blocks
+    of the source in a single finditer pass, instead of moving through the source character by character.
+    Tokens are stored straight into a TokenStream and their positions are computed only when needed
+    from line index of the source, so only one block (and a token cut by its end) is kept in memory.
+    It produces the same tokens and raises the same errors (with the same positions) as Lexer."""
+
+    skip_comments = False
+
+    def __init__(self, source: Source):
+        super().__init__(source)
+
+        self._text = ""
+        self._base = source.current_position  # offset in source of the first character of current block
+        self._last_offset = 0
+
+        self.stream = self._tokenize()
+        self._cursor = self.stream.cursor()
+
+    @property
+    def offset(self) -> int:
+        if self.token is None:
+            return self._base if len(self.stream) == 0 else self.stream.starts[0]
+
+        return self.token.end
+
+    def build_next_token(self) -> TokenView:
+        """Returns next token from the stream or raises LexerError otherwise."""
+
+        token = self._cursor.build_next_token()
+        self.token = token
+        return token
+
+    def _tokenize(self) -> TokenStream:
+        """Matches all tokens of the source block by block. Token which reaches the end of a block could
+        continue in the next one, so it is matched again together with the next block."""
+
+        stream = TokenStream(self.source.line_index)
+        add_kind, add_start, add_end = stream.kinds.append, stream.starts.append, stream.ends.append
+        values = stream.values
+        finditer = TOKEN_PATTERN.finditer
+        operator_kinds, keyword_kinds = OPERATOR_KINDS, KEYWORD_KINDS
+        id_kind, comment_kind, etx_kind = TokenType.ID.value, TokenType.COMMENT.value, TokenType.ETX.value
+        max_identifier_length = self.MAX_IDENTIFIER_LENGTH
+        skip_comments = self.skip_comments
+
+        blocks = self.source.read_blocks()
+        pending = ""
+        final = finished = False
+
+        try:
+            while not finished:
+                # text carried from previous block is at most a half of the new text, so that a long token
+                # cut by many blocks is not matched again after every block
+                parts, size = [pending], len(pending)
+                while not final and (size == len(pending) or size < 2 * len(pending)):
+                    if (block := next(blocks, None)) is None:
+                        final = True
+                    else:
+                        parts.append(block)
+                        size += len(block)
+
+                text = "".join(parts)
+                base = self._base
+                self._text = text
+                # source stops at its last character after reaching the end of text
+                self._last_offset = max(base + len(text) - 1, 0)
+                limit = len(text) if final else len(text) - LOOKAHEAD
+                offset = 0
+
+                for match in finditer(text):
+                    end = match.end()
+                    if end > limit:
+                        break
+
+                    kind = match.lastgroup
+                    start = match.start(kind)
+
+                    if kind == "ID":
+                        name = match[kind]
+                        if (kind_value := keyword_kinds.get(name)) is None:
+                            if len(name) > max_identifier_length or not (name[0].isalpha() or name[0] == "_"):
+                                self._raise_identifier_error(name, start)
+
+                            values[len(stream.kinds)] = name
+                            kind_value = id_kind
+
+                    elif (kind_value := operator_kinds.get(kind)) is None:
+                        if kind == "ETX":
+                            # ETX is never consumed
+                            etx_offset = min(base + start, self._last_offset)
+                            add_kind(etx_kind)
+                            add_start(etx_offset)
+                            add_end(etx_offset)
+                            finished = True
+                            break
+
+                        if not final and kind in UNFINISHED_KINDS:
+                            break
+
+                        token_type, value = self._build_other(kind, match[kind], start, end)
+                        kind_value = token_type.value
+
+                        if kind_value == comment_kind and skip_comments:
+                            offset = end
+                            continue
+
+                        values[len(stream.kinds)] = value
+
+                    add_kind(kind_value)
+                    add_start(base + start)
+                    add_end(base + end)
+                    offset = end
+
+                pending = text[offset:]
+                self._base = base + offset
+
+        except LexerError as error:
+            stream.error = error
+
+        # source stays at its last character, so tokens at the end of text end there as well
+        ends, last_offset = stream.ends, self._last_offset
+        index = len(ends) - 1
+        while index >= 0 and ends[index] > last_offset:
+            ends[index] = last_offset
+            index -= 1
+
+        return stream
+
+    def _build_other(
+            self, kind: str, result: str, start: int, end: int
+    ) -> tuple[TokenType, Optional[str | int | float]]:
+        """Builds token matched by any group other than identifiers, operators and ETX,
+        or raises error of a match which is not a token."""
+
+        if kind == "NUMBER":
+            return self._build_number(result, start, end)
+
+        if kind == "STRING":
+            return self._build_string(result, start)
+
+        if kind == "COMMENT":
+            return TokenType.COMMENT, result[2:]
+
+        if kind == "MULTILINE_COMMENT":
+            return TokenType.COMMENT, result[2:-2]
+
+        if kind == "UNCLOSED_MULTILINE_COMMENT":
+            etx_offset = self._text.find(ETX_VALUE, end)
+            raise LexerError(
+                "Multiline was not closed! Reached end of text!",
+                self._position(etx_offset if etx_offset != -1 else len(self._text))
+            )
+
+        if kind == "UNCLOSED_STRING":
+            self._raise_string_error(start)
+
+        if kind == "INVALID_OPERATOR":
+            raise LexerError(f"Failed to build an operator: `{result}`", self._position(end))
+
+        # kind == "INVALID"
+        raise LexerError('Failed to build token!', position=self._position(start))
+
+    def _raise_identifier_error(self, result: str, start: int) -> None:
+        """Raises error of an identifier which is too long or does not begin with a letter."""
+
+        if len(result) > self.MAX_IDENTIFIER_LENGTH:
+            raise LexerError(
+                "Failed to build identifier!. Received content which is too long!",
+                self._position(start + self.MAX_IDENTIFIER_LENGTH)
+            )
+
+        # regex accepts some numeric characters which are not letters at the beginning of identifier
+        raise LexerError('Failed to build token!', position=self._position(start))
+
+    def _build_number(self, result: str, start: int, end: int) -> tuple[TokenType, int | float]:
+        """Validates matched number the same way as Lexer does and converts it to int or float."""
+
+        text = self._text
+        integer_part_end = start + len(result.partition(".")[0])
+
+        # 0 cannot be followed by another digit
+        if result[0] == "0" and integer_part_end > start + 1:
+            raise LexerError(
+                "Failed to build number. Leading 0 cannot be followed by another 0.", self._position(start + 1)
+            )
+
+        if integer_part_end == end:
+            # `.` was not followed by digit, so regex did not match decimal part
+            if text[end:end + 1] == ".":
+                raise LexerError(
+                    "Failed to build number. Received `.` which was not followed by digit.",
+                    self._position(end + 1)
+                )
+
+            return TokenType.INT_VALUE, int(result)
+
+        # `e` was not followed by exponent, so regex did not match scientific notation
+        if text[end:end + 1] in ("e", "E") and "e" not in result and "E" not in result:
+            exponent_start = end + 1
+            if text[exponent_start:exponent_start + 1] == "-":
+                exponent_start += 1
+
+            raise LexerError(
+                "Failed to build number. Received `e` which was not followed by exponent.",
+                self._position(exponent_start)
+            )
+
+        return TokenType.FLOAT_VALUE, float(result)
+
+    def _build_string(self, result: str, start: int) -> tuple[TokenType, str]:
+        """Removes quotes from matched string and resolves escaped quotes and backslashes."""
+
+        opening_quote = result[0]
+        content = result[1:-1]
+        length = len(content)
+
+        if "\\" in content:
+            # prevent string ending or bare backslashes, other escape sequences are kept as they are
+            def unescape(escape: re.Match) -> str:
+                char = escape[1]
+                return char if char == opening_quote or char == "\\" else escape[0]
+
+            content, escapes = ESCAPE_PATTERN.subn(unescape, content)
+            # escape sequence is counted as a single character
+            length -= escapes
+
+        if length > self.MAX_STRING_LENGTH:
+            self._raise_string_error(start)
+
+        return TokenType.STR_VALUE, content
+
+    def _raise_string_error(self, start: int) -> None:
+        """Walks through a string which could not be built in the same way as Lexer does,
+        so that the error is raised at the same position."""
+
+        text = self._text
+        opening_quote = text[start]
+        offset = start + 1
+        collected = 0
+
+        def char_at(index: int) -> str:
+            return text[index] if index < len(text) else ETX_VALUE
+
+        while char_at(offset) != opening_quote and collected <= self.MAX_STRING_LENGTH:
+            # string was not closed and program ran into ETX
+            if char_at(offset) == ETX_VALUE:
+                raise LexerError(
+                    f"Failed to build string! Expected `{opening_quote}`, got ETX.", self._position(offset)
+                )
+
+            if char_at(offset) == "\\":
+                offset += 1
+
+            collected += 1
+            offset += 1
+
+        raise LexerError("Failed to build string!. Received content which is too long!", self._position(offset))
+
+    def _position(self, offset: int) -> Position:
+        """Returns position of given offset in current block. Offsets past the end of text point
+        to its last character."""
+
+        offset += self._base
+        return Position.at(self.line_index, offset if offset < self._last_offset else self._last_offset)
+
+
+class RegexLexerSkippingComments(RegexLexer):
+    """Regex lexer which does not store tokens with type Comment in its stream."""
+
+    skip_comments = True
@@ -0,0 +1,128 @@
+from array import array
+from typing import Optional, Union
+
+from src.errors.lexer import LexerError
+from src.lexer.lexer import Lexer
+from src.lexer.position import Position
+from src.lexer.token import Token
+from src.lexer.token_type import TokenType
+
+# token types indexed by their values, so that kind stored in an array can be turned back into a type
+TOKEN_TYPES: list[Optional[TokenType]] = [None] * (max(typ.value for typ in TokenType) + 1)
+for _typ in TokenType:
+    TOKEN_TYPES[_typ.value] = _typ
+
+
+class TokenStream:
+    """All tokens of a text stored as a struct of arrays instead of separate Token objects.
+    Kinds are kept in array of bytes, start and end offsets in arrays of unsigned ints
+    and literal values in a side table, which holds only tokens with a value.
+
+    If lexer failed, stream keeps tokens built before the error and the error itself,
+    so that it can be raised when a cursor reaches it - exactly when Lexer would raise it."""
+
+    def __init__(self, line_index):
+        self.kinds = array('B')
+        self.starts = array('I')
+        self.ends = array('I')
+        self.values: dict[int, Union[str, int, float]] = {}
+        self.line_index = line_index
+        self.error: Optional[LexerError] = None
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int) -> "TokenView":
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token index out of range")
+
+        return TokenView(self, index)
+
+    def append(self, token: Token, end: int) -> None:
+        """Stores token which ends at given offset."""
+
+        index = len(self.kinds)
+        self.kinds.append(token.type.value)
+        self.starts.append(token.position.current_position)
+        self.ends.append(end)
+
+        if token.value is not None:
+            self.values[index] = token.value
+
+    def cursor(self) -> "TokenCursor":
+        return TokenCursor(self)
+
+
+class TokenView:
+    """Light view of a single token in a stream. Provides the same attributes as Token."""
+
+    __slots__ = ('_stream', '_index', 'type')
+
+    def __init__(self, stream: TokenStream, index: int):
+        self._stream = stream
+        self._index = index
+        # type is checked by parser most often, so it is looked up right away
+        self.type: TokenType = TOKEN_TYPES[stream.kinds[index]]
+
+    @property
+    def value(self) -> Optional[Union[str, int, float]]:
+        return self._stream.values.get(self._index)
+
+    @property
+    def position(self) -> Position:
+        return Position.at(self._stream.line_index, self._stream.starts[self._index])
+
+    @property
+    def end(self) -> int:
+        return self._stream.ends[self._index]
+
+    __str__ = Token.__str__
+
+
+class TokenCursor:
+    """Walks through a token stream. Can be used by Parser instead of a Lexer."""
+
+    def __init__(self, stream: TokenStream):
+        self.stream = stream
+        self.token: Optional[TokenView] = None
+        self._next_index = 0
+
+    def build_next_token(self) -> TokenView:
+        """Moves to the next token in a stream or raises LexerError stored in a stream.
+        After reaching ETX, cursor stays on it."""
+
+        stream = self.stream
+        index = self._next_index
+
+        if index == len(stream.kinds):
+            if stream.error is not None:
+                raise stream.error
+
+            # stream always ends with ETX
+            index -= 1
+        else:
+            self._next_index = index + 1
+
+        token = TokenView(stream, index)
+        self.token = token
+        return token
+
+
+def tokenize(lexer: Lexer) -> TokenStream:
+    """Builds all tokens of a lexer at once and stores them in a compact token stream."""
+
+    stream = TokenStream(lexer.line_index)
+    append = stream.append
+
+    try:
+        while True:
+            token = lexer.build_next_token()
+            append(token, lexer.offset)
+
+            if token.type == TokenType.ETX:
+                break
+
+    except LexerError as error:
+        stream.error = error
+
+    return stream
@@ -0,0 +1,170 @@
+import hashlib
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.parser.objects.program import Program
+from src.parser.parser import Parser
+
+CACHE_DIR_NAME = "__tycache__"
+CACHE_SUFFIX = ".pickle"
+
+# modules which decide how parsed program looks like
+VERSIONED_PACKAGES = ("lexer", "parser", "source")
+
+
+def compute_interpreter_version() -> str:
+    """Hashes python version and code of lexer and parser, so that cached programs
+    are not reused after any of them changes."""
+
+    src_dir = Path(__file__).parents[1]
+    digest = hashlib.sha256(f"{sys.version_info[:2]} {pickle.HIGHEST_PROTOCOL}".encode())
+
+    for package in VERSIONED_PACKAGES:
+        for path in sorted((src_dir / package).rglob("*.py")):
+            digest.update(path.relative_to(src_dir).as_posix().encode())
+            digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+def is_trusted(file_stat: os.stat_result) -> bool:
+    """Checks that a file is owned by current user and nobody else can write to it. Cached programs
+    are unpickled, which can run arbitrary code, so only files which could not be planted by others are loaded."""
+
+    if hasattr(os, 'getuid') and file_stat.st_uid != os.getuid():
+        return False
+
+    return not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+class ProgramCache:
+    """Directory of parsed programs, similar to `__pycache__`. Programs are stored under a hash
+    of their source text, interpreter version and options of the parser which parsed them.
+    Entries are loaded only if both the entry and the directory belong to current user
+    and cannot be written by anyone else.
+
+    Entries are written to a temporary file and atomically renamed, so readers never see
+    a partially written entry. When the total size of entries exceeds `max_size` bytes,
+    least recently used entries are removed."""
+
+    MAX_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, cache_dir: Path, max_size: int = MAX_SIZE, version: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.version = version if version is not None else compute_interpreter_version()
+
+    def key(self, text: bytes, parser_class: type[Parser] = Parser, flatten: bool = False) -> str:
+        """Programs parsed by different parsers or with different options are different, so they have different keys."""
+
+        options = f"{self.version} {parser_class.__module__}.{parser_class.__qualname__} flatten={flatten}"
+        return hashlib.sha256(options.encode() + b"\0" + text).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+
+    def load(self, key: str) -> Optional[Program]:
+        """Returns cached program or None if there is no valid entry for given key."""
+
+        path = self.path(key)
+
+        try:
+            if not is_trusted(os.stat(self.cache_dir)):
+                return None
+
+            # entry is checked after it was opened, so that it cannot be replaced in between
+            with open(os.open(path, os.O_RDONLY | getattr(os, 'O_NOFOLLOW', 0)), 'rb') as file:
+                file_stat = os.fstat(file.fileno())
+                if not stat.S_ISREG(file_stat.st_mode) or not is_trusted(file_stat):
+                    return None
+
+                program = pickle.load(file)
+
+            # mark entry as recently used
+            os.utime(path)
+
+        # missing, evicted or unreadable entry is treated as a miss
+        except Exception:
+            return None
+
+        return program if isinstance(program, Program) else None
+
+    def store(self, key: str, program: Program) -> None:
+        """Atomically writes program to cache and evicts old entries if cache grew too big.
+        Failing to write an entry is not an error, program just will not be cached."""
+
+        try:
+            data = pickle.dumps(program, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, RecursionError):
+            return
+
+        try:
+            # directory is created accessible only to its owner, otherwise its entries would not be loaded
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=self.cache_dir, prefix=f".{key}.", suffix=".tmp")
+
+            try:
+                with os.fdopen(fd, 'wb') as file:
+                    file.write(data)
+                os.replace(temp_name, self.path(key))
+
+            except OSError:
+                os.remove(temp_name)
+                raise
+
+        except OSError:
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used entries until total size of cache fits in max_size."""
+
+        entries = []
+        for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                file_stat = path.stat()
+            except OSError:
+                # entry was removed by another process
+                continue
+            entries.append((file_stat.st_mtime, file_stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+
+class CachingParser:
+    """Parses program from a file only if there is no cached result for its content.
+    On a cache hit neither lexer nor parser is created. `parser_class` and `flatten` have to match
+    the parser created by `make_parser`, since programs are cached under them."""
+
+    def __init__(
+            self, file_name: Path, cache: ProgramCache, make_parser: Callable[[], Parser],
+            parser_class: type[Parser] = Parser, flatten: bool = False
+    ):
+        self.file_name = file_name
+        self.cache = cache
+        self.make_parser = make_parser
+        self.parser_class = parser_class
+        self.flatten = flatten
+
+    def parse_program(self) -> Program:
+        key = self.cache.key(self.file_name.read_bytes(), self.parser_class, self.flatten)
+
+        if (program := self.cache.load(key)) is not None:
+            return program
+
+        program = self.make_parser().parse_program()
+        self.cache.store(key, program)
+        return program
@@ -1,18 +1,56 @@
 import uuid
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from src.parser.types import Type, Value, Func
 
 
-class Statement:
-    pass
+class Node:
+    """Base class of all objects in a program tree. Every class declares its own fields in `__slots__`,
+    so nodes do not carry a `__dict__`. All fields of a class, including inherited ones,
+    are collected in `fields`, which lets tree walkers visit children without reflection."""
 
+    __slots__ = ()
+    fields: tuple[str, ...] = ()
 
-class Expression:
-    pass
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = cls.fields + tuple(cls.__dict__.get('__slots__', ()))
+
+    def iter_child_nodes(self) -> Iterator["Node"]:
+        """Yields nodes stored in fields, including nodes nested in lists."""
+
+        for field in self.fields:
+            yield from _iter_nodes(getattr(self, field))
+
+
+def _iter_nodes(value: Any) -> Iterator[Node]:
+    if isinstance(value, Node):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_nodes(item)
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Yields given node and all its descendants in depth first order."""
+
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        stack.extend(reversed(list(node.iter_child_nodes())))
+
+
+class Statement(Node):
+    __slots__ = ()
+
+
+class Expression(Node):
+    __slots__ = ()
 
 
 class Literal(Expression):
+    __slots__ = ('type', 'value')
 
     def __init__(self, typ: Type, value: Value):
         self.type = typ
@@ -20,12 +58,16 @@ class Literal(Expression):
 
 
 class WhileLoopStatement(Statement):
+    __slots__ = ('condition', 'body')
+
     def __init__(self, condition: Expression, body: "CompoundStatement"):
         self.condition = condition
         self.body = body
 
 
 class IfStatement(Statement):
+    __slots__ = ('condition', 'statement', 'elif_statements', 'else_statement')
+
     def __init__(
             self,
             condition_expr: Expression, statement: Any,
@@ -39,26 +81,33 @@ class IfStatement(Statement):
 
 
 class ElifStatement(Statement):
+    __slots__ = ('condition', 'statement')
+
     def __init__(self, condition_expr: Expression, statement: Any):
         self.condition = condition_expr
         self.statement = statement
 
 
 class ElseStatement(Statement):
+    __slots__ = ('statement',)
+
     def __init__(self, statement: Any):
         self.statement = statement
 
 
 class ReturnStatement(Statement):
+    __slots__ = ('expression',)
+
     def __init__(self, return_expr: Optional[Expression]):
         self.expression = return_expr
 
 
 class InlineReturnStatement(ReturnStatement):
-    pass
+    __slots__ = ()
 
 
 class FunctionDefinition(Statement):
+    __slots__ = ('name', 'return_type', 'parameters', 'body', '_builtin', 'type')
 
     def __init__(self, name: str, return_type: Any, parameters: list = None, body=None, builtin=False):
         self.name = name
@@ -70,18 +119,11 @@ class FunctionDefinition(Statement):
         self.type = Func(return_type=return_type, arguments_types=parameters)
 
     def build_generic_parameters(self, arguments):
-        parameters = []
-
-        if self._builtin:
-            self.body.parameters_list = parameters
-
-        for i, _ in enumerate(arguments):
-            parameters.append(Identifier(chr(97 + i)))
-
-        return parameters
+        return [Identifier(chr(97 + i)) for i, _ in enumerate(arguments)]
 
 
 class LambdaExpression(Expression):
+    __slots__ = ('name', 'return_type', 'parameters', 'body', 'type')
 
     def __init__(self, return_type: Any, arguments: list = None, body: Any = None):
         self.name = str(uuid.uuid4())
@@ -96,6 +138,7 @@ class LambdaExpression(Expression):
 
 
 class FunctionCall(Expression):
+    __slots__ = ('name', 'arguments')
 
     def __init__(self, name: str, arguments: list):
         self.name = name
@@ -103,6 +146,7 @@ class FunctionCall(Expression):
 
 
 class AssignmentStatement(Statement):
+    __slots__ = ('name', 'right_value')
 
     def __init__(self, name: str, right_value: Expression):
         self.name = name
@@ -110,16 +154,18 @@ class AssignmentStatement(Statement):
 
 
 class EmptyStatement(Statement):
-    pass
+    __slots__ = ()
 
 
 class CompoundStatement(Statement):
+    __slots__ = ('statements',)
 
     def __init__(self, statements: list[Statement]):
         self.statements = statements
 
 
 class DeclarationStatement(Statement):
+    __slots__ = ('left_value', 'right_value')
 
     def __init__(self, left_value: "Variable", right_value: Optional[Expression]):
         self.left_value = left_value
@@ -127,6 +173,7 @@ class DeclarationStatement(Statement):
 
 
 class BinaryExpression(Expression):
+    __slots__ = ('left_value', 'operator', 'right_value')
 
     def __init__(self, left_value: Expression, operator: Any, right_value: Expression):
         self.left_value = left_value
@@ -135,22 +182,23 @@ class BinaryExpression(Expression):
 
 
 class NullCoalesceExpression(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class OrExpression(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class AndExpression(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class EqualityExpression(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class CompFactor(Expression):
+    __slots__ = ('factor', 'negation')
 
     def __init__(self, neg_factor: Expression, negation: bool):
         self.factor = neg_factor
@@ -158,14 +206,15 @@ class CompFactor(Expression):
 
 
 class AdditiveExpression(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class MultiplicativeExpression(BinaryExpression):
-    pass
+    __slots__ = ()
 
 
 class NegFactor(Expression):
+    __slots__ = ('factor', 'minus')
 
     def __init__(self, factor: Expression, minus: bool):
         self.factor = factor
@@ -173,32 +222,47 @@ class NegFactor(Expression):
 
 
 class Factor(Expression):
+    __slots__ = ('value',)
 
     def __init__(self, value: Expression):
         self.value = value
 
 
+class UnaryNot(Expression):
+    """Logical negation with `not`. Replaces CompFactor in flattened expressions."""
+    __slots__ = ('operand',)
+
+    def __init__(self, operand: Expression):
+        self.operand = operand
+
+
+class UnaryMinus(Expression):
+    """Arithmetic negation with `-`. Replaces NegFactor in flattened expressions."""
+    __slots__ = ('operand',)
+
+    def __init__(self, operand: Expression):
+        self.operand = operand
+
+
 class Variable(Expression):
+    __slots__ = ('name', 'type', 'nullable', 'mutable')
 
     def __init__(self, name: str, typ: Type, nullable: bool = False, mutable: bool = True):
         self.name = name
         self.type = typ
-
-        # set by parser - controlled by interpreter
         self.nullable = nullable
         self.mutable = mutable
 
-        # set and controlled by interpreter
-        self.value = None
-
 
 class Identifier(Expression):
+    __slots__ = ('name',)
 
     def __init__(self, name: str):
         self.name = name
 
 
 class Parameter(Expression):
+    __slots__ = ('name', 'type', 'nullable', 'mutable')
 
     def __init__(self, name: str, typ: Type, nullable: bool = False, mutable: bool = True):
         self.name = name
@@ -1,4 +1,8 @@
-class Program:
+from src.parser.objects.objects import Node
+
+
+class Program(Node):
+    __slots__ = ('objects',)
 
     def __init__(self, objects):
         self.objects = objects
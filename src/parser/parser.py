@@ -15,7 +15,7 @@ from src.parser.objects.objects import (
     FunctionCall, FunctionDefinition, CompoundStatement, EmptyStatement, DeclarationStatement,
     AssignmentStatement, CompFactor, BinaryExpression, Expression, Parameter, Statement, Variable,
     NullCoalesceExpression, OrExpression, AndExpression, AdditiveExpression, MultiplicativeExpression, Literal, Factor,
-    Identifier, EqualityExpression, LambdaExpression, InlineReturnStatement, NegFactor
+    Identifier, EqualityExpression, LambdaExpression, InlineReturnStatement, NegFactor, UnaryNot, UnaryMinus
 )
 from src.parser.objects.program import Program
 from src.parser.types import TYPES_MAPPING, Type, Func, OPERATORS
@@ -27,11 +27,37 @@ LITERALS = [
     TokenType.TRUE_VALUE, TokenType.FALSE_VALUE, TokenType.NULL_VALUE
 ]
 
+# binary operators mapped to their precedence and class of expression they build,
+# operators with higher precedence bind stronger
+BINARY_OPERATORS = {
+    TokenType.NULL_COALESCE: (1, BinaryExpression),
+    TokenType.OR: (2, NullCoalesceExpression),
+    TokenType.AND: (3, OrExpression),
+    TokenType.EQ: (4, AndExpression),
+    TokenType.NEQ: (4, AndExpression),
+    TokenType.GT: (5, EqualityExpression),
+    TokenType.GTE: (5, EqualityExpression),
+    TokenType.LT: (5, EqualityExpression),
+    TokenType.LTE: (5, EqualityExpression),
+    TokenType.PLUS: (7, AdditiveExpression),
+    TokenType.MINUS: (7, AdditiveExpression),
+    TokenType.MUL: (8, MultiplicativeExpression),
+    TokenType.DIV: (8, MultiplicativeExpression),
+    TokenType.MODULO: (8, MultiplicativeExpression),
+}
+# `not` applies to whole arithmetic expression, but binds stronger than comparisons
+COMP_FACTOR_PRECEDENCE = 6
+
 
 class Parser:
+    """Builds program from tokens provided by lexer.
+
+    With `flatten` option, expressions are not wrapped in CompFactor, NegFactor and Factor objects.
+    Negations are represented by UnaryNot and UnaryMinus objects only where `not` or `-` appeared."""
 
-    def __init__(self, lexer: Lexer) -> None:
+    def __init__(self, lexer: Lexer, flatten: bool = False) -> None:
         self.lexer = lexer
+        self.flatten = flatten
         self.lexer.build_next_token()
 
     def parse_program(self) -> Program:
@@ -415,140 +441,76 @@ class Parser:
     def try_parse_expression(self) -> Optional[Expression]:
         """Tries to parse expression which can resolve into any other expression."""
 
-        left_expr = self.try_parse_null_coalesce_expression()
-
-        while operator := self.check_and_consume(TokenType.NULL_COALESCE):
-
-            if not (expr := self.try_parse_null_coalesce_expression()):
-                raise InvalidRightExpressionError(self.lexer.token)
-
-            left_expr = BinaryExpression(
-                left_expr, OPERATORS[operator.type], expr
-            )
-
-        return left_expr
-
-    def try_parse_null_coalesce_expression(self) -> Optional[Expression]:
-        """Tries to parse null coalesce expression."""
-
-        left_expr = self.try_parse_or_expression()
-
-        while operator := self.check_and_consume(TokenType.OR):
-
-            if not (expr := self.try_parse_or_expression()):
-                raise InvalidRightExpressionError(self.lexer.token)
-
-            left_expr = NullCoalesceExpression(
-                left_expr, OPERATORS[operator.type], expr
-            )
-
-        return left_expr
-
-    def try_parse_or_expression(self) -> Optional[Expression]:
-        """Tries to parse or expression."""
-
-        left_expr = self.try_parse_and_expression()
-
-        while operator := self.check_and_consume(TokenType.AND):
-
-            if not (expr := self.try_parse_and_expression()):
-                raise InvalidRightExpressionError(self.lexer.token)
-
-            left_expr = OrExpression(
-                left_expr, OPERATORS[operator.type], expr
-            )
-
-        return left_expr
-
-    def try_parse_and_expression(self) -> Optional[Expression]:
-        """Tries to parse and expression."""
+        return self.try_parse_binary_expression(min_precedence=1)
 
-        left_expr = self.try_parse_equality_expression()
+    def try_parse_binary_expression(self, min_precedence: int) -> Optional[Expression]:
+        """Tries to parse expression consisting of binary operators with precedence not lower
+        than min_precedence, using precedence climbing. Builds the same objects as a separate method
+        for every precedence level would - operands of comparisons are wrapped in CompFactor
+        and operands of arithmetic operators are wrapped in NegFactor.
 
-        while operator := self.check_one_of_many_and_consume([
-            TokenType.EQ, TokenType.NEQ
-        ]):
-
-            if not (expr := self.try_parse_equality_expression()):
-                raise InvalidRightExpressionError(self.lexer.token)
+        Operators with the same precedence are left associative."""
 
-            left_expr = AndExpression(
-                left_expr, OPERATORS[operator.type], expr
-            )
+        if min_precedence <= COMP_FACTOR_PRECEDENCE:
+            # comp factor stores information about potential logical negation with `not`
+            seen_not_token = self.check_and_consume(TokenType.NOT)
 
-        return left_expr
+            if add_factor := self.try_parse_binary_expression(COMP_FACTOR_PRECEDENCE + 1):
+                left_expr = self.build_comp_factor(add_factor, bool(seen_not_token))
+            else:
+                left_expr = None
 
-    def try_parse_equality_expression(self) -> Optional[Expression]:
-        """Tries to parse equality expression."""
+        else:
+            # neg factor stores information about potential arithmetic negation with `-`
+            seen_minus_token = self.check_and_consume(TokenType.MINUS)
 
-        left_expr = self.try_parse_comp_factor()
+            if factor := self.try_parse_factor():
+                left_expr = self.build_neg_factor(factor, bool(seen_minus_token))
+            else:
+                left_expr = None
 
-        while operator := self.check_one_of_many_and_consume([
-            TokenType.GT, TokenType.GTE, TokenType.LT, TokenType.LTE,
-        ]):
+        while (
+                (binary_operator := BINARY_OPERATORS.get(self.lexer.token.type))
+                and binary_operator[0] >= min_precedence
+        ):
+            precedence, expression_class = binary_operator
+            operator = self.lexer.token
+            self.lexer.build_next_token()
 
-            if not (expr := self.try_parse_comp_factor()):
+            # operator with higher precedence binds right operand first
+            if not (expr := self.try_parse_binary_expression(precedence + 1)):
                 raise InvalidRightExpressionError(self.lexer.token)
 
-            left_expr = EqualityExpression(
+            left_expr = expression_class(
                 left_expr, OPERATORS[operator.type], expr
             )
 
         return left_expr
 
-    def try_parse_comp_factor(self) -> Optional[Expression]:
-        """Tries to parse comp factor which stores factor and information
-        about potential logical negation with `not`."""
+    def build_comp_factor(self, expression: Expression, negation: bool) -> Expression:
+        """Builds CompFactor or, in flattened expressions, UnaryNot only if expression was negated."""
 
-        seen_not_token = self.check_and_consume(TokenType.NOT)
+        if not self.flatten:
+            return CompFactor(expression, negation)
 
-        if not (add_factor := self.try_parse_add_factor()):
-            return None
+        return UnaryNot(expression) if negation else expression
 
-        return CompFactor(add_factor, bool(seen_not_token))
+    def build_neg_factor(self, expression: Expression, minus: bool) -> Expression:
+        """Builds NegFactor or, in flattened expressions, UnaryMinus only if expression was negated."""
 
-    def try_parse_add_factor(self) -> Optional[Expression]:
-        """Tries to parse additive expression."""
+        if not self.flatten:
+            return NegFactor(expression, minus)
 
-        left_expr = self.try_parse_mult_factor()
+        return UnaryMinus(expression) if minus else expression
 
-        while operator := self.check_one_of_many_and_consume([TokenType.PLUS, TokenType.MINUS]):
-
-            if not (expr := self.try_parse_mult_factor()):
-                raise InvalidRightExpressionError(self.lexer.token)
-
-            left_expr = AdditiveExpression(
-                left_expr, OPERATORS[operator.type], expr
-            )
-
-        return left_expr
+    def build_factor(self, expression: Expression) -> Expression:
+        """Builds Factor or, in flattened expressions, returns expression itself."""
 
-    def try_parse_mult_factor(self) -> Optional[Expression]:
-        """Tries to parse multiplicative expression."""
+        # empty parentheses still have to result in a factor, so that parsing continues the same way
+        if not self.flatten or expression is None:
+            return Factor(value=expression)
 
-        left_expr = self.try_parse_neg_factor()
-
-        while operator := self.check_one_of_many_and_consume([TokenType.MUL, TokenType.DIV, TokenType.MODULO]):
-
-            if not (expr := self.try_parse_neg_factor()):
-                raise InvalidRightExpressionError(self.lexer.token)
-
-            left_expr = MultiplicativeExpression(
-                left_expr, OPERATORS[operator.type], expr
-            )
-
-        return left_expr
-
-    def try_parse_neg_factor(self):
-        """Tries to parse neg factor which stores factor and information
-        about potential arithmetic negation with `-`."""
-
-        seen_minus_token = self.check_and_consume(TokenType.MINUS)
-
-        if not (factor := self.try_parse_factor()):
-            return None
-
-        return NegFactor(factor, bool(seen_minus_token))
+        return expression
 
     def try_parse_factor(self) -> Optional[Factor]:
         """Tries to parse Factor which can be either:
@@ -584,7 +546,7 @@ class Parser:
             case _:
                 value = literal_token.value
 
-        return Factor(value=Literal(typ, value))
+        return self.build_factor(Literal(typ, value))
 
     def try_parse_id_or_func_call_or_lambda_expr(self) -> Optional[Factor]:
         """Tries to parse factors which can begin with identifier. It can either
@@ -595,13 +557,13 @@ class Parser:
             return None
 
         if func_call := self.try_parse_func_call(func_name=token.value):
-            return Factor(value=func_call)
+            return self.build_factor(func_call)
 
         # lambda expression will be parsed when parser enters nested expression
         if lambda_expr := self.try_parse_rest_of_lambda_definition(token.value):
-            return Factor(value=lambda_expr)
+            return self.build_factor(lambda_expr)
 
-        return Factor(value=Identifier(token.value))
+        return self.build_factor(Identifier(token.value))
 
     def try_parse_rest_of_lambda_definition(self, first_argument_name: str):
         """Tries to parse lambda definition which happened to have an opening parenthesis
@@ -656,8 +618,8 @@ class Parser:
                 return_type = self.try_parse_return_type()
                 self.expect_and_consume(TokenType.ARROW)
                 func_body = self.try_parse_func_body()
-                return Factor(
-                    value=LambdaExpression(
+                return self.build_factor(
+                    LambdaExpression(
                         return_type=return_type,
                         arguments=[],
                         body=func_body
@@ -674,11 +636,22 @@ class Parser:
                 # simplify structure (no information is lost)
                 return Factor(value=expression.factor.factor.value)
 
+            # the same in flattened expressions, negations of lambda are dropped as well
+            case (
+                LambdaExpression()
+                | UnaryMinus(operand=LambdaExpression())
+                | UnaryNot(operand=LambdaExpression())
+                | UnaryNot(operand=UnaryMinus(operand=LambdaExpression()))
+            ) if self.flatten:
+                while not isinstance(expression, LambdaExpression):
+                    expression = expression.operand
+                return expression
+
             # require closing parenthesis in other cases
             case _:
                 self.expect_and_consume(TokenType.RPAREN)
 
-        return Factor(value=expression)
+        return self.build_factor(expression)
 
     def check_and_consume(self, token_type: TokenType) -> Optional[Token]:
         """If type is valid, asks lexer for a next token and returns current token,
@@ -7,57 +7,134 @@ Value = str | int | float | bool | None
 
 
 class Type:
+    __slots__ = ()
 
     def __eq__(self, other):
         return type(self) == type(other)
 
+    def __hash__(self):
+        return hash(type(self))
+
     def __str__(self):
         return self.__class__.__name__
 
 
-class Integer(Type):
-    pass
+class PrimitiveType(Type):
+    """Type without any parameters. Every primitive type has exactly one instance,
+    which is returned on every instantiation, so types can be compared by identity."""
+
+    __slots__ = ()
+
+    _instance = None
+
+    def __new__(cls):
+        instance = cls.__dict__.get('_instance')
 
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+
+        return instance
+
+    def __eq__(self, other):
+        return self is other
 
-class Float(Type):
-    pass
+    def __hash__(self):
+        return id(self)
 
+    def __reduce__(self):
+        # unpickled types are the same singletons
+        return self.__class__, ()
 
-class Bool(Type):
-    pass
 
+class Integer(PrimitiveType):
+    __slots__ = ()
 
-class String(Type):
-    pass
 
+class Float(PrimitiveType):
+    __slots__ = ()
 
-class Null(Type):
+
+class Bool(PrimitiveType):
+    __slots__ = ()
+
+
+class String(PrimitiveType):
+    __slots__ = ()
+
+
+class Null(PrimitiveType):
+    __slots__ = ()
 
     def __eq__(self, other):
-        return type(self) == type(other) or type(other) == Void
+        return self is other or other is VOID
+
+    def __hash__(self):
+        # equal to Void, so it has to hash the same
+        return hash(Null)
 
 
-class Void(Type):
+class Void(PrimitiveType):
     """Void can only appear in function's signature.
     It is considered the same as Null type when returned from function."""
 
+    __slots__ = ()
+
     def __eq__(self, other):
-        return type(self) == type(other) or type(other) == Null
+        return self is other or other is NULL
+
+    def __hash__(self):
+        return hash(Null)
+
+
+INTEGER = Integer()
+FLOAT = Float()
+BOOL = Bool()
+STRING = String()
+NULL = Null()
+VOID = Void()
 
 
 class Func(Type):
+    """Function type. Structurally identical signatures share one canonical `signature` tuple,
+    so comparing and hashing function types takes constant time regardless of their size."""
+
+    __slots__ = ('input_types', 'output_type', 'signature')
+
+    # structural signature -> its canonical instance
+    _signatures: dict[tuple, tuple] = {}
 
     def __init__(self, arguments_types: list, return_type: Type):
         self.input_types = arguments_types
         self.output_type = return_type
+        self.signature = self._intern_signature(arguments_types, return_type)
+
+    @classmethod
+    def _intern_signature(cls, arguments_types: list, return_type: Type) -> tuple:
+        """Returns canonical signature made of parameter types and return type.
+        Generic parameters, which do not have a type, are represented by None."""
+
+        signature = (tuple(getattr(argument, 'type', None) for argument in arguments_types or ()), return_type)
+        return cls._signatures.setdefault(signature, signature)
 
     def __eq__(self, other):
-        if not hasattr(other, 'input_types') or not hasattr(other, 'output_type'):
-            return False
+        return isinstance(other, Func) and self.signature is other.signature
+
+    def __hash__(self):
+        return id(self.signature)
+
+    def __reduce__(self):
+        # signature of unpickled type has to be interned again
+        return self.__class__, (self.input_types, self.output_type)
+
+    def __str__(self):
+        """Renders signature, e.g. `Func((Integer, Generic) => Void)`, so that errors tell signatures apart."""
+
+        parameters_types, return_type = self.signature
+        parameters = ", ".join("Generic" if typ is None else str(typ) for typ in parameters_types)
+        return f"Func(({parameters}) => {return_type})"
 
-        return_match = self.output_type == other.output_type
-        parameters_match = all(s.type == o.type for s, o in zip(self.input_types, other.input_types))
-        return return_match and parameters_match
+    __repr__ = __str__
 
 
 TYPES_MAPPING = {
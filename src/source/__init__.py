@@ -1,5 +1,6 @@
-from .source import Source, FileSource, StringSource
+from .line_index import LineIndex
+from .source import Source, FileSource, BufferedFileSource, MmapSource, StringSource
 
 __all__ = (
-    "Source", "FileSource", "StringSource"
+    "LineIndex", "Source", "FileSource", "BufferedFileSource", "MmapSource", "StringSource"
 )
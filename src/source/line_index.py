@@ -0,0 +1,52 @@
+from array import array
+from bisect import bisect_right
+
+
+class LineIndex:
+    """Sorted offsets of newline characters in a source. Allows computing line and column
+    of any offset on demand, so that sources only have to keep track of an absolute offset.
+
+    Newline character itself belongs to the next line and has column 0. First character of a source
+    always has line 1 and column 1, even if it is a newline."""
+
+    def __init__(self):
+        self.newlines = array('L')
+
+    @classmethod
+    def from_text(cls, text: str) -> "LineIndex":
+        """Builds index of the whole text at once."""
+
+        line_index = cls()
+        line_index.add_text(text, 0)
+        return line_index
+
+    def add(self, offset: int) -> None:
+        """Registers newline at given offset. Offsets have to be added in increasing order."""
+
+        self.newlines.append(offset)
+
+    def add_text(self, text: str, start: int) -> None:
+        """Registers all newlines of a text fragment which begins at `start` offset in source."""
+
+        newlines = self.newlines
+        # first character of a source is never treated as a line break
+        index = text.find("\n", 1 if start == 0 else 0)
+
+        while index != -1:
+            newlines.append(start + index)
+            index = text.find("\n", index + 1)
+
+    def line(self, offset: int) -> int:
+        """Returns line number (starting from 1) of given offset."""
+
+        return bisect_right(self.newlines, offset) + 1
+
+    def column(self, offset: int) -> int:
+        """Returns column number of given offset. First character in text has column 1."""
+
+        preceding_newlines = bisect_right(self.newlines, offset)
+
+        if preceding_newlines == 0:
+            return offset + 1
+
+        return offset - self.newlines[preceding_newlines - 1]
@@ -1,42 +1,90 @@
+import codecs
+import io
+import mmap
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterator
 
 from src.lexer.token_type import ETX_VALUE
+from src.source.line_index import LineIndex
+
+
+@lru_cache
+def stop_pattern(stop_chars: str) -> re.Pattern:
+    """Pattern matching any of given characters or ETX."""
+    return re.compile(f"[{re.escape(stop_chars)}{ETX_VALUE}]")
 
 
 class Source:
+    """Source of characters for the lexer. Only absolute position of current character
+    is tracked while reading, line and column are computed on demand from line index."""
 
     def __init__(self, text: Generator):
         self.iterator = iter(text)
+        self.line_index = LineIndex()
 
         try:
             self.current_char: str = next(self.iterator)
         except StopIteration:
             self.current_char = ETX_VALUE
 
-        # start indexing from 1 - so that it is human readable
-        self.line = 1
-        self.column = 1
-
         self.current_position = 0  # position in source
 
+    @property
+    def line(self) -> int:
+        """Line of current character, starting from 1 - so that it is human readable."""
+        return self.line_index.line(self.current_position)
+
+    @property
+    def column(self) -> int:
+        """Column of current character, starting from 1 - so that it is human readable."""
+        return self.line_index.column(self.current_position)
+
     def get_next_character(self) -> None:
         """Tries to get next character from text iterator.
-        Sets current_char and current position in text and in source.
+        Sets current_char and current position in source.
         Upon reaching end of text, sets current character to ETX.
         """
 
         try:
-            self.current_char = next(self.iterator)
-            self.column += 1
-            self.current_position += 1
-
-            if self.current_char == "\n":
-                self.line += 1
-                self.column = 0
-
+            self.current_char = char = next(self.iterator)
         except StopIteration:
             self.current_char = ETX_VALUE
+            return
+
+        self.current_position += 1
+
+        if char == "\n":
+            self.line_index.add(self.current_position)
+
+    def skip_to(self, stop_chars: str) -> None:
+        """Moves to the nearest character which is one of stop_chars or ETX,
+        without collecting skipped characters."""
+
+        while self.current_char not in stop_chars and self.current_char != ETX_VALUE:
+            self.get_next_character()
+
+    def read_remaining(self) -> str:
+        """Reads all characters from current one to the end of text at once
+        and returns them as a string. Afterwards current character is ETX."""
+
+        if self.current_char == ETX_VALUE:
+            return ""
+
+        remaining = self.current_char + "".join(self.iterator)
+        self.current_char = ETX_VALUE
+        return remaining
+
+    def read_blocks(self) -> Iterator[str]:
+        """Reads all characters from current one to the end of text in blocks and registers their newlines
+        in line index. Afterwards current character is ETX."""
+
+        start = self.current_position
+        if remaining := self.read_remaining():
+            # newline at current position was already registered
+            self.line_index.add_text(remaining[1:], start + 1)
+            yield remaining
 
 
 class FileSource(Source):
@@ -53,11 +101,203 @@ class FileSource(Source):
             yield c
 
     def __del__(self):
-        self._file.close()
+        if (file := getattr(self, '_file', None)) is not None:
+            file.close()
+
+
+class BufferedFileSource(Source):
+    """File source which reads the file in blocks of `block_size` characters
+    and scans each block in memory. Only one block is kept in memory at a time."""
+
+    BLOCK_SIZE = 64 * 1024
+
+    def __init__(self, file_name: Path, block_size: int = BLOCK_SIZE):
+        self._file = open(file_name, 'r')
+        self._start(block_size)
+
+    def _start(self, block_size: int) -> None:
+        """Reads the first block and moves to its first character."""
+
+        self._block_size = block_size
+        self.line_index = LineIndex()
+
+        block = self._read_block()
+        self.line_index.add_text(block, 0)
+        self._block = block
+        self._block_start = 0  # position of first character of current block in source
+        self._index = 0 if block else -1  # index of current character in current block
+
+        self.current_char = block[0] if block else ETX_VALUE
+        self.current_position = 0  # position in source
+
+    def _read_block(self) -> str:
+        """Reads next block of text, empty block means that the file was read to the end."""
+        return self._file.read(self._block_size)
+
+    def get_next_character(self) -> None:
+        """Moves to the next character in the current block, reading next block at block boundary.
+        Upon reaching end of file, sets current character to ETX."""
+
+        index = self._index + 1
+        block = self._block
+
+        if index == len(block):
+            # file was already read to the end
+            if not block:
+                return
+
+            block = self._read_block()
+            self.line_index.add_text(block, self.current_position + 1)
+            self._block = block
+            self._block_start = self.current_position + 1
+            index = 0
+
+            if not block:
+                self._index = -1
+                self.current_char = ETX_VALUE
+                return
+
+        self._index = index
+        self.current_char = block[index]
+        self.current_position += 1
+
+    def skip_to(self, stop_chars: str) -> None:
+        """Searches for the nearest stop character block by block, without visiting skipped characters."""
+
+        pattern = stop_pattern(stop_chars)
+
+        while self.current_char not in stop_chars and self.current_char != ETX_VALUE:
+            block = self._block
+            match = pattern.search(block, self._index + 1)
+
+            if match is not None:
+                index = match.start()
+                self.current_char = block[index]
+                self.current_position = self._block_start + index
+                self._index = index
+                return
+
+            # move to the last character of current block and read the next one
+            self._index = len(block) - 1
+            self.current_char = block[-1]
+            self.current_position = self._block_start + self._index
+            self.get_next_character()
+
+    def read_remaining(self) -> str:
+        """Reads rest of current block and rest of the file at once."""
+        return "".join(self.read_blocks())
+
+    def read_blocks(self) -> Iterator[str]:
+        """Yields rest of current block and then the following blocks, one block is kept in memory at a time."""
+
+        if self.current_char == ETX_VALUE:
+            return
+
+        block = self._block[self._index:]
+        position = self._block_start + len(self._block)
+
+        self._block = ""
+        self._index = -1
+        self.current_char = ETX_VALUE
+
+        while block:
+            yield block
+            block = self._read_block()
+            self.line_index.add_text(block, position)
+            position += len(block)
+
+    def __del__(self):
+        if (file := getattr(self, '_file', None)) is not None:
+            file.close()
+
+
+class MmapSource(BufferedFileSource):
+    """File source which memory-maps the file and decodes it from the mapped bytes in blocks of `block_size` bytes.
+    Mapped pages are shared between processes reading the same file and only one decoded block is kept in memory.
+    Line endings are translated to `\n` the same way as in files opened in text mode."""
+
+    def __init__(self, file_name: Path, block_size: int = BufferedFileSource.BLOCK_SIZE):
+        with open(file_name, 'rb') as file:
+            size = file.seek(0, 2)
+            # empty files cannot be mapped
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+        self._size = size
+        self._map_offset = 0  # offset of the first byte which is not decoded yet
+        # characters and `\r\n` split between blocks are kept by decoder until the next block
+        self._decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+        self._start(block_size)
+
+    def _read_block(self) -> str:
+        """Decodes next block of mapped bytes, empty block means that the file was decoded to the end."""
+
+        while self._map_offset < self._size:
+            start = self._map_offset
+            self._map_offset = end = min(start + self._block_size, self._size)
+
+            if block := self._decoder.decode(self._map[start:end], final=end == self._size):
+                return block
+
+        return ""
+
+    def __del__(self):
+        if isinstance(mapped := getattr(self, '_map', None), mmap.mmap):
+            mapped.close()
 
 
 class StringSource(Source):
 
     def __init__(self, string: str):
-        generator = (char for char in string)
-        super().__init__(generator)
+        self._string = string
+        self._end = len(string)  # offset at which reading stops
+        self.line_index = LineIndex.from_text(string)
+
+        self.current_char = string[0] if string else ETX_VALUE
+        self.current_position = 0  # position in source
+
+    def get_next_character(self) -> None:
+        """Moves to the next character of the string. Upon reaching end of text, sets current character to ETX."""
+
+        position = self.current_position + 1
+
+        if position >= self._end:
+            self.current_char = ETX_VALUE
+            return
+
+        self.current_char = self._string[position]
+        self.current_position = position
+
+    def skip_to(self, stop_chars: str) -> None:
+        """Searches for the nearest stop character in the string, without visiting skipped characters."""
+
+        if self.current_char in stop_chars or self.current_char == ETX_VALUE:
+            return
+
+        string = self._string
+        match = stop_pattern(stop_chars).search(string, self.current_position + 1)
+
+        if match is None:
+            # position stays at the last character after reaching end of text
+            self.current_char = ETX_VALUE
+            self.current_position = len(string) - 1
+            return
+
+        index = match.start()
+        self.current_char = string[index]
+        self.current_position = index
+
+    def read_remaining(self) -> str:
+        """Returns rest of the string from current character."""
+
+        if self.current_char == ETX_VALUE:
+            return ""
+
+        self._end = 0
+        self.current_char = ETX_VALUE
+        return self._string[self.current_position:]
+
+    def read_blocks(self) -> Iterator[str]:
+        """Yields rest of the string as a single block, its newlines are already indexed."""
+
+        if remaining := self.read_remaining():
+            yield remaining
@@ -0,0 +1,171 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.errors.interpreter import (
+    ArgumentsError, ArgumentTypeError, AssignmentTypeMismatchError, ConstAssignmentError, NotNullableError,
+    ReturnTypeMismatchError, TypeMismatchError, UnexpectedTypeError, UninitializedConstError
+)
+from src.interpreter.checker import TypeChecker
+from src.parser.objects.objects import walk, AssignmentStatement, DeclarationStatement, FunctionCall
+from src.tests.utils import setup_parser, setup_interpreter, mock_stdout
+
+
+def check(text: str):
+    program = setup_parser(text).parse_program()
+    return program, TypeChecker().check(program)
+
+
+class TypeCheckerErrorsTests(unittest.TestCase):
+
+    @parameterized.expand([
+        ('let a: int = 1.5;', TypeMismatchError),
+        ('let a: str = 1;', TypeMismatchError),
+        ('let a: int = null;', NotNullableError),
+        ('def f(): void => {} let a: int = f();', NotNullableError),
+        ('let a: int;', NotNullableError),
+        ('const a?: int;', UninitializedConstError),
+        ('let a: int = 1; a = "text";', AssignmentTypeMismatchError),
+        ('let a: int = 1; a = null;', NotNullableError),
+        ('const a: int = 1; a = 2;', ConstAssignmentError),
+        ('def f(x: int): int => x f(1, 2);', ArgumentsError),
+        ('def f(x: int): int => x f(1.5);', ArgumentTypeError),
+        ('def f(x: float): int => 1 f(1);', ArgumentTypeError),
+        ('def f(): str => 1', ReturnTypeMismatchError),
+        ('def f(): void => { return 1; }', ReturnTypeMismatchError),
+        ('let a: int = 1 + "text";', UnexpectedTypeError),
+        ('let a: bool = 1 == 1.0;', UnexpectedTypeError),
+        ('let a: bool = not 1;', UnexpectedTypeError),
+        ('let a: str = -"text";', UnexpectedTypeError),
+        ('if (1) {}', UnexpectedTypeError),
+        ('while ("text") {}', UnexpectedTypeError),
+    ])
+    def test_error_is_reported(self, text, error_class):
+        _, verification = check(text)
+        self.assertEqual([error.__class__ for error in verification.errors], [error_class])
+
+    @parameterized.expand([
+        ('let a: float = 1;',),
+        ('let a?: int = null;',),
+        ('let a: float = 1.5; a = 2;',),
+        ('def f(): int => 1.5',),
+        ('def f(): void => { return; }',),
+        ('def f(): int => 1 let a: int = f() + 1;',),
+        ('let a: int = 5 / 0;',),
+        ('let a?: int = null ?? 1;',),
+        ('let s: str = String(1) + "text";',),
+        ('def f(): void => { print(a); } f(1);',),
+        ('let f: func((x: int) => int) = (x: int): int => x; let a: int = f(1);',),
+    ])
+    def test_valid_program_has_no_errors(self, text):
+        _, verification = check(text)
+        self.assertEqual(verification.errors, [])
+
+    def test_error_is_reported_in_code_which_is_not_run(self):
+        _, verification = check("if (false) { let a: int = 1.5; }")
+        self.assertEqual([error.__class__ for error in verification.errors], [TypeMismatchError])
+
+    def test_unknown_types_are_not_reported(self):
+        _, verification = check("""
+        let a: int = 1;
+        let a: str = "text";
+        let b: int = a + 1;
+        """)
+        self.assertEqual(verification.errors, [])
+
+
+class TypeCheckerVerificationTests(unittest.TestCase):
+
+    def verified_classes(self, text: str) -> list:
+        program, verification = check(text)
+        return [node.__class__ for node in walk(program) if node in verification.verified]
+
+    def test_verified_nodes(self):
+        text = """
+        def add(x: int, y: int): int => x + y
+        let i: int = 0;
+        i = add(i, 1);
+        """
+        self.assertEqual(self.verified_classes(text), [DeclarationStatement, AssignmentStatement, FunctionCall])
+
+    @parameterized.expand([
+        ('const i: int = 0; let i: int = 1;', DeclarationStatement),
+        ('let i: float = 1;', DeclarationStatement),
+        ('let i: float = 1.0; i = 1;', AssignmentStatement),
+        ('let i?: int = 1; i = null;', AssignmentStatement),
+        ('def f(x: int): int => x f(1.5);', FunctionCall),
+        ('def f(): int => 1.5 f();', FunctionCall),
+        ('def f(): int => { if (true) { return 1; } } f();', FunctionCall),
+        ('def f(x: int): int => x let x: str = "text"; f(1);', FunctionCall),
+    ])
+    def test_not_verified_nodes(self, text, node_class):
+        self.assertNotIn(node_class, self.verified_classes(text))
+
+    def test_recursive_integer_function_is_verified(self):
+        text = """
+        def fib(n: int): int => {
+            if (n < 2) {
+                return n;
+            }
+            return fib(n - 1) + fib(n - 2);
+        }
+        fib(10);
+        """
+        self.assertEqual(self.verified_classes(text).count(FunctionCall), 3)
+
+    def test_function_returning_float_from_integer_function_is_not_verified(self):
+        text = """
+        def half(n: int): int => {
+            if (n > 0) {
+                return half(n - 1);
+            }
+            return n / 2.0;
+        }
+        half(10);
+        """
+        self.assertEqual(self.verified_classes(text), [])
+
+    def test_operations_are_specialised(self):
+        program, verification = check("let a: int = 1; let b: float = a * 2 + 0.5; let c: bool = b > 1;")
+        self.assertEqual(len(verification.operations), 3)
+
+
+# noinspection PyMethodMayBeStatic
+class InterpreterVerifiedProgramTests(unittest.TestCase):
+
+    @mock_stdout
+    def test_errors_are_raised_only_when_code_is_run(self, stdout):
+        text = """
+        if (false) {
+            let a: int = 1.5;
+        }
+        print("ok");
+        """
+        setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "ok\n")
+
+    def test_errors_are_raised_when_code_is_run(self):
+        with self.assertRaises(TypeMismatchError):
+            setup_interpreter("if (true) { let a: int = 1.5; }").interpret()
+
+    @mock_stdout
+    def test_verified_program(self, stdout):
+        text = """
+        def fib(n: int): int => {
+            if (n < 2) {
+                return n;
+            }
+            return fib(n - 1) + fib(n - 2);
+        }
+
+        let i: int = 0;
+        let total: float = 0.5;
+        while (i < 10) {
+            let value: int = fib(i);
+            total = total + value;
+            i = i + 1;
+        }
+        print(total, 7 / 2);
+        """
+        setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "88.5 3.5\n")
@@ -0,0 +1,149 @@
+import contextlib
+import io
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized
+
+from src.errors.interpreter import (
+    DivisionByZeroError, ReturnOutsideOfFunctionError, UndefinedNameError, UnexpectedTypeError
+)
+from src.interpreter.closures import ClosureInterpreter
+from src.interpreter.interpreter import Interpreter
+from src.tests.interpreter import test_conditionals, test_const_let, test_functions, test_loops, test_operators
+from src.tests.utils import setup_parser, mock_stdout
+
+EXAMPLES_DIR = Path(__file__).parents[3] / "examples"
+
+
+def setup_closure_interpreter(text: str, flatten: bool = False) -> ClosureInterpreter:
+    return ClosureInterpreter(parser=setup_parser(text, flatten=flatten))
+
+
+def run_program(interpreter_class: type[Interpreter], text: str) -> str:
+    with contextlib.redirect_stdout(io.StringIO()) as stdout:
+        try:
+            interpreter_class(parser=setup_parser(text, flatten=True)).interpret()
+        except Exception as error:
+            print(error.__class__.__name__)
+
+    return stdout.getvalue()
+
+
+class ClosureInterpreterTests(unittest.TestCase):
+
+    @parameterized.expand([
+        ("everything.ty",),
+        ("fizzbuzz.ty",),
+        ("lambdas.ty",),
+        ("main.ty",),
+    ])
+    def test_examples_same_output(self, file_name: str):
+        text = (EXAMPLES_DIR / file_name).read_text()
+        self.assertEqual(run_program(ClosureInterpreter, text), run_program(Interpreter, text))
+
+    @parameterized.expand([
+        ('print(a);', UndefinedNameError),
+        ('return 1;', ReturnOutsideOfFunctionError),
+        ('let a: int = 1; while (a) {}', UnexpectedTypeError),
+        ('let a: int = 1; let b: int = (a + 1) / (a - 1);', DivisionByZeroError),
+    ])
+    def test_errors_are_raised(self, text, error_class):
+        with self.assertRaises(error_class):
+            setup_closure_interpreter(text).interpret()
+
+    def test_nodes_are_compiled_once(self):
+        text = """
+        def f(x: int): int => x + 1
+        let i: int = 0;
+        while (i < 10) {
+            i = f(i);
+        }
+        """
+        interpreter = setup_closure_interpreter(text)
+        interpreter.interpret()
+        compiled = dict(interpreter.compiler.code)
+
+        self.assertEqual(interpreter.env.get_variable('i').value.value, 10)
+        self.assertEqual(interpreter.compiler.code, compiled)
+
+    @mock_stdout
+    def test_redefined_function_is_called(self, stdout):
+        text = """
+        def f(): int => 1
+        def g(): void => {
+            print(f());
+        }
+        g();
+        def f(): int => 2
+        g();
+        """
+        setup_closure_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "1\n2\n")
+
+    @mock_stdout
+    def test_variable_changed_by_function_call_in_expression(self, stdout):
+        text = """
+        let a: int = 1;
+        def f(): int => {
+            a = 10;
+            return 1;
+        }
+        print(a + f());
+        """
+        setup_closure_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "11\n")
+
+    @parameterized.expand([
+        ('let a: int = 3; print(a / 2 + 1, a * 2 - 1, a % 2 == 1, 1.5 * a > 4.0);',),
+        ('let a: int = 3; let b: float = 0.5; if (a / 2 > 1 and b < 1.0) { print(a - b); }',),
+        ('let total: int = 1; def f(x: int): int => { if (x > 0) { let total: int = x; } return total; } print(f(2));',),
+        ('def f(): int => { let x: int = 2; return x * 3; } let y: int = f() + f(); print(y);',),
+    ])
+    def test_verified_operations_same_output(self, text):
+        self.assertEqual(run_program(ClosureInterpreter, text), run_program(Interpreter, text))
+
+
+class ClosureInterpreterMixin:
+    """Runs interpreter tests with programs compiled into closures."""
+
+    flatten = False
+
+    def setup_interpreter(self, text: str) -> Interpreter:
+        return setup_closure_interpreter(text, flatten=self.flatten)
+
+
+class FlattenedClosureInterpreterMixin(ClosureInterpreterMixin):
+    flatten = True
+
+
+class InterpreterConditionalsTests(ClosureInterpreterMixin, test_conditionals.InterpreterConditionalsTests):
+    pass
+
+
+class InterpreterConstLetAssignmentAndDeclarationTests(
+    ClosureInterpreterMixin, test_const_let.InterpreterConstLetAssignmentAndDeclarationTests
+):
+    pass
+
+
+class InterpreterFunctionsTests(ClosureInterpreterMixin, test_functions.InterpreterFunctionsTests):
+    pass
+
+
+class InterpreterWhileLoopTests(ClosureInterpreterMixin, test_loops.InterpreterWhileLoopTests):
+    pass
+
+
+class InterpreterOperatorAllowedTypesTests(ClosureInterpreterMixin, test_operators.InterpreterOperatorAllowedTypesTests):
+    pass
+
+
+class FlattenedInterpreterOperatorAllowedTypesTests(
+    FlattenedClosureInterpreterMixin, test_operators.InterpreterOperatorAllowedTypesTests
+):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
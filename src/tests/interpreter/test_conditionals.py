@@ -3,11 +3,12 @@ import unittest
 from parameterized import parameterized
 
 from src.errors.interpreter import UnexpectedTypeError
-from src.tests.utils import setup_interpreter, mock_stdout
+from src.tests.interpreter.utils import InterpreterTestCase
+from src.tests.utils import mock_stdout
 
 
 # noinspection PyMethodMayBeStatic
-class InterpreterConditionalsTests(unittest.TestCase):
+class InterpreterConditionalsTests(InterpreterTestCase):
 
     @mock_stdout
     def test_if_statement_true_condition(self, stdout):
@@ -16,7 +17,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
             print("if");
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "if\n")
 
     @mock_stdout
@@ -26,7 +27,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
             print("if");
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "")
 
     @mock_stdout
@@ -41,7 +42,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
             print("this won't run as well");
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue().strip(), "0 <- inside if")
 
     def test_if_statement_false_condition_one_of_elifs_true(self):
@@ -54,7 +55,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
             const a: int = 15;
         } else { while(true) {} }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         a = interpreter.env.get_variable('a')
         self.assertIsNone(a)  # variable exists in local scope, not in global scope
@@ -74,7 +75,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
             print("this will run");
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "this will run\n")
 
     @mock_stdout
@@ -86,7 +87,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
             while (true) {}
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "xd\n")
 
     def test_if_statement_false_condition_with_else(self):
@@ -98,7 +99,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
             a();
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
 
     @mock_stdout
     def test_if_statement_false_condition_all_elif_false_condition_else_runs(self, stdout):
@@ -114,7 +115,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
             print("else");
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "else\n")
 
     @mock_stdout
@@ -136,7 +137,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
         }
         print(7);
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "1\n2\n7\n")
 
     @mock_stdout
@@ -145,7 +146,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
         def f(): bool => true
         if (f()) { print("condition"); }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "condition\n")
 
     @parameterized.expand([
@@ -163,7 +164,7 @@ class InterpreterConditionalsTests(unittest.TestCase):
     def test_if_statement_condition_not_bool(self, invalid_condition: str):
         text = "if (" + invalid_condition + ") {}"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
 
 if __name__ == '__main__':
@@ -5,10 +5,11 @@ from parameterized import parameterized
 from src.errors.interpreter import NotNullableError, TypeMismatchError, AssignmentTypeMismatchError, \
     ConstAssignmentError, ConstRedeclarationError, UndefinedNameError
 from src.parser.types import Integer, Float, String, Bool, Null
-from src.tests.utils import setup_interpreter, mock_stdout
+from src.tests.interpreter.utils import InterpreterTestCase
+from src.tests.utils import mock_stdout
 
 
-class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
+class InterpreterConstLetAssignmentAndDeclarationTests(InterpreterTestCase):
 
     @parameterized.expand([
         ('let a: int = 0;', 0, Integer()),
@@ -21,7 +22,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         ('let a: bool = false;', False, Bool()),
     ])
     def test_declaration_let(self, text, value, typ):
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         var_name = text.split('let ')[1][0]
         interpreter.interpret()
         variable = interpreter.env.get_variable(var_name)
@@ -39,7 +40,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
     ])
     def test_declaration_let_not_nullable_right_side_nullable(self, text):
         with self.assertRaises(NotNullableError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('let a?: int = 0;', 0, Integer(), Integer()),
@@ -62,7 +63,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         ('def f(): void => {} let a?: bool = f();', None, Bool(), Null()),
     ])
     def test_declaration_let_nullable(self, text, value, var_type, value_type):
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         var_name = text.split('let ')[1][0]
         interpreter.interpret()
         variable = interpreter.env.get_variable(var_name)
@@ -93,7 +94,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
     ])
     def test_declaration_let_type_mismatch(self, text):
         with self.assertRaises(TypeMismatchError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('const a: int = 0;', 0, Integer()),
@@ -105,7 +106,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         ('const a: bool = false;', False, Bool()),
     ])
     def test_declaration_const(self, text, value, typ):
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         var_name = text.split('const ')[1][0]
         interpreter.interpret()
         variable = interpreter.env.get_variable(var_name)
@@ -126,7 +127,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         ('let a: bool = false; a = true;', True, Bool()),
     ])
     def test_reassignment_to_let(self, text, value, typ):
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         var_name = text.split('let ')[1][0]
         interpreter.interpret()
         variable = interpreter.env.get_variable(var_name)
@@ -148,7 +149,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
     ])
     def test_reassignment_to_let_type_mismatch(self, text):
         with self.assertRaises(AssignmentTypeMismatchError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('const a: int = 0; a = 15;',),
@@ -163,7 +164,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
     ])
     def test_reassignment_to_const(self, text):
         with self.assertRaises(ConstAssignmentError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('let a: int = 0; let a: float = 15;', 15, Float()),
@@ -177,7 +178,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         ('let a: bool = false; let a: float = 6.9;', 6.9, Float()),
     ])
     def test_redeclaration_let(self, text, new_value, new_type):
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         var_name = text.split('let ')[1][0]
         interpreter.interpret()
         variable = interpreter.env.get_variable(var_name)
@@ -199,7 +200,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
     ])
     def test_redeclaration_const(self, text):
         with self.assertRaises(ConstRedeclarationError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_assign_to_local_variable_from_global_scope(self):
         text = """
@@ -209,7 +210,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         a = 10;
         """
         with self.assertRaises(UndefinedNameError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @mock_stdout
     def test_redeclare_const_value_from_local_scope_in_global_scope(self, stdout):
@@ -220,7 +221,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         const a: str = "Hello world!";
         print(a);
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         a = interpreter.env.get_variable('a')
         self.assertEqual(a.value.value, "Hello world!")
@@ -234,7 +235,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
             a = 1;
         }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         a = interpreter.env.get_variable('a')
         self.assertEqual(a.value.value, 1)
@@ -248,7 +249,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         }
         """
         with self.assertRaises(ConstRedeclarationError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_redeclare_global_const_variable_as_let_in_local_scope(self):
         text = """
@@ -258,7 +259,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
         }
         """
         with self.assertRaises(ConstRedeclarationError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_redeclare_global_let_variable_in_local_scope(self):
         text = """
@@ -267,7 +268,7 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
             let a: float = 100;
         }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         a = interpreter.env.get_variable('a')
         self.assertTrue(a.mutable)
@@ -281,13 +282,26 @@ class InterpreterConstLetAssignmentAndDeclarationTests(unittest.TestCase):
             const a: float = 100;
         }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         a = interpreter.env.get_variable('a')
         self.assertFalse(a.mutable)
         self.assertEqual(a.value.value, 100)
         self.assertEqual(a.value.type, Float())
 
+    @mock_stdout
+    def test_variable_initialized_with_variable_copies_its_value(self, stdout):
+        text = """
+        let a: int = 1;
+        let b: int = a;
+        let c: int = 0;
+        c = b;
+        a = 5;
+        print(a, b, c + 1);
+        """
+        self.setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "5 1 2\n")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+
+from src.tests.interpreter import test_conditionals, test_const_let, test_functions, test_loops, test_operators
+
+
+class FlattenedAstMixin:
+    """Runs interpreter tests on programs parsed without CompFactor, NegFactor and Factor objects."""
+
+    flatten = True
+
+
+class InterpreterConditionalsTests(FlattenedAstMixin, test_conditionals.InterpreterConditionalsTests):
+    pass
+
+
+class InterpreterConstLetAssignmentAndDeclarationTests(
+    FlattenedAstMixin, test_const_let.InterpreterConstLetAssignmentAndDeclarationTests
+):
+    pass
+
+
+class InterpreterFunctionsTests(FlattenedAstMixin, test_functions.InterpreterFunctionsTests):
+    pass
+
+
+class InterpreterWhileLoopTests(FlattenedAstMixin, test_loops.InterpreterWhileLoopTests):
+    pass
+
+
+class InterpreterOperatorAllowedTypesTests(FlattenedAstMixin, test_operators.InterpreterOperatorAllowedTypesTests):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
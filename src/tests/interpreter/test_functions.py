@@ -5,14 +5,16 @@ from unittest.mock import patch
 from parameterized import parameterized
 
 from src.errors.interpreter import RecursionLimitError, ReturnOutsideOfFunctionError, ReturnTypeMismatchError, \
-    ArgumentsError, UnexpectedTypeError, UndefinedNameError, NotCallableError, ArgumentTypeError
+    ArgumentsError, UnexpectedTypeError, UndefinedNameError, NotCallableError, ArgumentTypeError, \
+    TypeMismatchError
 from src.errors.parser import UnexpectedTokenError
 from src.parser.types import Func, Void, Null, Integer, String, Float, Bool
-from src.tests.utils import mock_stdout, setup_interpreter
+from src.tests.interpreter.utils import InterpreterTestCase
+from src.tests.utils import mock_stdout
 
 
 # noinspection PyMethodMayBeStatic
-class InterpreterFunctionsTests(unittest.TestCase):
+class InterpreterFunctionsTests(InterpreterTestCase):
     """
     Defining functions, calling functions, calling variables with function type
     """
@@ -23,7 +25,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
             return a;
         }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         func_def = interpreter.env.get_fun_def('f')
         self.assertEqual(func_def.return_type, Integer())
@@ -34,7 +36,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
             return (): void => {};
         }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         func_def = interpreter.env.get_fun_def('f')
         self.assertEqual(func_def.type, Func([], Func([], Void())))
@@ -47,7 +49,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         
         let a?: int = f();
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         func_def = interpreter.env.get_fun_def('f')
         a = interpreter.env.get_variable('a')
@@ -62,14 +64,14 @@ class InterpreterFunctionsTests(unittest.TestCase):
         }
         const b: bool = f(15, 16);
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
 
     def test_function_return_literal(self):
         text = """
         def f(): int => 1
         const a: int = f();
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         f = interpreter.env.get_fun_def('f')
         a = interpreter.env.get_variable('a')
@@ -85,7 +87,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         """
         # parser error
         with self.assertRaises(UnexpectedTokenError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_function_call_arguments_types_mismatch(self):
         text = """
@@ -94,7 +96,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         f(a, a);
         """
         with self.assertRaises(ArgumentTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_function_call_too_little_arguments(self):
         text = """
@@ -103,7 +105,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         f(a);
         """
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_function_call_too_many_arguments(self):
         text = """
@@ -112,7 +114,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         f(a, a, a, a);
         """
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @mock_stdout
     def test_function_argument_func_type(self, stdout):
@@ -125,17 +127,45 @@ class InterpreterFunctionsTests(unittest.TestCase):
         
         f(15, power);
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         self.assertEqual(stdout.getvalue(), "225\n")
 
+    def test_function_argument_func_type_arity_mismatch(self):
+        text = """
+        def f(a: int, lambda: func((a: int) => int)): void => {
+            print(lambda(a));
+        }
+        f(15, (a: int, b: int): int => a * b);
+        """
+        with self.assertRaises(ArgumentTypeError) as context:
+            self.setup_interpreter(text).interpret()
+
+        self.assertEqual(
+            str(context.exception),
+            "Parameter lambda of function f should be type Func((Integer) => Integer). "
+            "Got type Func((Integer, Integer) => Integer) instead."
+        )
+
+    def test_declared_func_type_arity_mismatch(self):
+        text = "const add: func((x: int, y: int) => int) = (x: int): int => x;"
+
+        with self.assertRaises(TypeMismatchError) as context:
+            self.setup_interpreter(text).interpret()
+
+        self.assertEqual(
+            str(context.exception),
+            "Variable add was declared with type Func((Integer, Integer) => Integer) "
+            "but received type Func((Integer) => Integer)."
+        )
+
     def test_function_argument_func_type_invalid_operation(self):
         text = """
         def f(a: int, b: str): int => a * b
         f(1, "hello world");
         """
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('int', 'false'),
@@ -149,14 +179,14 @@ class InterpreterFunctionsTests(unittest.TestCase):
         f();
         """
         with self.assertRaises(ReturnTypeMismatchError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_function_call(self):
         text = """
         def add(a: int, b: int): int => a + b
         const c: int = add(1, 2); 
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         c = interpreter.env.get_variable('c')
         self.assertEqual(c.value.value, 3)
@@ -167,7 +197,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         const a: func(() => void) = (): void => {};
         a();
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
 
     @mock_stdout
     def test_function_call_chained(self, stdout):
@@ -179,7 +209,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         
         f()();
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "1st call\n2nd call\n")
 
     def test_function_call_chained_object_not_callable(self):
@@ -190,12 +220,12 @@ class InterpreterFunctionsTests(unittest.TestCase):
         f()()();
         """
         with self.assertRaises(NotCallableError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_function_call_function_does_not_exist(self):
         text = "f();"
         with self.assertRaises(UndefinedNameError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_function_call_function_defined_below_code(self):
         text = """
@@ -203,12 +233,12 @@ class InterpreterFunctionsTests(unittest.TestCase):
         def f(): void => {}
         """
         with self.assertRaises(UndefinedNameError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_function_call_not_a_callable(self):
         text = "let a: int = 0; a();"
         with self.assertRaises(NotCallableError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @mock_stdout
     def test_recursive_function_call(self, stdout):
@@ -223,7 +253,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         const result: int = factorial(5);
         print(result);
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         result = interpreter.env.get_variable('result')
         self.assertEqual(result.value.value, 120)
@@ -243,7 +273,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         print(factorial(120));
         """
         with self.assertRaises(RecursionLimitError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_recursive_self_call(self):
         text = """
@@ -254,7 +284,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         f();
         """
         with self.assertRaises(RecursionLimitError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ("true", "true\n"),
@@ -266,7 +296,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
     def test_builtin_print(self, argument, expected):
         text = f"print({argument});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue(), expected)
 
     @mock_stdout
@@ -276,12 +306,12 @@ class InterpreterFunctionsTests(unittest.TestCase):
         print(f());
         """
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @mock_stdout
     def test_builtin_print_multiple_arguments(self, stdout):
         text = "print(1, \"Hello world\", true, false, null);"
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue().strip(), "1 Hello world true false null")
 
     @parameterized.expand([
@@ -293,7 +323,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
     ])
     def test_builtin_string(self, arg, value, typ):
         text = f"const a: str = String({arg});"
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         a = interpreter.env.get_variable('a')
         self.assertEqual(a.value.value, value)
@@ -308,12 +338,12 @@ class InterpreterFunctionsTests(unittest.TestCase):
         arguments = ", ".join(args)
         text = f"const a: str = String({arguments});"
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_builtin_string_no_arguments(self):
         text = "const t: str = String();"
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1', 1),
@@ -322,7 +352,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
     ])
     def test_builtin_integer(self, text, value):
         text = f"const i: int = Integer({text});"
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         i = interpreter.env.get_variable('i')
         self.assertEqual(i.value.value, value)
@@ -337,12 +367,12 @@ class InterpreterFunctionsTests(unittest.TestCase):
         arguments = ", ".join(args)
         text = f"const a: str = String({arguments});"
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_builtin_integer_no_arguments(self):
         text = "const i: int = Integer();"
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1', 1.0),
@@ -351,7 +381,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
     ])
     def test_builtin_float(self, text, value):
         text = f"const f: float = Float({text});"
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         f = interpreter.env.get_variable('f')
         self.assertEqual(f.value.value, value)
@@ -366,12 +396,12 @@ class InterpreterFunctionsTests(unittest.TestCase):
         arguments = ", ".join(args)
         text = f"const a: str = String({arguments});"
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_builtin_float_no_arguments(self):
         text = "const f: float = Float();"
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ("true", True),
@@ -380,7 +410,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
     ])
     def test_builtin_boolean(self, text, value):
         text = f"const b: bool = Boolean({text});"
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         b = interpreter.env.get_variable('b')
         self.assertEqual(b.value.value, value)
@@ -395,12 +425,12 @@ class InterpreterFunctionsTests(unittest.TestCase):
         arguments = ", ".join(args)
         text = f"const a: str = String({arguments});"
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_builtin_boolean_no_arguments(self):
         text = "const a: bool = Boolean();"
         with self.assertRaises(ArgumentsError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @mock_stdout
     def test_overwrite_previously_declared_function(self, stdout):
@@ -409,7 +439,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
         def add(text: str): void => print(text)
         add("Overwriting functions works");
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "Overwriting functions works\n")
 
     @mock_stdout
@@ -418,9 +448,26 @@ class InterpreterFunctionsTests(unittest.TestCase):
         def print(a: int): void => {}
         print(1);
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "")
 
+    @parameterized.expand([
+        ('let a: int = --x;',),
+        ('x = -;',),
+    ])
+    @mock_stdout
+    def test_incomplete_expression_in_function_which_is_not_called(self, statement, stdout):
+        text = f"""
+        print("hi");
+        def f(x: int): int => {{
+            {statement}
+            return x;
+        }}
+        print("bye");
+        """
+        self.setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "hi\nbye\n")
+
     @parameterized.expand([
         ('return;',),
         ('while(true) { return; }',),
@@ -428,7 +475,7 @@ class InterpreterFunctionsTests(unittest.TestCase):
     ])
     def test_return_outside_of_function(self, text):
         with self.assertRaises(ReturnOutsideOfFunctionError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
 
 if __name__ == '__main__':
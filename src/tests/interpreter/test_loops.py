@@ -2,11 +2,12 @@ import unittest
 
 from src.errors.interpreter import UnexpectedTypeError
 from src.parser.types import Bool
-from src.tests.utils import setup_interpreter, mock_stdout
+from src.tests.interpreter.utils import InterpreterTestCase
+from src.tests.utils import mock_stdout
 
 
 # noinspection PyMethodMayBeStatic
-class InterpreterWhileLoopTests(unittest.TestCase):
+class InterpreterWhileLoopTests(InterpreterTestCase):
 
     @mock_stdout
     def test_while_loop_condition_true(self, stdout):
@@ -17,7 +18,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
             i = i + 1;
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "0\n1\n2\n3\n4\n")
 
     @mock_stdout
@@ -27,7 +28,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
             print("test");
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
         self.assertEqual(stdout.getvalue(), "")
 
     def test_while_loop_condition_function_call(self):
@@ -38,7 +39,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
             a = a + 1.0; 
         }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         var = interpreter.env.get_variable('a')
         self.assertEqual(var.value.value, 1)
@@ -52,7 +53,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
         
         while (cond) { }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         condition = interpreter.env.get_variable('cond')
         self.assertEqual(condition.value.value, False)
@@ -63,7 +64,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
         while (1) {}
         """
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_while_loop_nested(self):
         text = """
@@ -75,7 +76,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
             i = i + 1;
         }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         i = interpreter.env.get_variable('i')
         self.assertEqual(i.value.value, 10)
@@ -93,7 +94,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
             }
         }
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
 
     def test_while_loop_break_condition_deeply_nested(self):
         text = """
@@ -115,7 +116,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
             }
         }
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
 
     def test_while_loop_escape_with_return_in_function(self):
@@ -127,7 +128,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
         }
         f();
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
 
     def test_while_loop_escape_nested_loop_with_return_in_function(self):
         text = """
@@ -140,7 +141,7 @@ class InterpreterWhileLoopTests(unittest.TestCase):
         }
         f();
         """
-        setup_interpreter(text).interpret()
+        self.setup_interpreter(text).interpret()
 
 
 if __name__ == '__main__':
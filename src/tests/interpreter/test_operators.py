@@ -5,11 +5,18 @@ from unittest.mock import patch
 from parameterized import parameterized
 
 from src.errors.interpreter import UnexpectedTypeError, NotNullableError, DivisionByZeroError
-from src.parser.types import Null
-from src.tests.utils import setup_interpreter
+from src.interpreter import values
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.operations import BINARY_OPERATIONS
+from src.parser.objects.objects import Literal, LambdaExpression
+from src.parser.types import (
+    Null, Void, Integer, Float, Bool, String,
+    ArithmeticOperator, ComparisonOperator, LogicOperator, OtherOperator,
+)
+from src.tests.interpreter.utils import InterpreterTestCase
 
 
-class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
+class InterpreterOperatorAllowedTypesTests(InterpreterTestCase):
 
     @parameterized.expand([
         ("1 + 1", "2"),
@@ -22,7 +29,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     ])
     def test_plus(self, text, expected):
         text = f"print({text});"
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         with patch("sys.stdout", new_callable=StringIO) as sout:
             interpreter.interpret()
             self.assertEqual(sout.getvalue().strip(), expected)
@@ -40,7 +47,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_plus_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1 - 2', -1),
@@ -53,7 +60,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_minus(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), str(expected_value))
 
     @parameterized.expand([
@@ -69,7 +76,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_minus_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1 * 2', 2),
@@ -82,7 +89,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_mul(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), str(expected_value))
 
     @parameterized.expand([
@@ -100,7 +107,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_mul_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1 / 1', 1.0),
@@ -114,13 +121,13 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_div(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), str(expected_value))
 
     def test_div_zero_division(self):
         text = """const a: int = 3 / 0;"""
         with self.assertRaises(DivisionByZeroError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ("1 / \"\"",),
@@ -137,7 +144,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_div_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1 % 1', 0),
@@ -147,13 +154,13 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_modulo(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), str(expected_value))
 
     def test_modulo_zero_division(self):
         text = """const a: int = 3 % 0;"""
         with self.assertRaises(DivisionByZeroError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ("1 % \"\"",),
@@ -170,7 +177,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_modulo_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ("-'a'",),
@@ -181,7 +188,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_negation_minus_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('not true', "false"),
@@ -192,7 +199,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_negation_not(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -203,7 +210,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_negation_not_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('true or true', "true"),
@@ -216,7 +223,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_logic_or(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -231,7 +238,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_logic_or_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('true and true', "true"),
@@ -244,7 +251,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_logic_or(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -259,7 +266,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_logic_and_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1 < 2', "true"),
@@ -269,7 +276,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_lt(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -284,7 +291,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_lt_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1 <= 2', "true"),
@@ -295,7 +302,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_lte(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -310,7 +317,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_lte_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1 > 2', "false"),
@@ -321,7 +328,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_gt(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -336,7 +343,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_gt_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('1 >= 2', "false"),
@@ -346,7 +353,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_gte(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -361,7 +368,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_gte_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('true == true', "true"),
@@ -376,7 +383,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_eq(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -391,7 +398,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_eq_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     @parameterized.expand([
         ('true != true', "false"),
@@ -409,7 +416,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_neq(self, value, expected_value):
         text = f"print({value});"
         with patch('sys.stdout', new_callable=StringIO) as sout:
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
             self.assertEqual(sout.getvalue().strip(), expected_value)
 
     @parameterized.expand([
@@ -424,14 +431,14 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
     def test_neq_type_mismatch(self, text):
         text = f"let a?: str = {text};"
         with self.assertRaises(UnexpectedTypeError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
 
     def test_null_coalesce(self):
         text = """
         const a: int = 15;
         const b: int = a ?? 30;
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         b = interpreter.env.get_variable('b')
         self.assertEqual(b.value.value, 15)
@@ -441,7 +448,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
         const a?: int = null;
         const b: int = a ?? 30;
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         b = interpreter.env.get_variable('b')
         self.assertEqual(b.value.value, 30)
@@ -451,7 +458,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
         const a?: int = 15;
         const b: int = a ?? null;
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         b = interpreter.env.get_variable('b')
         self.assertEqual(b.value.value, 15)
@@ -460,7 +467,7 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
         text = """
         const a?: int = null ?? null;
         """
-        interpreter = setup_interpreter(text)
+        interpreter = self.setup_interpreter(text)
         interpreter.interpret()
         a = interpreter.env.get_variable('a')
         self.assertEqual(a.value.value, None)
@@ -471,7 +478,89 @@ class InterpreterOperatorAllowedTypesTests(unittest.TestCase):
         const a: int = null ?? null;
         """
         with self.assertRaises(NotNullableError):
-            setup_interpreter(text).interpret()
+            self.setup_interpreter(text).interpret()
+
+    def test_unary_minus_does_not_change_variable(self):
+        text = """
+        let a: int = 5;
+        print(-a);
+        print(a);
+        """
+        with patch('sys.stdout', new_callable=StringIO) as sout:
+            self.setup_interpreter(text).interpret()
+            self.assertEqual(sout.getvalue().split(), ["-5", "5"])
+
+    def test_unary_minus_literal_in_loop(self):
+        text = """
+        let i: int = 0;
+        while (i < 3) {
+            print(-1.5);
+            i = i + 1;
+        }
+        """
+        with patch('sys.stdout', new_callable=StringIO) as sout:
+            self.setup_interpreter(text).interpret()
+            self.assertEqual(sout.getvalue().split(), ["-1.5", "-1.5", "-1.5"])
+
+    @parameterized.expand([
+        ("const r: bool = 1 < 2;", values.TRUE),
+        ("const r: bool = 1 == 2;", values.FALSE),
+        ("const r: bool = not true;", values.FALSE),
+        ("const r: int = 1 + 1;", values.from_int(2)),
+        ("let r?: int = null ?? null;", values.NULL),
+    ])
+    def test_results_are_shared_values(self, text, expected):
+        interpreter = self.setup_interpreter(text)
+        interpreter.interpret()
+        r = interpreter.env.get_variable('r')
+        self.assertIs(r.value, expected)
+
+    def test_integer_division_result_is_not_shared(self):
+        text = "const a: int = 4 / 2;"
+        interpreter = self.setup_interpreter(text)
+        interpreter.interpret()
+        a = interpreter.env.get_variable('a')
+        self.assertEqual(repr(a.value.value), "2.0")
+
+
+def sample_values() -> list:
+    return [
+        Literal(Integer(), 0), Literal(Integer(), 3), Literal(Float(), 0.0), Literal(Float(), 1.5),
+        Literal(Bool(), True), Literal(Bool(), False), Literal(String(), "a"),
+        Literal(Null(), None), Literal(Void(), None), LambdaExpression(return_type=Integer()),
+    ]
+
+
+class BinaryOperationsMatrixTests(unittest.TestCase):
+    """Operations specialised for types must behave exactly as generic methods."""
+
+    def outcome(self, operation, left_side, right_side):
+        try:
+            result = operation(left_side, right_side)
+        except Exception as error:
+            return type(error), str(error)
+
+        return str(result.type), getattr(result, "value", result)
+
+    @parameterized.expand([
+        (op,) for op in [*ArithmeticOperator, *ComparisonOperator, *OtherOperator, LogicOperator.AND, LogicOperator.OR]
+    ])
+    def test_matrix_matches_generic_operations(self, op):
+        interpreter = Interpreter(parser=None)
+
+        for left_side in sample_values():
+            for right_side in sample_values():
+                with self.subTest(left=str(left_side.type), right=str(right_side.type)):
+                    self.assertEqual(
+                        self.outcome(lambda lhs, rhs: interpreter.binary_operation(op, lhs, rhs), left_side, right_side),
+                        self.outcome(interpreter.binary_operations[op], left_side, right_side),
+                    )
+
+    def test_not_allowed_combinations_are_missing(self):
+        self.assertNotIn((ArithmeticOperator.PLUS, Integer, String), BINARY_OPERATIONS)
+        self.assertNotIn((ComparisonOperator.EQ, Integer, Float), BINARY_OPERATIONS)
+        self.assertNotIn((LogicOperator.AND, Bool, Null), BINARY_OPERATIONS)
+
 
 
 if __name__ == '__main__':
@@ -0,0 +1,253 @@
+import pickle
+import unittest
+from functools import partial
+
+from parameterized import parameterized
+
+from src.errors.interpreter import DivisionByZeroError, UndefinedNameError, UnexpectedTypeError
+from src.interpreter.closures import ClosureInterpreter
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.optimizer import (
+    Optimizer, FOLD_CONSTANTS, PROPAGATE_CONSTANTS, NO_OPTIMIZATION, OPTIMIZATION_LEVELS
+)
+from src.interpreter.quickening import QuickeningInterpreter
+from src.interpreter.tiered import TieredInterpreter
+from src.interpreter.transpiler import TranspilingInterpreter
+from src.interpreter.vm import VirtualMachine
+from src.parser.objects.objects import (
+    EmptyStatement, Identifier, IfStatement, Literal, WhileLoopStatement, CompoundStatement
+)
+from src.parser.types import INTEGER, FLOAT, BOOL, STRING
+from src.tests.interpreter import test_conditionals, test_const_let, test_functions, test_loops, test_operators
+from src.tests.interpreter.test_closures import run_program
+from src.tests.utils import setup_parser, setup_interpreter, mock_stdout
+
+
+def optimize(text: str, level: int = FOLD_CONSTANTS, flatten: bool = True):
+    program = setup_parser(text, flatten=flatten).parse_program()
+    return Optimizer(level).optimize(program)
+
+
+class OptimizerFoldingTests(unittest.TestCase):
+
+    def declared_value(self, text: str, level: int = FOLD_CONSTANTS, flatten: bool = True):
+        return optimize(text, level, flatten).objects[-1].right_value
+
+    @parameterized.expand([
+        ('let a: int = 3 % 1;', INTEGER, 0),
+        ('let a: int = 1 + 2 * 3;', INTEGER, 7),
+        ('let a: float = (1.5 - 1.25) / 0.5;', FLOAT, 0.5),
+        ('let a: int = 7 / 2;', INTEGER, 3.5),
+        ('let a: int = -(2 + 3);', INTEGER, -5),
+        ('let a: str = "a" + "b";', STRING, "ab"),
+        ('let a: bool = not false or true and 1 > 3;', BOOL, True),
+        ('let a: bool = 1 == 1;', BOOL, True),
+        ('let a: int = null ?? 5;', INTEGER, 5),
+    ])
+    def test_expression_is_folded(self, text, typ, value):
+        for flatten in [True, False]:
+            literal = self.declared_value(text, flatten=flatten)
+            self.assertIsInstance(literal, Literal)
+            self.assertEqual(literal.type, typ)
+            self.assertEqual(literal.value, value)
+
+    @parameterized.expand([
+        ('let a: int = 1 / 0;',),
+        ('let a: int = 1 % (2 - 2);',),
+        ('let a: int = 1 + "text";',),
+        ('let a: bool = not 1;',),
+        ('let a: int = -"text";',),
+        ('let a: int = 1 + b;',),
+    ])
+    def test_expression_is_not_folded(self, text):
+        self.assertNotIsInstance(self.declared_value(text), Literal)
+
+    def test_no_optimization(self):
+        program = setup_parser("let a: int = 1 + 2;").parse_program()
+        self.assertIs(Optimizer(NO_OPTIMIZATION).optimize(program), program)
+
+    def test_program_is_not_modified(self):
+        program = setup_parser("""
+        const a: int = 1;
+        if (a > 2) { print(1 + 2); }
+        def f(x: int): int => x * (2 + 3)
+        """).parse_program()
+        before = pickle.dumps(program)
+
+        optimized = Optimizer(PROPAGATE_CONSTANTS).optimize(program)
+
+        self.assertIsNot(optimized, program)
+        self.assertEqual(pickle.dumps(program), before)
+
+    def test_division_by_zero_is_raised_when_run(self):
+        interpreter = setup_interpreter("if (false) { print(1 / 0); } print(1 / 0);")
+        interpreter.optimization_level = PROPAGATE_CONSTANTS
+
+        with self.assertRaises(DivisionByZeroError):
+            interpreter.interpret()
+
+
+class OptimizerPropagationTests(unittest.TestCase):
+
+    def test_constant_is_propagated(self):
+        program = optimize("const b: float = 1.5; let f: float = (b - 1.25) / 0.5;", PROPAGATE_CONSTANTS)
+        literal = program.objects[-1].right_value
+        self.assertEqual((literal.type, literal.value), (FLOAT, 0.5))
+
+    def test_integer_constant_is_propagated_as_float(self):
+        program = optimize("const b: float = 1; let f: float = b;", PROPAGATE_CONSTANTS)
+        literal = program.objects[-1].right_value
+        self.assertEqual((literal.type, literal.value), (FLOAT, 1))
+
+    def test_constants_are_not_propagated_with_lower_level(self):
+        program = optimize("const b: int = 1; let f: int = b + 1;", FOLD_CONSTANTS)
+        self.assertNotIsInstance(program.objects[-1].right_value, Literal)
+
+    @parameterized.expand([
+        ('let b: int = 1; let f: int = b + 1;',),
+        ('const b: int = 1; if (true) { let b: int = 2; } let f: int = b + 1;',),
+        ('if (true) { const b: int = 1; let f: int = b + 1; }',),
+        ('const b: int = 1.5; let f: int = b + 1;',),
+        ('def g(b: int): int => b const b: int = 1; let f: int = b + 1;',),
+    ])
+    def test_constant_is_not_propagated(self, text):
+        program = optimize(text, PROPAGATE_CONSTANTS)
+        declaration = program.objects[-1]
+        if isinstance(declaration, CompoundStatement):
+            declaration = declaration.statements[-1]
+
+        self.assertNotIsInstance(declaration.right_value, Literal)
+
+    def test_constant_is_not_propagated_before_declaration(self):
+        text = "let f: int = b; const b: int = 1;"
+        with self.assertRaises(UndefinedNameError):
+            Interpreter(setup_parser(text), PROPAGATE_CONSTANTS).interpret()
+
+    def test_constant_is_not_propagated_into_function(self):
+        program = optimize("const b: int = 1; def f(): int => b + 1", PROPAGATE_CONSTANTS)
+        self.assertIsInstance(program.objects[-1].body.expression.left_value, Identifier)
+
+    def test_constant_passed_to_function_is_not_propagated(self):
+        program = optimize("const b: int = 1; print(b, b + 1);", PROPAGATE_CONSTANTS)
+        arguments = program.objects[-1].arguments[0]
+        self.assertIsInstance(arguments[0], Identifier)
+        self.assertIsInstance(arguments[1], Literal)
+
+
+class OptimizerDeadCodeTests(unittest.TestCase):
+
+    def optimized_statement(self, text: str):
+        return optimize(text, PROPAGATE_CONSTANTS).objects[-1]
+
+    @parameterized.expand([
+        ('if (true) { print(1); } else { print(2); }', CompoundStatement),
+        ('if (false) { print(1); }', EmptyStatement),
+        ('if (null) { print(1); } else { print(2); }', CompoundStatement),
+        ('const a: int = 1; if (a > 2) { print(1); }', EmptyStatement),
+        ('while (false) { print(1); }', EmptyStatement),
+        ('while (1 > 2) { print(1); }', EmptyStatement),
+        ('let a: bool = true; if (a) { print(1); }', IfStatement),
+        ('while (true) { return; }', WhileLoopStatement),
+        ('if (1) { print(1); }', IfStatement),
+    ])
+    def test_statement_is_replaced(self, text, node_class):
+        self.assertIsInstance(self.optimized_statement(text), node_class)
+
+    def test_false_branches_are_removed(self):
+        statement = self.optimized_statement("""
+        let a: bool = true;
+        if (false) { print(1); }
+        elif (a) { print(2); }
+        elif (true) { print(3); }
+        elif (a) { print(4); }
+        else { print(5); }
+        """)
+        self.assertIsInstance(statement, IfStatement)
+        self.assertEqual(len(statement.elif_statements), 0)
+        self.assertIsInstance(statement.condition, Identifier)
+        self.assertEqual(statement.else_statement.statement.statements[0].arguments[0][0].value, 3)
+
+    def test_branches_are_not_run_with_invalid_condition(self):
+        with self.assertRaises(UnexpectedTypeError):
+            Interpreter(setup_parser("if (1) { print(1); }"), PROPAGATE_CONSTANTS).interpret()
+
+    @parameterized.expand([
+        (engine.__name__, engine, text)
+        for engine in [
+            Interpreter, ClosureInterpreter, VirtualMachine, TranspilingInterpreter, QuickeningInterpreter,
+            TieredInterpreter,
+        ]
+        for text in [
+            'const t: bool = true; if (false) { print(1); } elif (t) { print(2); } else { print(3); }',
+            'let t: bool = true; if (false) { print(1); } elif (t) { print(2); } elif (true) { print(3); }',
+            'let n?: bool = null; if (false) { print(1); } elif (n) { print(2); } else { print(3); }',
+            'let i: int = 1; if (false) { print(1); } elif (i) { print(2); } else { print(3); }',
+            'const f: bool = false; if (f) { print(1); } elif (f) { print(2); } elif (true) { print(3); }',
+        ]
+    ])
+    def test_removed_branches_do_not_change_output(self, _, engine, text):
+        outputs = [run_program(partial(engine, optimization_level=level), text) for level in OPTIMIZATION_LEVELS]
+
+        self.assertEqual(outputs, [outputs[0]] * len(outputs))
+
+    @mock_stdout
+    def test_optimized_program_output(self, stdout):
+        text = """
+        const a: int = 1;
+        const b: float = 1.5;
+        let e: int = a + 3 % 1;
+        let f: float = (b - 1.23) / 0.75;
+        if (a > 15 or b <= 13.37) { print(e, f); }
+        else { print("never"); }
+        """
+        for level in [NO_OPTIMIZATION, FOLD_CONSTANTS, PROPAGATE_CONSTANTS]:
+            Interpreter(setup_parser(text), level).interpret()
+
+        self.assertEqual(len(set(stdout.getvalue().splitlines())), 1)
+
+
+class OptimizedProgramMixin:
+    """Runs interpreter tests on programs with all optimisations enabled."""
+
+    flatten = False
+
+    def setup_interpreter(self, text: str) -> Interpreter:
+        interpreter = super().setup_interpreter(text)
+        interpreter.optimization_level = PROPAGATE_CONSTANTS
+        return interpreter
+
+
+class FlattenedOptimizedProgramMixin(OptimizedProgramMixin):
+    flatten = True
+
+
+class InterpreterConditionalsTests(OptimizedProgramMixin, test_conditionals.InterpreterConditionalsTests):
+    pass
+
+
+class InterpreterConstLetAssignmentAndDeclarationTests(
+    OptimizedProgramMixin, test_const_let.InterpreterConstLetAssignmentAndDeclarationTests
+):
+    pass
+
+
+class InterpreterFunctionsTests(OptimizedProgramMixin, test_functions.InterpreterFunctionsTests):
+    pass
+
+
+class InterpreterWhileLoopTests(OptimizedProgramMixin, test_loops.InterpreterWhileLoopTests):
+    pass
+
+
+class InterpreterOperatorAllowedTypesTests(OptimizedProgramMixin, test_operators.InterpreterOperatorAllowedTypesTests):
+    pass
+
+
+class FlattenedInterpreterOperatorAllowedTypesTests(
+    FlattenedOptimizedProgramMixin, test_operators.InterpreterOperatorAllowedTypesTests
+):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from unittest.mock import patch
+
+from src.interpreter.interpreter import Interpreter
+from src.tests.utils import setup_parser
+
+PROGRAM = """
+def fib(n: int): int => {
+    let result: int = n;
+    if (n > 1) {
+        result = fib(n - 1) + fib(n - 2);
+    }
+    return result;
+}
+
+let i: int = 0;
+let total: int = 0;
+while (i < 3) {
+    let step: int = -1;
+    total = total - step;
+    i = i + 1;
+}
+
+const a: int = 5;
+const b: int = -a;
+const result: int = fib(10) + total + b;
+print(result);
+"""
+
+
+class ProgramReuseTests(unittest.TestCase):
+    """Interpreter keeps runtime state outside of the program tree, so one parsed program can be run many times."""
+
+    def setUp(self):
+        self.program = setup_parser(PROGRAM).parse_program()
+
+    def run_program(self) -> Interpreter:
+        interpreter = Interpreter(parser=None)
+        interpreter.run(self.program)
+        return interpreter
+
+    def test_program_is_not_modified(self):
+        before = pickle.dumps(self.program)
+
+        with patch('sys.stdout', new_callable=StringIO):
+            self.run_program()
+
+        self.assertEqual(pickle.dumps(self.program), before)
+
+    def test_program_run_many_times(self):
+        with patch('sys.stdout', new_callable=StringIO) as sout:
+            for _ in range(3):
+                self.run_program()
+
+        self.assertEqual(sout.getvalue().split(), ["53"] * 3)
+
+    def test_program_run_concurrently(self):
+        def run(_):
+            return self.run_program().env.get_variable('result').value.value
+
+        with patch('sys.stdout', new_callable=StringIO), ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run, range(8)))
+
+        self.assertEqual(results, [53] * 8)
+
+    def test_recursive_calls_get_own_variables(self):
+        text = """
+        def f(n: int): int => {
+            let x: int = n;
+            if (n > 0) {
+                f(n - 1);
+            }
+            return x;
+        }
+        print(f(3));
+        """
+        with patch('sys.stdout', new_callable=StringIO) as sout:
+            Interpreter(parser=None).run(setup_parser(text).parse_program())
+
+        self.assertEqual(sout.getvalue().strip(), "3")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized
+
+from src.errors.interpreter import DivisionByZeroError, UnexpectedTypeError
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.quickening import QuickeningInterpreter
+from src.parser.objects.objects import BinaryExpression, walk
+from src.parser.types import INTEGER, FLOAT, STRING
+from src.tests.interpreter import test_conditionals, test_const_let, test_functions, test_loops, test_operators
+from src.tests.interpreter.test_closures import run_program
+from src.tests.utils import setup_parser, mock_stdout
+
+EXAMPLES_DIR = Path(__file__).parents[3] / "examples"
+
+
+def setup_quickening_interpreter(text: str, flatten: bool = False) -> QuickeningInterpreter:
+    return QuickeningInterpreter(parser=setup_parser(text, flatten=flatten))
+
+
+def run_quickened(text: str) -> tuple[QuickeningInterpreter, list[BinaryExpression]]:
+    """Runs program and returns interpreter with binary expressions of the program in order of appearance."""
+
+    interpreter = setup_quickening_interpreter(text, flatten=True)
+    program = interpreter.parser.parse_program()
+    interpreter.run(program)
+    expressions = [node for node in walk(program) if isinstance(node, BinaryExpression)]
+
+    return interpreter, expressions
+
+
+class QuickeningInterpreterTests(unittest.TestCase):
+
+    @parameterized.expand([
+        ("everything.ty",),
+        ("fizzbuzz.ty",),
+        ("lambdas.ty",),
+        ("main.ty",),
+    ])
+    def test_examples_same_output(self, file_name: str):
+        text = (EXAMPLES_DIR / file_name).read_text()
+        self.assertEqual(run_program(QuickeningInterpreter, text), run_program(Interpreter, text))
+
+    @parameterized.expand([
+        ('let i?: int = 0; while (i < 3) { i = i + 1; }', 0, (INTEGER, INTEGER)),
+        ('let i?: int = 0; while (i < 3) { i = i + 1; }', 1, (INTEGER, INTEGER)),
+        ('let a?: str = "a"; let i: int = 0; while (i < 3) { a = a + "b"; i = i + 1; }', 1, (STRING, STRING)),
+    ])
+    def test_expression_is_specialised_for_observed_types(self, text, index, types):
+        interpreter, expressions = run_quickened(text)
+
+        self.assertEqual(interpreter.specialisations[expressions[index]], types)
+
+    def test_verified_expression_is_specialised_without_checks(self):
+        interpreter, expressions = run_quickened('let i: int = 0; while (i < 3) { i = i + 1; }')
+
+        self.assertEqual(set(interpreter.variants), set(expressions))
+        self.assertEqual(interpreter.specialisations, {})
+
+    @mock_stdout
+    def test_expression_is_deoptimised_for_different_types(self, stdout):
+        interpreter, expressions = run_quickened("""
+        def f(): void => {
+            print(a + b);
+        }
+        f(1, 2);
+        f(1.5, 2.5);
+        f("a", "b");
+        """)
+
+        self.assertEqual(stdout.getvalue(), "3\n4.0\nab\n")
+        self.assertNotIn(expressions[0], interpreter.specialisations)
+        self.assertIn(expressions[0], interpreter.variants)
+
+    @mock_stdout
+    def test_other_expressions_stay_specialised(self, stdout):
+        interpreter, expressions = run_quickened("""
+        def f(): void => {
+            print(a + b, c < 5);
+        }
+        f(1, 2, 3);
+        f("a", "b", 4);
+        """)
+
+        self.assertEqual(stdout.getvalue(), "3 true\nab true\n")
+        self.assertEqual(interpreter.specialisations, {expressions[1]: (INTEGER, INTEGER)})
+
+    @parameterized.expand([
+        ('def f(): void => { print(a + b); } f(1, 2); f(1, "b");', UnexpectedTypeError),
+        ('def f(): void => { print(a < b); } f(1, 2); f(1, "b");', UnexpectedTypeError),
+        ('def f(): void => { print(a / b); } f(1, 2); f(1, 0);', DivisionByZeroError),
+        ('def f(): void => { print(a % b); } f(1.5, 2); f(1.5, 0);', DivisionByZeroError),
+        ('let a?: int = 1; let b: bool = a + true;', UnexpectedTypeError),
+    ])
+    def test_errors_are_raised(self, text, error_class):
+        with self.assertRaises(error_class):
+            setup_quickening_interpreter(text).interpret()
+
+    @mock_stdout
+    def test_integer_division_stays_integer(self, stdout):
+        interpreter, expressions = run_quickened("""
+        def f(): void => {
+            print(a / b);
+        }
+        f(4, 2);
+        f(3, 2);
+        f(2.0, 4);
+        """)
+
+        self.assertEqual(stdout.getvalue(), "2.0\n1.5\n0.5\n")
+        self.assertNotIn(expressions[0], interpreter.specialisations)
+
+    def test_expressions_are_quickened_again_in_every_run(self):
+        interpreter = setup_quickening_interpreter('def f(): int => a + 1 let x: int = f(1);', flatten=True)
+        program = interpreter.parser.parse_program()
+        interpreter.run(program)
+        interpreter.run(program)
+        expression = next(node for node in walk(program) if isinstance(node, BinaryExpression))
+
+        self.assertEqual(interpreter.specialisations, {expression: (INTEGER, INTEGER)})
+        self.assertEqual(interpreter.env.get_variable('x').value.value, 2)
+
+    def test_float_sides(self):
+        interpreter, expressions = run_quickened('let a?: float = 1.5; let b: bool = a > 1.0;')
+        self.assertEqual(interpreter.specialisations[expressions[0]], (FLOAT, FLOAT))
+
+
+class QuickeningInterpreterMixin:
+    """Runs interpreter tests with binary expressions quickened."""
+
+    flatten = False
+
+    def setup_interpreter(self, text: str) -> Interpreter:
+        return setup_quickening_interpreter(text, flatten=self.flatten)
+
+
+class FlattenedQuickeningInterpreterMixin(QuickeningInterpreterMixin):
+    flatten = True
+
+
+class InterpreterConditionalsTests(QuickeningInterpreterMixin, test_conditionals.InterpreterConditionalsTests):
+    pass
+
+
+class InterpreterConstLetAssignmentAndDeclarationTests(
+    QuickeningInterpreterMixin, test_const_let.InterpreterConstLetAssignmentAndDeclarationTests
+):
+    pass
+
+
+class InterpreterFunctionsTests(QuickeningInterpreterMixin, test_functions.InterpreterFunctionsTests):
+    pass
+
+
+class InterpreterWhileLoopTests(QuickeningInterpreterMixin, test_loops.InterpreterWhileLoopTests):
+    pass
+
+
+class InterpreterOperatorAllowedTypesTests(
+    QuickeningInterpreterMixin, test_operators.InterpreterOperatorAllowedTypesTests
+):
+    pass
+
+
+class FlattenedInterpreterOperatorAllowedTypesTests(
+    FlattenedQuickeningInterpreterMixin, test_operators.InterpreterOperatorAllowedTypesTests
+):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
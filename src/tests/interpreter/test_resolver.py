@@ -0,0 +1,157 @@
+import unittest
+
+from parameterized import parameterized
+
+from src.errors.interpreter import ConstRedeclarationError, UndefinedNameError
+from src.interpreter.resolver import Resolver
+from src.parser.objects.objects import walk, Identifier, CompoundStatement, FunctionDefinition
+from src.tests.utils import setup_parser, setup_interpreter, mock_stdout
+
+
+# noinspection PyMethodMayBeStatic
+class ResolverTests(unittest.TestCase):
+
+    def resolve(self, text: str):
+        program = setup_parser(text).parse_program()
+        return program, Resolver().resolve(program)
+
+    def test_globals_have_no_slots(self):
+        program, resolution = self.resolve("let a: int = 1; print(a);")
+
+        self.assertEqual(resolution.slots, {})
+        self.assertEqual(resolution.frame_sizes[program], 0)
+
+    def test_parameters_take_first_slots(self):
+        program, resolution = self.resolve("def f(x: int, y: int): int => { let z: int = x; return y; }")
+        func_def = program.objects[0]
+
+        slots = {node.name: resolution.slots[node] for node in walk(func_def) if isinstance(node, Identifier)}
+        self.assertEqual(slots, {'x': 0, 'y': 1})
+        self.assertEqual(resolution.frame_sizes[func_def], 3)
+
+    def test_sibling_blocks_reuse_slots(self):
+        program, resolution = self.resolve("""
+        if (true) { let a: int = 1; print(a); }
+        if (true) { let b: int = 2; let c: int = 3; print(b, c); }
+        """)
+        blocks = [node for node in walk(program) if isinstance(node, CompoundStatement)]
+
+        self.assertEqual([resolution.blocks[block][0] for block in blocks], [0, 0])
+        self.assertEqual(resolution.frame_sizes[program], 2)
+
+    def test_block_without_declarations_is_not_cleared(self):
+        program, resolution = self.resolve("let i: int = 0; while (i < 3) { i = i + 1; }")
+
+        self.assertEqual(resolution.blocks, {})
+
+    def test_functions_do_not_see_callers_locals(self):
+        program, resolution = self.resolve("""
+        def f(): int => { return a; }
+        if (true) { let a: int = 1; print(f()); }
+        """)
+        func_def = next(node for node in walk(program) if isinstance(node, FunctionDefinition))
+        identifier = next(node for node in walk(func_def) if isinstance(node, Identifier))
+
+        self.assertNotIn(identifier, resolution.slots)
+
+
+# noinspection PyMethodMayBeStatic
+class InterpreterResolvedVariablesTests(unittest.TestCase):
+
+    @mock_stdout
+    def test_block_variables_are_removed_after_block(self, stdout):
+        text = """
+        let i: int = 0;
+        while (i < 3) {
+            let a?: int;
+            print(a);
+            a = i;
+            i = i + 1;
+        }
+        """
+        setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "null\nnull\nnull\n")
+
+    def test_block_variable_is_not_visible_outside(self):
+        with self.assertRaises(UndefinedNameError):
+            setup_interpreter("if (true) { let a: int = 1; } print(a);").interpret()
+
+    @mock_stdout
+    def test_declaration_in_block_reassigns_global(self, stdout):
+        text = """
+        let a: int = 1;
+        if (true) {
+            let a: int = 2;
+        }
+        print(a);
+        """
+        setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "2\n")
+
+    @mock_stdout
+    def test_declaration_in_function_reassigns_global(self, stdout):
+        text = """
+        let a: int = 1;
+        def f(): void => {
+            let a: int = 3;
+        }
+        f();
+        print(a);
+        """
+        setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "3\n")
+
+    @mock_stdout
+    def test_declaration_in_nested_block_reassigns_outer_variable(self, stdout):
+        text = """
+        if (true) {
+            let a: int = 1;
+            if (true) {
+                let a: int = 2;
+            }
+            print(a);
+        }
+        """
+        setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "2\n")
+
+    @parameterized.expand([
+        ("if (true) { const a: int = 1; if (true) { let a: int = 2; } }",),
+        ("def f(): void => { const a: int = 1; let a: int = 2; } f();",),
+        ("const a: int = 1; def f(): void => { let a: int = 2; } f();",),
+    ])
+    def test_const_redeclaration_in_slots(self, text):
+        with self.assertRaises(ConstRedeclarationError):
+            setup_interpreter(text).interpret()
+
+    @mock_stdout
+    def test_recursive_calls_have_own_frames(self, stdout):
+        text = """
+        def count(n: int): int => {
+            let result: int = 0;
+            if (n > 0) {
+                let rest: int = count(n - 1);
+                result = rest + n;
+            }
+            return result + 0;
+        }
+        print(count(4));
+        """
+        setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "10\n")
+
+    @mock_stdout
+    def test_chained_call_arguments_are_evaluated_in_caller_frame(self, stdout):
+        text = """
+        def printer(x: int): func(() => void) => {
+            return (): void => { print("called"); };
+        }
+        def f(): void => {
+            let c: int = 40;
+            let b: int = 2;
+            printer(b)();
+        }
+        f();
+        """
+        setup_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "called\n")
@@ -0,0 +1,191 @@
+import unittest
+from functools import partial
+from pathlib import Path
+
+from parameterized import parameterized
+
+from src.errors.interpreter import DivisionByZeroError, RecursionLimitError, ReturnTypeMismatchError
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.tiered import TieredInterpreter
+from src.parser.objects.objects import FunctionDefinition, WhileLoopStatement, walk
+from src.tests.interpreter import test_conditionals, test_const_let, test_functions, test_loops, test_operators
+from src.tests.interpreter.test_closures import run_program
+from src.tests.utils import setup_parser, mock_stdout
+
+EXAMPLES_DIR = Path(__file__).parents[3] / "examples"
+
+
+def setup_tiered_interpreter(text: str, flatten: bool = False, threshold: int = 3) -> TieredInterpreter:
+    return TieredInterpreter(parser=setup_parser(text, flatten=flatten), threshold=threshold)
+
+
+def run_tiered(text: str, threshold: int = 3) -> tuple[TieredInterpreter, list]:
+    """Runs program and returns interpreter with function definitions and loops of the program."""
+
+    interpreter = setup_tiered_interpreter(text, flatten=True, threshold=threshold)
+    program = interpreter.parser.parse_program()
+    interpreter.run(program)
+    nodes = [node for node in walk(program) if isinstance(node, (FunctionDefinition, WhileLoopStatement))]
+
+    return interpreter, nodes
+
+
+class TieredInterpreterTests(unittest.TestCase):
+
+    @parameterized.expand([
+        ("everything.ty", 1),
+        ("fizzbuzz.ty", 1),
+        ("lambdas.ty", 1),
+        ("main.ty", 1),
+        ("everything.ty", 3),
+        ("fizzbuzz.ty", 3),
+        ("lambdas.ty", 3),
+        ("main.ty", 3),
+    ])
+    def test_examples_same_output(self, file_name: str, threshold: int):
+        text = (EXAMPLES_DIR / file_name).read_text()
+        self.assertEqual(
+            run_program(partial(TieredInterpreter, threshold=threshold), text), run_program(Interpreter, text)
+        )
+
+    def test_cold_code_is_not_compiled(self):
+        interpreter, (func_def, loop) = run_tiered("""
+        def f(x: int): int => x + 1
+        let i: int = 0;
+        while (i < 2) { i = f(i); }
+        """)
+
+        self.assertEqual(interpreter.compiled, {})
+        self.assertEqual(interpreter.counters, {func_def: 2, loop: 2})
+        self.assertEqual(interpreter.compiler.code, {})
+
+    def test_hot_function_is_compiled(self):
+        interpreter, (func_def,) = run_tiered("""
+        def f(x: int): int => x + 1
+        let a: int = f(f(f(f(1))));
+        """)
+
+        self.assertIn(func_def, interpreter.compiled)
+        self.assertNotIn(func_def, interpreter.counters)
+        self.assertEqual(interpreter.env.get_variable('a').value.value, 5)
+
+    def test_hot_loop_continues_compiled(self):
+        interpreter, (loop,) = run_tiered("""
+        let i: int = 0;
+        let total: int = 0;
+        while (i < 10) {
+            total = total + i;
+            i = i + 1;
+        }
+        """)
+
+        self.assertIn(loop, interpreter.compiled)
+        self.assertEqual(interpreter.env.get_variable('i').value.value, 10)
+        self.assertEqual(interpreter.env.get_variable('total').value.value, 45)
+
+    def test_iterations_are_counted_across_runs_of_loop(self):
+        interpreter, (func_def, loop) = run_tiered("""
+        def f(): void => {
+            let i: int = 0;
+            while (i < 2) {
+                i = i + 1;
+            }
+        }
+        f();
+        """, threshold=4)
+
+        self.assertEqual(interpreter.counters[loop], 2)
+
+    def test_loop_left_by_return_is_counted(self):
+        interpreter, (func_def, loop) = run_tiered("""
+        def f(): int => {
+            let i: int = 0;
+            while (true) {
+                i = i + 1;
+                if (i == 2) { return i; }
+            }
+            return 0;
+        }
+        let a: int = f();
+        """, threshold=10)
+
+        self.assertEqual(interpreter.counters[loop], 1)
+        self.assertEqual(interpreter.env.get_variable('a').value.value, 2)
+
+    @mock_stdout
+    def test_redefinition_invalidates_compiled_function(self, stdout):
+        interpreter, (first, second) = run_tiered("""
+        def f(): int => 1
+        print(f(), f(), f());
+        def f(): int => 2
+        print(f());
+        """)
+
+        self.assertEqual(stdout.getvalue(), "1 1 1\n2\n")
+        self.assertNotIn(first, interpreter.compiled)
+        self.assertNotIn(first, interpreter.counters)
+        self.assertEqual(interpreter.counters[second], 1)
+
+    @parameterized.expand([
+        ('def f(x: int): int => 10 / x let i: int = 3; while (i > -1) { f(i); i = i - 1; }', DivisionByZeroError),
+        ('def f(x: int): int => f(x) let i: int = 0; while (i < 5) { i = i + 1; } f(1);', RecursionLimitError),
+        ('def f(x: int): int => { if (x > 2) { return "a"; } return x; } f(1); f(2); f(3);', ReturnTypeMismatchError),
+    ])
+    def test_errors_are_raised_in_compiled_code(self, text, error_class):
+        with self.assertRaises(error_class):
+            setup_tiered_interpreter(text).interpret()
+
+    def test_compiled_code_is_dropped_in_every_run(self):
+        interpreter = setup_tiered_interpreter("let i: int = 0; while (i < 5) { i = i + 1; }", flatten=True)
+        program = interpreter.parser.parse_program()
+        interpreter.run(program)
+        compiler = interpreter.compiler
+        interpreter.run(program)
+
+        self.assertIsNot(interpreter.compiler, compiler)
+        self.assertEqual(interpreter.env.get_variable('i').value.value, 5)
+
+
+class TieredInterpreterMixin:
+    """Runs interpreter tests with all functions and loops compiled as soon as they are run."""
+
+    flatten = False
+
+    def setup_interpreter(self, text: str) -> Interpreter:
+        return setup_tiered_interpreter(text, flatten=self.flatten, threshold=1)
+
+
+class FlattenedTieredInterpreterMixin(TieredInterpreterMixin):
+    flatten = True
+
+
+class InterpreterConditionalsTests(TieredInterpreterMixin, test_conditionals.InterpreterConditionalsTests):
+    pass
+
+
+class InterpreterConstLetAssignmentAndDeclarationTests(
+    TieredInterpreterMixin, test_const_let.InterpreterConstLetAssignmentAndDeclarationTests
+):
+    pass
+
+
+class InterpreterFunctionsTests(TieredInterpreterMixin, test_functions.InterpreterFunctionsTests):
+    pass
+
+
+class InterpreterWhileLoopTests(TieredInterpreterMixin, test_loops.InterpreterWhileLoopTests):
+    pass
+
+
+class InterpreterOperatorAllowedTypesTests(TieredInterpreterMixin, test_operators.InterpreterOperatorAllowedTypesTests):
+    pass
+
+
+class FlattenedInterpreterOperatorAllowedTypesTests(
+    FlattenedTieredInterpreterMixin, test_operators.InterpreterOperatorAllowedTypesTests
+):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+import marshal
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized
+
+from src.errors.interpreter import (
+    ConstAssignmentError, DivisionByZeroError, RecursionLimitError, ReturnOutsideOfFunctionError,
+    UndefinedNameError, UnexpectedTypeError
+)
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.transpiler import TranspilingInterpreter
+from src.parser.types import FLOAT
+from src.tests.interpreter import test_conditionals, test_const_let, test_functions, test_loops, test_operators
+from src.tests.interpreter.test_closures import run_program
+from src.tests.utils import setup_parser, mock_stdout
+
+EXAMPLES_DIR = Path(__file__).parents[3] / "examples"
+
+
+def setup_transpiling_interpreter(text: str, flatten: bool = False) -> TranspilingInterpreter:
+    return TranspilingInterpreter(parser=setup_parser(text, flatten=flatten))
+
+
+def transpile(text: str) -> str:
+    interpreter = setup_transpiling_interpreter(text, flatten=True)
+    program = interpreter.parser.parse_program()
+    interpreter.prepare(program)
+    return interpreter.python_program(program).source
+
+
+class TranspilingInterpreterTests(unittest.TestCase):
+
+    @parameterized.expand([
+        ("everything.ty",),
+        ("fizzbuzz.ty",),
+        ("lambdas.ty",),
+        ("main.ty",),
+    ])
+    def test_examples_same_output(self, file_name: str):
+        text = (EXAMPLES_DIR / file_name).read_text()
+        self.assertEqual(run_program(TranspilingInterpreter, text), run_program(Interpreter, text))
+
+    @parameterized.expand([
+        ('print(a);', UndefinedNameError),
+        ('return 1;', ReturnOutsideOfFunctionError),
+        ('let a: int = 1; while (a) {}', UnexpectedTypeError),
+        ('def f(): int => f() f();', RecursionLimitError),
+        ('const a: int = 1; a = 2;', ConstAssignmentError),
+        ('let a: int = 0; let b: int = 1 / a;', DivisionByZeroError),
+        ('let a: int = 0; let b: int = 1 % a;', DivisionByZeroError),
+    ])
+    def test_errors_are_raised(self, text, error_class):
+        with self.assertRaises(error_class):
+            setup_transpiling_interpreter(text).interpret()
+
+    def test_integer_is_widened_to_float(self):
+        interpreter = setup_transpiling_interpreter("let a: float = 1; let b: float = a; b = 2;")
+        interpreter.interpret()
+
+        self.assertEqual(interpreter.env.get_variable('a').value.type, FLOAT)
+        self.assertEqual(interpreter.env.get_variable('b').value, (FLOAT, 2))
+
+    def test_verified_operations_are_python_operators(self):
+        source = transpile("let a: int = 1; while (a < 10) { a = a * 2 + 1; }")
+
+        self.assertIn("< (10)", source)
+        self.assertIn("* (2)) + (1)", source)
+        self.assertNotIn("binary_operation", source)
+        self.assertNotIn("holds(", source.split("def run_program")[1])
+
+    def test_local_variables_are_python_variables(self):
+        source = transpile("def f(x: int): int => { let y: int = x * 2; y = y + 1; return y; } print(f(1));")
+
+        self.assertIn("local_1 = (local_1 + (1))", source)
+        self.assertIn("return from_int(local_1)", source)
+        self.assertNotIn("RuntimeVariable('y'", source)
+
+    @mock_stdout
+    def test_variable_passed_to_function_stays_in_slot(self, stdout):
+        text = """
+        def f(x: int): void => { x = 5; }
+        def g(): void => {
+            let a: int = 1;
+            f(a);
+            print(a);
+        }
+        g();
+        """
+        setup_transpiling_interpreter(text).interpret()
+
+        self.assertEqual(stdout.getvalue(), "5\n")
+        self.assertIn("RuntimeVariable('a'", transpile(text))
+
+    def test_verified_call_is_direct(self):
+        source = transpile("def f(x: int): int => x + 1 let a: int = f(1); let b: int = f(1.5);")
+        program = source.split("def run_body")[0]
+
+        # unverified call and a call before the function is defined go through `call`
+        self.assertEqual(program.count("call_1("), 1)
+        self.assertEqual(program.count("call("), 2)
+
+    def test_unverified_statements_are_checked(self):
+        source = transpile("let a: int = 1; let b: int = a + 1.5; let c: float = 1.5; c = a;")
+
+        self.assertIn("check_declaration", source)
+        self.assertIn("assign_variable", source)
+
+    def test_program_is_transpiled_once(self):
+        interpreter = setup_transpiling_interpreter("let a: int = 1; print(a);")
+        program = interpreter.parser.parse_program()
+        interpreter.run(program)
+        python_program = interpreter.python_program(program)
+        interpreter.run(program)
+
+        self.assertIs(interpreter.python_program(program), python_program)
+
+    @mock_stdout
+    def test_code_can_be_marshalled(self, stdout):
+        interpreter = setup_transpiling_interpreter("def f(x: int): int => x + 1 print(f(1));")
+        program = interpreter.parser.parse_program()
+        interpreter.prepare(program)
+        python_program = interpreter.python_program(program)
+
+        python_program.code = marshal.loads(marshal.dumps(python_program.code))
+        interpreter.run(program)
+
+        self.assertEqual(stdout.getvalue(), "2\n")
+
+    @mock_stdout
+    def test_deeply_nested_statements(self, stdout):
+        text = (
+            "def f(): int => { let b: int = 0;" + "while (b < 1) {" * 25 + "return 7;" + "}" * 25 + "return 1; }"
+            "let a: int = 0;" + "while (a < 1) {" * 25 + "a = f();" + "}" * 25 + "print(a);"
+        )
+        setup_transpiling_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "7\n")
+
+    @mock_stdout
+    def test_redefined_function_is_called(self, stdout):
+        text = """
+        def f(): int => 1
+        def g(): void => {
+            print(f());
+        }
+        g();
+        def f(): int => 2
+        g();
+        """
+        setup_transpiling_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "1\n2\n")
+
+    @mock_stdout
+    def test_variable_changed_by_function_call_in_expression(self, stdout):
+        text = """
+        let a: int = 1;
+        def f(): int => {
+            a = 10;
+            return 1;
+        }
+        print(a + f());
+        """
+        setup_transpiling_interpreter(text).interpret()
+        self.assertEqual(stdout.getvalue(), "11\n")
+
+
+class TranspilingInterpreterMixin:
+    """Runs interpreter tests with programs transpiled into Python."""
+
+    flatten = False
+
+    def setup_interpreter(self, text: str) -> Interpreter:
+        return setup_transpiling_interpreter(text, flatten=self.flatten)
+
+
+class FlattenedTranspilingInterpreterMixin(TranspilingInterpreterMixin):
+    flatten = True
+
+
+class InterpreterConditionalsTests(TranspilingInterpreterMixin, test_conditionals.InterpreterConditionalsTests):
+    pass
+
+
+class InterpreterConstLetAssignmentAndDeclarationTests(
+    TranspilingInterpreterMixin, test_const_let.InterpreterConstLetAssignmentAndDeclarationTests
+):
+    pass
+
+
+class InterpreterFunctionsTests(TranspilingInterpreterMixin, test_functions.InterpreterFunctionsTests):
+    pass
+
+
+class InterpreterWhileLoopTests(TranspilingInterpreterMixin, test_loops.InterpreterWhileLoopTests):
+    pass
+
+
+class InterpreterOperatorAllowedTypesTests(
+    TranspilingInterpreterMixin, test_operators.InterpreterOperatorAllowedTypesTests
+):
+    pass
+
+
+class FlattenedInterpreterOperatorAllowedTypesTests(
+    FlattenedTranspilingInterpreterMixin, test_operators.InterpreterOperatorAllowedTypesTests
+):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
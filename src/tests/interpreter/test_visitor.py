@@ -0,0 +1,44 @@
+import unittest
+
+from src.interpreter.visitor import Visitor
+from src.parser.objects.objects import Identifier, Literal
+from src.parser.types import Integer
+
+
+class NameVisitor(Visitor):
+
+    def visit_Identifier(self, identifier: Identifier):
+        return identifier.name
+
+
+class UpperNameVisitor(NameVisitor):
+
+    def visit_Identifier(self, identifier: Identifier):
+        return identifier.name.upper()
+
+
+class VisitorTests(unittest.TestCase):
+
+    def test_visit_dispatches_by_node_class(self):
+        visitor = NameVisitor()
+
+        self.assertEqual(visitor.visit(Identifier('a')), 'a')
+        self.assertEqual(visitor.visit(Identifier('b')), 'b')
+
+    def test_visit_respects_overridden_methods(self):
+        # fill cache of base class first
+        NameVisitor().visit(Identifier('a'))
+
+        self.assertEqual(UpperNameVisitor().visit(Identifier('a')), 'A')
+        self.assertEqual(NameVisitor().visit(Identifier('a')), 'a')
+
+    def test_visit_respects_methods_assigned_to_instance(self):
+        visitor = NameVisitor()
+        visitor.visit_Identifier = lambda identifier: identifier.name * 2
+
+        self.assertEqual(visitor.visit(Identifier('a')), 'aa')
+        self.assertEqual(NameVisitor().visit(Identifier('a')), 'a')
+
+    def test_visit_missing_method(self):
+        with self.assertRaises(Exception):
+            NameVisitor().visit(Literal(Integer(), 1))
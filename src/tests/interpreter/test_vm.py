@@ -0,0 +1,176 @@
+import sys
+import unittest
+from pathlib import Path
+
+from parameterized import parameterized
+
+from src.errors.interpreter import (
+    RecursionLimitError, ReturnOutsideOfFunctionError, UndefinedNameError, UnexpectedTypeError
+)
+from src.interpreter.bytecode import Opcode, disassemble
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.vm import VirtualMachine
+from src.tests.interpreter import test_conditionals, test_const_let, test_functions, test_loops, test_operators
+from src.tests.interpreter.test_closures import run_program
+from src.tests.utils import setup_parser, mock_stdout
+
+EXAMPLES_DIR = Path(__file__).parents[3] / "examples"
+
+
+def setup_vm(text: str, flatten: bool = False) -> VirtualMachine:
+    return VirtualMachine(parser=setup_parser(text, flatten=flatten))
+
+
+class VirtualMachineTests(unittest.TestCase):
+
+    @parameterized.expand([
+        ("everything.ty",),
+        ("fizzbuzz.ty",),
+        ("lambdas.ty",),
+        ("main.ty",),
+    ])
+    def test_examples_same_output(self, file_name: str):
+        text = (EXAMPLES_DIR / file_name).read_text()
+        self.assertEqual(run_program(VirtualMachine, text), run_program(Interpreter, text))
+
+    @parameterized.expand([
+        ('print(a);', UndefinedNameError),
+        ('return 1;', ReturnOutsideOfFunctionError),
+        ('let a: int = 1; while (a) {}', UnexpectedTypeError),
+        ('def f(): int => f() f();', RecursionLimitError),
+    ])
+    def test_errors_are_raised(self, text, error_class):
+        with self.assertRaises(error_class):
+            setup_vm(text).interpret()
+
+    def test_loops_and_conditionals_are_jumps(self):
+        vm = setup_vm("let i: int = 0; while (i < 10) { if (i > 5) { i = i + 2; } else { i = i + 1; } }")
+        program = vm.parser.parse_program()
+        vm.run(program)
+        opcodes = set(vm.compiler.compile(program).opcodes)
+
+        self.assertEqual(vm.env.get_variable('i').value.value, 10)
+        self.assertIn(Opcode.JUMP, opcodes)
+        self.assertIn(Opcode.JUMP_IF_NOT_TRUE, opcodes)
+        # blocks are compiled into the program's code, not into separate code objects
+        self.assertEqual(len(vm.compiler.code_objects), 1)
+
+    def test_calls_do_not_recurse(self):
+        text = """
+        def f(n: int): int => {
+            if (n == 0) { return 0; }
+            return f(n - 1) + 1;
+        }
+        let a: int = f(50);
+        """
+        limit = sys.getrecursionlimit()
+        # tree interpreter needs several Python frames for every call
+        sys.setrecursionlimit(200)
+        try:
+            vm = setup_vm(text)
+            vm.interpret()
+        finally:
+            sys.setrecursionlimit(limit)
+
+        self.assertEqual(vm.env.get_variable('a').value.value, 50)
+        self.assertEqual(vm.env.fun_call_nesting, 0)
+
+    @mock_stdout
+    def test_redefined_function_is_called(self, stdout):
+        text = """
+        def f(): int => 1
+        def g(): void => {
+            print(f());
+        }
+        g();
+        def f(): int => 2
+        g();
+        """
+        setup_vm(text).interpret()
+        self.assertEqual(stdout.getvalue(), "1\n2\n")
+
+    @mock_stdout
+    def test_variable_changed_by_function_call_in_expression(self, stdout):
+        text = """
+        let a: int = 1;
+        def f(): int => {
+            a = 10;
+            return 1;
+        }
+        print(a + f());
+        """
+        setup_vm(text).interpret()
+        self.assertEqual(stdout.getvalue(), "11\n")
+
+    def test_disassemble(self):
+        text = """
+        def f(x: int): int => x * 2
+        let i: int = 0;
+        while (i < 3) { i = i + f(i); }
+        """
+        vm = setup_vm(text, flatten=True)
+        listing = vm.disassemble(vm.parser.parse_program())
+
+        self.assertIn("code Program:", listing)
+        self.assertIn("code f:", listing)
+        self.assertIn("DEFINE_FUNCTION", listing)
+        self.assertIn("JUMP_IF_NOT_TRUE", listing)
+        self.assertIn("(Integer 3)", listing)
+        self.assertIn("(f/1, f)", listing)
+        self.assertIn("(MUL)", listing)
+
+    def test_disassembled_instructions(self):
+        vm = setup_vm("let a: int = 1; print(a);", flatten=True)
+        program = vm.parser.parse_program()
+        vm.prepare(program)
+        lines = disassemble(vm.compiler.compile(program)).splitlines()
+
+        self.assertEqual(
+            [line.split()[1] for line in lines[1:]],
+            ['LOAD_CONST', 'DECLARE', 'LOAD_FUNCTION', 'LOAD_NAME', 'CALL', 'POP', 'LOAD_CONST', 'END']
+        )
+
+
+class VirtualMachineMixin:
+    """Runs interpreter tests with programs compiled into bytecode."""
+
+    flatten = False
+
+    def setup_interpreter(self, text: str) -> Interpreter:
+        return setup_vm(text, flatten=self.flatten)
+
+
+class FlattenedVirtualMachineMixin(VirtualMachineMixin):
+    flatten = True
+
+
+class InterpreterConditionalsTests(VirtualMachineMixin, test_conditionals.InterpreterConditionalsTests):
+    pass
+
+
+class InterpreterConstLetAssignmentAndDeclarationTests(
+    VirtualMachineMixin, test_const_let.InterpreterConstLetAssignmentAndDeclarationTests
+):
+    pass
+
+
+class InterpreterFunctionsTests(VirtualMachineMixin, test_functions.InterpreterFunctionsTests):
+    pass
+
+
+class InterpreterWhileLoopTests(VirtualMachineMixin, test_loops.InterpreterWhileLoopTests):
+    pass
+
+
+class InterpreterOperatorAllowedTypesTests(VirtualMachineMixin, test_operators.InterpreterOperatorAllowedTypesTests):
+    pass
+
+
+class FlattenedInterpreterOperatorAllowedTypesTests(
+    FlattenedVirtualMachineMixin, test_operators.InterpreterOperatorAllowedTypesTests
+):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,14 @@
+import unittest
+
+from src.interpreter.interpreter import Interpreter
+from src.tests.utils import setup_interpreter
+
+
+class InterpreterTestCase(unittest.TestCase):
+    """Base of interpreter tests, which create interpreters with `setup_interpreter` method.
+    Subclasses override the method to run the same tests with another engine or parser options."""
+
+    flatten = False
+
+    def setup_interpreter(self, text: str) -> Interpreter:
+        return setup_interpreter(text, flatten=self.flatten)
@@ -0,0 +1,170 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from src.errors.parser import UnexpectedTokenError
+from src.interpreter.interpreter import Interpreter
+from src.parser.cache import ProgramCache, CachingParser, CACHE_SUFFIX, compute_interpreter_version
+from src.parser.objects.objects import walk
+from src.parser.objects.program import Program
+from src.parser.parser import Parser
+from src.tests.utils import setup_parser, mock_stdout
+
+TEXT = """def fib(n: int): int => {
+    if (n <= 1) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+const add: func((x: int, y: int) => int) = (x: int, y: int): int => x + y;
+print(fib(10), add(1, 2));
+"""
+
+
+class ProgramCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.cache_dir = Path(self.temp_dir.name) / "cache"
+        self.file_name = Path(self.temp_dir.name) / "main.ty"
+        self.file_name.write_text(TEXT)
+
+        self.cache = ProgramCache(self.cache_dir)
+
+    def make_parser_mock(self, text: str = TEXT) -> Mock:
+        return Mock(side_effect=lambda: setup_parser(text))
+
+    def test_version_depends_on_code(self):
+        self.assertEqual(compute_interpreter_version(), self.cache.version)
+        self.assertNotEqual(self.cache.key(b"a"), ProgramCache(self.cache_dir, version="other").key(b"a"))
+        self.assertNotEqual(self.cache.key(b"a"), self.cache.key(b"b"))
+
+    def test_key_depends_on_parser_options(self):
+        class OtherParser(Parser):
+            pass
+
+        keys = {
+            self.cache.key(b"a"),
+            self.cache.key(b"a", flatten=True),
+            self.cache.key(b"a", OtherParser),
+        }
+        self.assertEqual(len(keys), 3)
+
+    def test_flattened_program_is_not_reused(self):
+        make_parser = self.make_parser_mock()
+        program = CachingParser(self.file_name, self.cache, make_parser).parse_program()
+
+        flattened_make_parser = Mock(side_effect=lambda: setup_parser(TEXT, flatten=True))
+        flattened_program = CachingParser(
+            self.file_name, self.cache, flattened_make_parser, flatten=True
+        ).parse_program()
+
+        self.assertEqual(flattened_make_parser.call_count, 1)
+        self.assertNotEqual(
+            [node.__class__ for node in walk(program)], [node.__class__ for node in walk(flattened_program)]
+        )
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), "file permissions are not checked on this platform")
+    def test_entry_writable_by_others_is_not_loaded(self):
+        CachingParser(self.file_name, self.cache, self.make_parser_mock()).parse_program()
+        path = self.cache.path(self.cache.key(self.file_name.read_bytes()))
+
+        path.chmod(0o666)
+        self.assertIsNone(self.cache.load(path.stem))
+
+        path.chmod(0o600)
+        self.cache_dir.chmod(0o777)
+        self.assertIsNone(self.cache.load(path.stem))
+
+        self.cache_dir.chmod(0o700)
+        self.assertIsInstance(self.cache.load(path.stem), Program)
+
+    @unittest.skipUnless(hasattr(os, 'O_NOFOLLOW'), "symbolic links are followed on this platform")
+    def test_linked_entry_is_not_loaded(self):
+        program = setup_parser(TEXT).parse_program()
+        self.cache.store("a", program)
+        self.cache.path("b").symlink_to(self.cache.path("a"))
+
+        self.assertIsInstance(self.cache.load("a"), Program)
+        self.assertIsNone(self.cache.load("b"))
+
+    def test_hit_skips_parsing(self):
+        make_parser = self.make_parser_mock()
+
+        program = CachingParser(self.file_name, self.cache, make_parser).parse_program()
+        self.assertIsInstance(program, Program)
+        self.assertEqual(make_parser.call_count, 1)
+
+        program = CachingParser(self.file_name, self.cache, make_parser).parse_program()
+        self.assertIsInstance(program, Program)
+        self.assertEqual(make_parser.call_count, 1)
+
+    def test_cached_program_is_interpreted_the_same(self):
+        outputs = []
+
+        for _ in range(2):
+            parser = CachingParser(self.file_name, self.cache, self.make_parser_mock())
+            with mock_stdout as stdout:
+                Interpreter(parser=parser).interpret()
+            outputs.append(stdout.getvalue())
+
+        self.assertEqual(outputs, ["55 3\n", "55 3\n"])
+
+    def test_changed_file_is_parsed_again(self):
+        make_parser = self.make_parser_mock()
+        CachingParser(self.file_name, self.cache, make_parser).parse_program()
+
+        self.file_name.write_text(TEXT + "print(1);")
+        CachingParser(self.file_name, self.cache, make_parser).parse_program()
+        self.assertEqual(make_parser.call_count, 2)
+
+    def test_no_temporary_files_left(self):
+        CachingParser(self.file_name, self.cache, self.make_parser_mock()).parse_program()
+        self.assertEqual([path.suffix for path in self.cache_dir.iterdir()], [CACHE_SUFFIX])
+
+    def test_corrupted_entry_is_a_miss(self):
+        key = self.cache.key(self.file_name.read_bytes())
+        self.cache_dir.mkdir()
+        self.cache.path(key).write_bytes(b"not a pickle")
+
+        make_parser = self.make_parser_mock()
+        program = CachingParser(self.file_name, self.cache, make_parser).parse_program()
+        self.assertIsInstance(program, Program)
+        self.assertEqual(make_parser.call_count, 1)
+        self.assertIsInstance(self.cache.load(key), Program)
+
+    def test_parser_error_is_not_cached(self):
+        self.file_name.write_text("let a: int = 1")
+        make_parser = self.make_parser_mock("let a: int = 1")
+
+        for _ in range(2):
+            with self.assertRaises(UnexpectedTokenError):
+                CachingParser(self.file_name, self.cache, make_parser).parse_program()
+
+        self.assertEqual(make_parser.call_count, 2)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        program = setup_parser(TEXT).parse_program()
+        self.cache.store("a", program)
+        entry_size = self.cache.path("a").stat().st_size
+        self.cache.max_size = 2 * entry_size
+
+        self.cache.store("b", program)
+        os.utime(self.cache.path("a"), (0, 0))
+        os.utime(self.cache.path("b"), (1, 1))
+        # using an entry makes it the most recently used one
+        self.assertIsNotNone(self.cache.load("a"))
+
+        self.cache.store("c", program)
+
+        self.assertIsNotNone(self.cache.load("a"))
+        self.assertIsNone(self.cache.load("b"))
+        self.assertIsNotNone(self.cache.load("c"))
+
+
+if __name__ == '__main__':
+    unittest.main()
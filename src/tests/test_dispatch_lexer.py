@@ -0,0 +1,71 @@
+import unittest
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from src.lexer.dispatch_lexer import DispatchLexer, DispatchLexerSkippingComments, DISPATCH_TABLE
+from src.lexer.lexer import Lexer, LexerSkippingComments
+from src.lexer.token_type import ONE_CHAR_OPS, TWO_CHAR_OPS
+from src.source import StringSource
+from src.tests import test_lexer
+from src.tests.test_regex_lexer import EXAMPLES_DIR, collect_tokens
+from src.tests.utils import setup_lexer
+
+
+def setup_dispatch_lexer(text: str) -> Lexer:
+    return setup_lexer(text, lexer_class=DispatchLexer)
+
+
+class DispatchLexerTests(test_lexer.LexerTests):
+    """Runs all lexer tests against lexer with dispatch table."""
+
+    def setUp(self):
+        patcher = patch.object(test_lexer, 'setup_lexer', setup_dispatch_lexer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class DispatchLexerMatchesLexerTests(unittest.TestCase):
+
+    def test_dispatch_table(self):
+        self.assertEqual(len(DISPATCH_TABLE), 128)
+        self.assertEqual(DISPATCH_TABLE[ord("a")], "_try_build_identifier")
+        self.assertEqual(DISPATCH_TABLE[ord("_")], "_try_build_identifier")
+        self.assertEqual(DISPATCH_TABLE[ord("7")], "_try_build_number")
+        self.assertEqual(DISPATCH_TABLE[ord("/")], "_try_build_comment")
+        self.assertEqual(DISPATCH_TABLE[ord("'")], "_try_build_string")
+        self.assertIsNone(DISPATCH_TABLE[ord("|")])
+
+        for operator in [*ONE_CHAR_OPS, *TWO_CHAR_OPS]:
+            if operator != "/":
+                self.assertEqual(DISPATCH_TABLE[ord(operator[0])], "_build_operator")
+
+    @parameterized.expand([(path.name,) for path in sorted(EXAMPLES_DIR.glob("*.ty"))])
+    def test_examples_same_tokens(self, file_name: str):
+        text = (EXAMPLES_DIR / file_name).read_text()
+
+        for lexer_class, dispatch_lexer_class in [
+            (Lexer, DispatchLexer),
+            (LexerSkippingComments, DispatchLexerSkippingComments)
+        ]:
+            expected = collect_tokens(lexer_class(StringSource(text)))
+            self.assertEqual(collect_tokens(dispatch_lexer_class(StringSource(text))), expected)
+
+    @parameterized.expand([
+        ("a\n!b",),
+        ("a ? b",),
+        ("a ?",),
+        ("\n\n   |",),
+        ("  ½",),
+        ("zażółć = 'zażółć';",),
+        ("żółw²",),
+        ("a \x03 b",),
+        ("x /y // z\n/* w */",),
+    ])
+    def test_same_tokens_and_errors(self, text: str):
+        expected = collect_tokens(Lexer(StringSource(text)))
+        self.assertEqual(collect_tokens(DispatchLexer(StringSource(text))), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
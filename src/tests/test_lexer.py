@@ -5,7 +5,7 @@ from string import ascii_lowercase as letters
 from parameterized import parameterized
 
 from src.errors.lexer import LexerError
-from src.lexer.lexer import Lexer
+from src.lexer.lexer import Lexer, LexerSkippingComments
 from src.lexer.token_type import TokenType, KEYWORDS, ETX_VALUE
 from src.tests.utils import setup_lexer
 
@@ -420,5 +420,46 @@ class LexerTests(unittest.TestCase):
             lexer2.build_next_token()
 
 
+class LexerSkippingCommentsTests(unittest.TestCase):
+
+    def test_skip_comments(self):
+        text = "a // one\n/* two\n*** */ b /**/ / c //"
+        lexer = setup_lexer(text, lexer_class=LexerSkippingComments)
+
+        token = lexer.build_next_token()
+        self.assertEqual((token.type, token.value), (TokenType.ID, "a"))
+
+        token = lexer.build_next_token()
+        self.assertEqual((token.type, token.value), (TokenType.ID, "b"))
+        self.assertEqual((token.position.line, token.position.column), (3, 8))
+
+        self.assertEqual(lexer.build_next_token().type, TokenType.DIV)
+        self.assertEqual(lexer.build_next_token().type, TokenType.ID)
+        self.assertEqual(lexer.build_next_token().type, TokenType.ETX)
+
+    def test_skipped_comment_has_no_value(self):
+        lexer = setup_lexer("// hello world!", lexer_class=LexerSkippingComments)
+        token = lexer._try_build_comment()
+        self.assertEqual(token.type, TokenType.COMMENT)
+        self.assertIsNone(token.value)
+
+    @parameterized.expand([
+        ("/*\n        ",),
+        ("a /* b *",),
+        ("/* a \x03 */",),
+    ])
+    def test_skip_multiline_comment_not_closed(self, text: str):
+        errors = []
+        for lexer_class in [Lexer, LexerSkippingComments]:
+            lexer = setup_lexer(text, lexer_class=lexer_class)
+            with self.assertRaises(LexerError) as error:
+                while lexer.build_next_token().type != TokenType.ETX:
+                    pass
+
+            errors.append(str(error.exception))
+
+        self.assertEqual(errors[0], errors[1])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -12,7 +12,7 @@ from src.parser.objects.objects import (
     NullCoalesceExpression, EqualityExpression, WhileLoopStatement, EmptyStatement,
     ReturnStatement, CompoundStatement, LambdaExpression,
     InlineReturnStatement, Parameter, BinaryExpression, IfStatement, ElseStatement, FunctionDefinition, ElifStatement,
-    NegFactor
+    NegFactor, OrExpression, AndExpression, UnaryNot, UnaryMinus, walk
 )
 from src.parser.objects.program import Program
 from src.parser.types import (
@@ -1945,6 +1945,133 @@ class ExpressionsTests(unittest.TestCase):
         expr = setup_parser(text).try_parse_expression()
         self.assertIsNotNone(expr)
 
+    def test_operators_precedence(self):
+        text = "a ?? b or c and d == e < not f + g * -h"
+        expr = setup_parser(text).try_parse_expression()
+
+        self.assertIsInstance(expr, BinaryExpression)
+        self.assertEqual(expr.operator, OtherOperator.NULL_COALESCE)
+
+        or_expr = expr.right_value
+        self.assertIsInstance(or_expr, NullCoalesceExpression)
+        self.assertEqual(or_expr.operator, LogicOperator.OR)
+
+        and_expr = or_expr.right_value
+        self.assertIsInstance(and_expr, OrExpression)
+        self.assertEqual(and_expr.operator, LogicOperator.AND)
+
+        equality_expr = and_expr.right_value
+        self.assertIsInstance(equality_expr, AndExpression)
+        self.assertEqual(equality_expr.operator, ComparisonOperator.EQ)
+
+        comparison_expr = equality_expr.right_value
+        self.assertIsInstance(comparison_expr, EqualityExpression)
+        self.assertEqual(comparison_expr.operator, ComparisonOperator.LT)
+
+        comp_factor = comparison_expr.right_value
+        self.assertIsInstance(comp_factor, CompFactor)
+        self.assertTrue(comp_factor.negation)
+
+        additive_expr = comp_factor.factor
+        self.assertIsInstance(additive_expr, AdditiveExpression)
+        self.assertEqual(additive_expr.left_value.factor.value.name, "f")
+
+        multiplicative_expr = additive_expr.right_value
+        self.assertIsInstance(multiplicative_expr, MultiplicativeExpression)
+        self.assertEqual(multiplicative_expr.left_value.factor.value.name, "g")
+        self.assertTrue(multiplicative_expr.right_value.minus)
+        self.assertEqual(multiplicative_expr.right_value.factor.value.name, "h")
+
+    def test_operators_left_associative(self):
+        text = "a - b + c"
+        expr = setup_parser(text).try_parse_expression()
+
+        additive_expr = expr.factor
+        self.assertEqual(additive_expr.operator, ArithmeticOperator.PLUS)
+        self.assertEqual(additive_expr.right_value.factor.value.name, "c")
+        self.assertEqual(additive_expr.left_value.operator, ArithmeticOperator.MINUS)
+
+    def test_deeply_nested_expression(self):
+        depth = 150
+        text = "(" * depth + "1" + ")" * depth
+        expr = setup_parser(text).try_parse_expression()
+        self.assertIsNotNone(expr)
+
+
+class FlattenedExpressionsTests(unittest.TestCase):
+
+    def test_operand_without_negation_is_not_wrapped(self):
+        expr = setup_parser("1", flatten=True).try_parse_expression()
+        self.assertIsInstance(expr, Literal)
+        self.assertEqual(expr.value, 1)
+
+    def test_negations(self):
+        text = "not a < -f() * (b)"
+        expr = setup_parser(text, flatten=True).try_parse_expression()
+
+        self.assertIsInstance(expr, EqualityExpression)
+        self.assertIsInstance(expr.left_value, UnaryNot)
+        self.assertIsInstance(expr.left_value.operand, Identifier)
+
+        multiplicative_expr = expr.right_value
+        self.assertIsInstance(multiplicative_expr, MultiplicativeExpression)
+        self.assertIsInstance(multiplicative_expr.left_value, UnaryMinus)
+        self.assertIsInstance(multiplicative_expr.left_value.operand, FunctionCall)
+        self.assertIsInstance(multiplicative_expr.right_value, Identifier)
+
+    def test_negated_arithmetic_expression(self):
+        text = "not a + b"
+        expr = setup_parser(text, flatten=True).try_parse_expression()
+
+        self.assertIsInstance(expr, UnaryNot)
+        self.assertIsInstance(expr.operand, AdditiveExpression)
+
+    def test_lambda_in_parentheses(self):
+        text = "((x: int): int => x)"
+        expr = setup_parser(text, flatten=True).try_parse_expression()
+        self.assertIsInstance(expr, LambdaExpression)
+
+        text = "(): int => 1"
+        expr = setup_parser(text, flatten=True).try_parse_expression()
+        self.assertIsInstance(expr, LambdaExpression)
+
+
+class NodeFieldsTests(unittest.TestCase):
+
+    def test_nodes_do_not_have_dict(self):
+        program = parse("let a: int = 1 + 2; print(a);")
+
+        for node in walk(program):
+            self.assertFalse(hasattr(node, '__dict__'), node)
+
+    def test_fields_include_inherited_slots(self):
+        self.assertEqual(AdditiveExpression.fields, ('left_value', 'operator', 'right_value'))
+        self.assertEqual(InlineReturnStatement.fields, ('expression',))
+        self.assertEqual(Program.fields, ('objects',))
+
+    def test_iter_child_nodes(self):
+        program = parse("while (a < 2) { a = -a; }")
+        loop = program.objects[0]
+
+        self.assertEqual(list(program.iter_child_nodes()), [loop])
+        self.assertEqual(list(loop.iter_child_nodes()), [loop.condition, loop.body])
+
+    def test_iter_child_nodes_flattens_nested_lists(self):
+        program = setup_parser("f(1, 2)(3);", flatten=True).parse_program()
+        call = program.objects[0]
+
+        children = list(call.iter_child_nodes())
+        self.assertEqual(len(children), 3)
+        self.assertEqual([child.value for child in children], [1, 2, 3])
+
+    def test_walk_visits_all_nodes_in_depth_first_order(self):
+        program = setup_parser("let a: int = 1 + 2;", flatten=True).parse_program()
+
+        self.assertEqual(
+            [type(node) for node in walk(program)],
+            [Program, DeclarationStatement, Variable, AdditiveExpression, Literal, Literal]
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
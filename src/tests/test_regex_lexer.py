@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from src.errors.lexer import LexerError
+from src.lexer.lexer import Lexer, LexerSkippingComments
+from src.lexer.regex_lexer import RegexLexer, RegexLexerSkippingComments
+from src.lexer.token_type import TokenType
+from src.source import StringSource, BufferedFileSource, MmapSource
+from src.tests import test_lexer
+from src.tests.utils import setup_lexer
+
+EXAMPLES_DIR = Path(__file__).parents[2] / "examples"
+
+# texts with tokens and errors which are the hardest to match with a regex
+TEXTS = [
+    "\n\nlet a: int = 01;",
+    "x\n y\n  1.",
+    "1.x",
+    "\n\n 1.2e+",
+    "1.2e-",
+    "\n\"abc",
+    "'a\\",
+    "'a\\'",
+    "\"a\\\"b\\\\c\\nd'\"",
+    "'\x03'",
+    "a \x03 b",
+    "\n  /* abc\n\n",
+    "/* a **/ b /*/",
+    "a\n!b",
+    "a ? b",
+    "a ?",
+    "\n\n   |",
+    "  ½",
+    "zażółć = 'zażółć';",
+    "\n" + "x" * 300,
+    "\"" + "a" * 10000 + "\"",
+    "\"" + "a" * 10001 + "\"",
+    "\n\"" + "\\n" * 10002 + "\"",
+    "\n\"" + "a" * 10002,
+    "'a\\\x03b' c",
+    "1.5e1e 1.5E00e_",
+]
+
+
+def setup_regex_lexer(text: str) -> Lexer:
+    return setup_lexer(text, lexer_class=RegexLexer)
+
+
+def collect_tokens(lexer: Lexer) -> list[tuple]:
+    """Builds all tokens until ETX or an error, error is collected as the last element."""
+
+    tokens = []
+    try:
+        while (token := lexer.build_next_token()).type != TokenType.ETX:
+            tokens.append((token.type, token.value, str(token.position)))
+        tokens.append((token.type, token.value, str(token.position)))
+
+    except LexerError as error:
+        tokens.append(str(error))
+
+    return tokens
+
+
+class RegexLexerTests(test_lexer.LexerTests):
+    """Runs all lexer tests against regex engine."""
+
+    def setUp(self):
+        patcher = patch.object(test_lexer, 'setup_lexer', setup_regex_lexer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class RegexLexerMatchesLexerTests(unittest.TestCase):
+
+    @parameterized.expand([(path.name,) for path in sorted(EXAMPLES_DIR.glob("*.ty"))])
+    def test_examples_same_tokens(self, file_name: str):
+        text = (EXAMPLES_DIR / file_name).read_text()
+
+        for lexer_class, regex_lexer_class in [
+            (Lexer, RegexLexer),
+            (LexerSkippingComments, RegexLexerSkippingComments)
+        ]:
+            expected = collect_tokens(lexer_class(StringSource(text)))
+            self.assertEqual(collect_tokens(regex_lexer_class(StringSource(text))), expected)
+
+    @parameterized.expand([(text,) for text in TEXTS])
+    def test_same_tokens_and_errors(self, text: str):
+        expected = collect_tokens(Lexer(StringSource(text)))
+        self.assertEqual(collect_tokens(RegexLexer(StringSource(text))), expected)
+
+    @parameterized.expand([
+        (1,),
+        (2,),
+        (5,),
+        (BufferedFileSource.BLOCK_SIZE,),
+    ])
+    def test_tokens_cut_by_blocks(self, block_size: int):
+        texts = TEXTS + [path.read_text() for path in sorted(EXAMPLES_DIR.glob("*.ty"))]
+        fd, file_name = tempfile.mkstemp(suffix='.ty')
+        os.close(fd)
+        self.addCleanup(os.remove, file_name)
+
+        for text in texts:
+            with open(file_name, 'w', encoding='utf-8') as file:
+                file.write(text)
+
+            expected = collect_tokens(Lexer(StringSource(text)))
+
+            for source_class in [BufferedFileSource, MmapSource]:
+                with self.subTest(text=text[:20], source=source_class.__name__):
+                    source = source_class(Path(file_name), block_size=block_size)
+                    self.assertEqual(collect_tokens(RegexLexer(source)), expected)
+
+    def test_only_tokens_are_kept(self):
+        lexer = RegexLexerSkippingComments(StringSource("a // b\n/* c */ d"))
+
+        self.assertEqual(list(lexer.stream.kinds), [TokenType.ID.value, TokenType.ID.value, TokenType.ETX.value])
+        self.assertEqual(lexer.stream.values, {0: "a", 1: "d"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+import gc
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from src.lexer.token_type import ETX_VALUE
+from src.source import Source, StringSource, FileSource, BufferedFileSource, MmapSource
+
+TEXT = """let a: int = 1;
+// comment
+while (a < 10) {
+    a = a + 1;
+}
+"""
+
+
+def read_all(source: Source) -> list[tuple[str, int, int, int]]:
+    """Reads source until ETX, collecting characters with their positions."""
+
+    collected = []
+    while source.current_char != ETX_VALUE:
+        collected.append((source.current_char, source.line, source.column, source.current_position))
+        source.get_next_character()
+
+    return collected
+
+
+class SourceTests(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.file_name = tempfile.mkstemp(suffix='.ty')
+        with os.fdopen(fd, 'w') as file:
+            file.write(TEXT)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_string_source_positions(self):
+        source = StringSource("\nab\n\nc")
+        expected = [
+            ("\n", 1, 1, 0), ("a", 1, 2, 1), ("b", 1, 3, 2),
+            ("\n", 2, 0, 3), ("\n", 3, 0, 4), ("c", 3, 1, 5),
+        ]
+        self.assertEqual(read_all(source), expected)
+
+        # position does not move past last character
+        self.assertEqual((source.line, source.column, source.current_position), (3, 1, 5))
+
+    def test_file_source_matches_string_source(self):
+        expected = read_all(StringSource(TEXT))
+        self.assertEqual(read_all(FileSource(Path(self.file_name))), expected)
+
+    @parameterized.expand([
+        (1,),
+        (2,),
+        (7,),
+        (BufferedFileSource.BLOCK_SIZE,),
+    ])
+    def test_buffered_file_source_matches_string_source(self, block_size: int):
+        expected = read_all(StringSource(TEXT))
+        source = BufferedFileSource(Path(self.file_name), block_size=block_size)
+        self.assertEqual(read_all(source), expected)
+
+    def test_buffered_file_source_stays_at_etx(self):
+        source = BufferedFileSource(Path(self.file_name), block_size=4)
+        read_all(source)
+        position = (source.line, source.column, source.current_position)
+
+        source.get_next_character()
+        self.assertEqual(source.current_char, ETX_VALUE)
+        self.assertEqual((source.line, source.column, source.current_position), position)
+
+    def test_mmap_source_matches_string_source(self):
+        expected = read_all(StringSource(TEXT))
+        self.assertEqual(read_all(MmapSource(Path(self.file_name))), expected)
+
+    @parameterized.expand([
+        (1,),
+        (2,),
+        (5,),
+        (BufferedFileSource.BLOCK_SIZE,),
+    ])
+    def test_mmap_source_non_ascii_characters(self, block_size: int):
+        text = 'const a: str = "zażółć € 𝄞";\nprint(a);'
+        with open(self.file_name, 'w', encoding='utf-8') as file:
+            file.write(text)
+
+        expected = read_all(StringSource(text))
+        self.assertEqual(read_all(MmapSource(Path(self.file_name), block_size=block_size)), expected)
+
+    @parameterized.expand([
+        (1,),
+        (2,),
+        (BufferedFileSource.BLOCK_SIZE,),
+    ])
+    def test_mmap_source_translates_line_endings(self, block_size: int):
+        with open(self.file_name, 'wb') as file:
+            file.write(b"a\r\nb\rc\n\r")
+
+        expected = read_all(StringSource("a\nb\nc\n\n"))
+        self.assertEqual(read_all(MmapSource(Path(self.file_name), block_size=block_size)), expected)
+
+    @parameterized.expand([
+        (MmapSource,),
+        (BufferedFileSource,),
+        (FileSource,),
+    ])
+    def test_missing_file_is_not_closed(self, source_class: type[Source]):
+        with patch('sys.unraisablehook') as unraisable_hook:
+            with self.assertRaises(FileNotFoundError):
+                source_class(Path(self.file_name + ".missing"))
+
+            gc.collect()
+
+        # failed __init__ does not raise another error when source is destroyed
+        unraisable_hook.assert_not_called()
+
+    def test_mmap_source_empty_file(self):
+        with open(self.file_name, 'w'):
+            pass
+
+        source = MmapSource(Path(self.file_name))
+        self.assertEqual(source.current_char, ETX_VALUE)
+        source.get_next_character()
+        self.assertEqual(source.current_char, ETX_VALUE)
+
+    @parameterized.expand([
+        ("string", None),
+        ("buffered", 1),
+        ("buffered", 3),
+        ("buffered", BufferedFileSource.BLOCK_SIZE),
+        ("mmap", None),
+    ])
+    def test_skip_to(self, source_type: str, block_size: int):
+        if source_type == "string":
+            source = StringSource(TEXT)
+        elif source_type == "buffered":
+            source = BufferedFileSource(Path(self.file_name), block_size=block_size)
+        else:
+            source = MmapSource(Path(self.file_name))
+
+        expected = read_all(StringSource(TEXT))
+
+        # current character is already a stop character
+        source.skip_to("l")
+        self.assertEqual((source.current_char, source.line, source.column, source.current_position), expected[0])
+
+        source.skip_to("/")
+        self.assertEqual((source.current_char, source.line, source.column, source.current_position), expected[16])
+
+        source.skip_to("\n")
+        self.assertEqual((source.current_char, source.line, source.column, source.current_position), expected[26])
+
+        # skipped newlines are still indexed
+        source.skip_to("{}")
+        self.assertEqual((source.current_char, source.line, source.column, source.current_position), expected[42])
+        self.assertEqual(read_all(source), expected[42:])
+
+        # reaching end of text does not move position past last character
+        source = StringSource(TEXT)
+        source.skip_to("#")
+        self.assertEqual(source.current_char, ETX_VALUE)
+        self.assertEqual(source.current_position, len(TEXT) - 1)
+
+    @parameterized.expand([
+        ("string", None),
+        ("buffered", 2),
+        ("buffered", BufferedFileSource.BLOCK_SIZE),
+    ])
+    def test_read_remaining(self, source_type: str, block_size: int):
+        if source_type == "string":
+            source = StringSource(TEXT)
+        else:
+            source = BufferedFileSource(Path(self.file_name), block_size=block_size)
+
+        source.skip_to("/")
+        self.assertEqual(source.read_remaining(), TEXT[16:])
+        self.assertEqual(source.current_char, ETX_VALUE)
+
+        source.get_next_character()
+        self.assertEqual(source.current_char, ETX_VALUE)
+        self.assertEqual(source.read_remaining(), "")
+
+    def test_skip_to_stops_at_etx_character(self):
+        source = StringSource("abc\x03def")
+        source.skip_to("f")
+        self.assertEqual((source.current_char, source.current_position), (ETX_VALUE, 3))
+
+    def test_buffered_file_source_etx_character_at_block_boundary(self):
+        text = "ab\x03cd"
+        with open(self.file_name, 'w') as file:
+            file.write(text)
+
+        expected = [(char, 1, position + 1, position) for position, char in enumerate(text)]
+        source = BufferedFileSource(Path(self.file_name), block_size=3)
+
+        collected = []
+        for _ in range(len(text)):
+            collected.append((source.current_char, source.line, source.column, source.current_position))
+            source.get_next_character()
+
+        self.assertEqual(collected, expected)
+
+    def test_buffered_file_source_empty_file(self):
+        with open(self.file_name, 'w'):
+            pass
+
+        source = BufferedFileSource(Path(self.file_name))
+        self.assertEqual(source.current_char, ETX_VALUE)
+        self.assertEqual((source.line, source.column, source.current_position), (1, 1, 0))
+        source.get_next_character()
+        self.assertEqual(source.current_char, ETX_VALUE)
+
+
+if __name__ == '__main__':
+    unittest.main()
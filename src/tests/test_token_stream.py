@@ -0,0 +1,117 @@
+import unittest
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from src.errors.lexer import LexerError
+from src.lexer.lexer import Lexer, LexerSkippingComments
+from src.lexer.regex_lexer import RegexLexer
+from src.lexer.token_stream import tokenize, TokenView
+from src.lexer.token_type import TokenType
+from src.parser import Parser
+from src.source import StringSource
+from src.tests import test_parser_with_lexer
+from src.tests.test_regex_lexer import EXAMPLES_DIR, collect_tokens
+
+
+def setup_stream_parser(text: str) -> Parser:
+    stream = tokenize(LexerSkippingComments(source=StringSource(string=text)))
+    return Parser(lexer=stream.cursor())
+
+
+class TokenStreamTests(unittest.TestCase):
+
+    @parameterized.expand([(path.name,) for path in sorted(EXAMPLES_DIR.glob("*.ty"))])
+    def test_examples_same_tokens(self, file_name: str):
+        text = (EXAMPLES_DIR / file_name).read_text()
+        expected = collect_tokens(Lexer(StringSource(text)))
+
+        for lexer_class in [Lexer, RegexLexer]:
+            stream = tokenize(lexer_class(StringSource(text)))
+            self.assertEqual(collect_tokens(stream.cursor()), expected)
+
+    def test_stream_arrays(self):
+        stream = tokenize(Lexer(StringSource('let ab = "c";')))
+
+        self.assertEqual(len(stream), 6)
+        self.assertEqual(stream.kinds.typecode, 'B')
+        self.assertEqual(list(stream.starts), [0, 4, 7, 9, 12, 12])
+        self.assertEqual(list(stream.ends), [3, 6, 8, 12, 12, 12])
+        # only tokens with values are stored in a side table
+        self.assertEqual(stream.values, {1: "ab", 3: "c"})
+
+        token = stream[1]
+        self.assertIsInstance(token, TokenView)
+        self.assertEqual((token.type, token.value, str(token.position)), (TokenType.ID, "ab", "Line:1 Column:5 Pos:4"))
+        self.assertEqual(stream[0].value, None)
+
+        with self.assertRaises(IndexError):
+            _ = stream[6]
+
+    def test_cursor_stays_at_etx(self):
+        cursor = tokenize(Lexer(StringSource("a"))).cursor()
+
+        self.assertEqual(cursor.build_next_token().type, TokenType.ID)
+        self.assertEqual(cursor.build_next_token().type, TokenType.ETX)
+        self.assertEqual(cursor.build_next_token().type, TokenType.ETX)
+
+    def test_error_is_raised_when_reached(self):
+        stream = tokenize(Lexer(StringSource("a b ?")))
+        self.assertEqual(len(stream), 2)
+        self.assertIsInstance(stream.error, LexerError)
+
+        cursor = stream.cursor()
+        cursor.build_next_token()
+        cursor.build_next_token()
+
+        with self.assertRaises(LexerError):
+            cursor.build_next_token()
+
+
+class TokenStreamParserMixin:
+    """Runs parser tests with parser reading tokens from a token stream."""
+
+    def setUp(self):
+        patcher = patch.object(test_parser_with_lexer, 'setup_parser', setup_stream_parser)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class DeclarationTests(TokenStreamParserMixin, test_parser_with_lexer.DeclarationTests):
+    pass
+
+
+class AssignmentTests(TokenStreamParserMixin, test_parser_with_lexer.AssignmentTests):
+    pass
+
+
+class FuncCallTests(TokenStreamParserMixin, test_parser_with_lexer.FuncCallTests):
+    pass
+
+
+class WhileLoopTests(TokenStreamParserMixin, test_parser_with_lexer.WhileLoopTests):
+    pass
+
+
+class IfStatementTests(TokenStreamParserMixin, test_parser_with_lexer.IfStatementTests):
+    pass
+
+
+class FuncDefTests(TokenStreamParserMixin, test_parser_with_lexer.FuncDefTests):
+    pass
+
+
+class LambdaTests(TokenStreamParserMixin, test_parser_with_lexer.LambdaTests):
+    pass
+
+
+class ReturnStatementTests(TokenStreamParserMixin, test_parser_with_lexer.ReturnStatementTests):
+    pass
+
+
+class ExpressionsTests(TokenStreamParserMixin, test_parser_with_lexer.ExpressionsTests):
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import pickle
+import unittest
+
+from parameterized import parameterized
+
+from src.parser.objects.objects import Identifier, Parameter
+from src.parser.types import Integer, Float, Bool, String, Null, Void, Func, INTEGER, NULL, VOID
+
+
+class PrimitiveTypesTests(unittest.TestCase):
+
+    @parameterized.expand([(Integer,), (Float,), (Bool,), (String,), (Null,), (Void,)])
+    def test_primitive_type_is_singleton(self, typ):
+        self.assertIs(typ(), typ())
+        self.assertEqual(typ(), typ())
+
+    @parameterized.expand([(Integer,), (Float,), (Bool,), (String,), (Null,), (Void,)])
+    def test_unpickled_type_is_singleton(self, typ):
+        self.assertIs(pickle.loads(pickle.dumps(typ())), typ())
+
+    def test_different_types_are_not_equal(self):
+        self.assertNotEqual(Integer(), Float())
+        self.assertNotEqual(Bool(), Null())
+        self.assertNotEqual(INTEGER, "Integer")
+
+    def test_null_equals_void(self):
+        self.assertEqual(NULL, VOID)
+        self.assertEqual(VOID, NULL)
+        self.assertEqual(hash(NULL), hash(VOID))
+
+    def test_types_can_key_dicts(self):
+        table = {INTEGER: "int", NULL: "null"}
+
+        self.assertEqual(table[Integer()], "int")
+        self.assertEqual(table[Void()], "null")
+
+
+def func(*types, returns=INTEGER) -> Func:
+    return Func([Parameter(chr(97 + i), typ) for i, typ in enumerate(types)], returns)
+
+
+class FuncTypesTests(unittest.TestCase):
+
+    def test_identical_signatures_share_canonical_signature(self):
+        self.assertIs(func(INTEGER, Float()).signature, func(INTEGER, Float()).signature)
+        self.assertEqual(func(INTEGER, Float()), func(INTEGER, Float()))
+        self.assertEqual(hash(func(INTEGER, Float())), hash(func(INTEGER, Float())))
+
+    def test_parameter_names_do_not_matter(self):
+        self.assertEqual(func(INTEGER), Func([Parameter('x', INTEGER)], INTEGER))
+
+    @parameterized.expand([
+        (func(INTEGER), func(Float())),
+        (func(INTEGER), func(INTEGER, INTEGER)),
+        (func(INTEGER), func(INTEGER, returns=Float())),
+        (func(returns=func(INTEGER)), func(returns=func(Float()))),
+    ])
+    def test_different_signatures_are_not_equal(self, first, second):
+        self.assertNotEqual(first, second)
+
+    def test_nested_signatures(self):
+        self.assertEqual(func(func(INTEGER), returns=func()), func(func(INTEGER), returns=func()))
+
+    def test_null_return_equals_void_return(self):
+        self.assertEqual(func(returns=NULL), func(returns=VOID))
+
+    def test_func_is_not_equal_to_other_types(self):
+        self.assertNotEqual(func(), INTEGER)
+        self.assertNotEqual(INTEGER, func())
+
+    @parameterized.expand([
+        (func(), "Func(() => Integer)"),
+        (func(INTEGER, Float(), returns=VOID), "Func((Integer, Float) => Void)"),
+        (func(func(INTEGER), returns=func()), "Func((Func((Integer) => Integer)) => Func(() => Integer))"),
+        (Func([Parameter('a', String()), Identifier('b')], NULL), "Func((String, Generic) => Null)"),
+    ])
+    def test_func_renders_signature(self, typ, expected):
+        self.assertEqual(str(typ), expected)
+        self.assertEqual(repr(typ), expected)
+
+    def test_unpickled_func_is_equal(self):
+        typ = func(INTEGER, func(Float()))
+
+        self.assertEqual(pickle.loads(pickle.dumps(typ)), typ)
@@ -9,21 +9,21 @@ from src.parser import Parser
 from src.source import StringSource
 
 
-def setup_lexer(text: str) -> Lexer:
+def setup_lexer(text: str, lexer_class: type[Lexer] = Lexer) -> Lexer:
     source = StringSource(string=text)
-    lexer = Lexer(source=source)
+    lexer = lexer_class(source=source)
     return lexer
 
 
-def setup_parser(text: str) -> Parser:
+def setup_parser(text: str, flatten: bool = False) -> Parser:
     source = StringSource(string=text)
     lexer = LexerSkippingComments(source=source)
-    parser = Parser(lexer=lexer)
+    parser = Parser(lexer=lexer, flatten=flatten)
     return parser
 
 
-def setup_interpreter(text: str) -> Interpreter:
-    parser = setup_parser(text=text)
+def setup_interpreter(text: str, flatten: bool = False) -> Interpreter:
+    parser = setup_parser(text=text, flatten=flatten)
     interpreter = Interpreter(parser=parser)
     return interpreter
 